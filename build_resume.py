@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
+import hashlib
 import json
 import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import sys
 
@@ -8,29 +12,57 @@ import sys
 BASE_DIR = Path(__file__).resolve().parent
 INPUT_JSON = BASE_DIR / "data" / "json" / "master_resume_data.json"
 OUTPUT_DIR = BASE_DIR / "output" / "resumes"
-MASTER_VARIANT = "CMS-DS-PDM-01" 
+MASTER_VARIANT = "CMS-DS-PDM-01"
+BUILD_MANIFEST = OUTPUT_DIR / ".build_manifest.json"
+RENDER_VERSION = "1"  # Bump when render_resume() output changes: invalidates every manifest entry
 
-def get_variant_content(slot, target_role):
-    # 1. Exact Match
+# ==========================================
+# VARIANT INDEX
+# ==========================================
+def compile_slot(slot):
+    """
+    slot -> (variant_type → content, master fallback), resolved once.
+    The first variant of each type wins, as in a linear scan.
+    """
+    table = {}
     for v in slot['variants']:
-        if v['type'] == target_role:
-            return v['content']
-    # 2. Master Fallback
-    if target_role != MASTER_VARIANT:
-        for v in slot['variants']:
-            if v['type'] == MASTER_VARIANT:
-                return v['content']
-    return None
-
-def build_resume(target_role):
+        table.setdefault(v['type'], v['content'])
+    return table, table.get(MASTER_VARIANT)
+
+def compile_resume(data):
+    """
+    Golden record -> variant index: every slot compiled once, so each
+    variant built from it is a constant-time lookup per slot.
+    """
+    return {
+        'work_history': [(job, [compile_slot(slot) for slot in job['slots']])
+                         for job in data['work_history']],
+        'skills': [(slot.get('header'), compile_slot(slot)) for slot in data.get('skills') or []],
+        'shared_hash': _shared_inputs_hash(data),
+    }
+
+def lookup_variant(compiled_slot, target_role):
+    # 1. Exact Match, 2. Master Fallback
+    table, fallback = compiled_slot
+    return table.get(target_role, fallback)
+
+def get_variant_content(slot, target_role):
+    """One-off lookup on a raw slot (compile_resume() for whole builds)."""
+    return lookup_variant(compile_slot(slot), target_role)
+
+def load_resume_data():
+    """Loads the golden record (exits if ingestion hasn't been run)."""
     if not INPUT_JSON.exists():
         print(f"❌ ERROR: Data file not found. Run 'python3 scripts/ingest_resume.py' first.")
         sys.exit(1)
 
-    print(f"🏭 SUGARTOWN FACTORY: Building Resume for target '{target_role}'")
-    
     with open(INPUT_JSON, 'r') as f:
-        data = json.load(f)
+        return json.load(f)
+
+def render_resume(data, target_role, index=None):
+    """Golden record + variant ID -> resume Markdown. Pass compile_resume(data) when building many."""
+    if index is None:
+        index = compile_resume(data)
 
     # --- 1. HEADER (The Screencap Match) ---
     basics = data['basics']
@@ -46,28 +78,28 @@ def build_resume(target_role):
     # Filter out empty strings/NaNs
     contact_line = " | ".join([str(c) for c in contact_info if c and str(c) != 'nan'])
     md += f"{contact_line}\n\n"
-    
+
     # --- 2. DYNAMIC SUMMARY (Role Title + Summary) ---
     # Look for metadata specific to this Variant (e.g. CMS-DS-PDM-01)
     # If not found, fall back to Master variant metadata
     summary_meta = data['variant_summaries'].get(target_role)
     if not summary_meta:
         summary_meta = data['variant_summaries'].get(MASTER_VARIANT)
-        
+
     if summary_meta:
         md += f"## {summary_meta['title']}\n\n"
         md += f"{summary_meta['summary']}\n\n"
         md += "---\n\n" # Separator
-    
+
     # --- 3. EXPERIENCE ---
     md += "## EXPERIENCE\n\n"
-    for job in data['work_history']:
+    for job, slots in index['work_history']:
         job_content = ""
-        for slot in job['slots']:
-            content = get_variant_content(slot, target_role)
+        for slot in slots:
+            content = lookup_variant(slot, target_role)
             if content:
                 job_content += f"- {content}\n"
-        
+
         if job_content:
             md += f"### {job['company']} — {job['role']}\n"
             md += f"*{job['dates']} | {job['location']}*\n\n"
@@ -84,25 +116,164 @@ def build_resume(target_role):
     # --- 5. SKILLS ---
     if data.get('skills'):
         md += "## SKILLS\n\n"
-        for slot in data['skills']:
-            content = get_variant_content(slot, target_role)
+        for header, slot in index['skills']:
+            content = lookup_variant(slot, target_role)
             if content:
-                if slot.get('header'):
-                    md += f"**{slot['header']}**: "
+                if header:
+                    md += f"**{header}**: "
                 md += f"{content}\n\n"
+    return md
+
+# ==========================================
+# BUILD MANIFEST (incremental builds)
+# ==========================================
+def _hash_json(value):
+    return hashlib.md5(json.dumps(value, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def _shared_inputs_hash(data):
+    """Everything every variant renders regardless of role: basics, job headers, education, skill headers."""
+    return _hash_json({
+        'render': RENDER_VERSION,
+        'basics': data['basics'],
+        'jobs': [[job.get(k) for k in ('company', 'role', 'dates', 'location')] for job in data['work_history']],
+        'education': data.get('education'),
+        'skills': [slot.get('header') for slot in data.get('skills') or []],
+    })
+
+def variant_inputs_hash(data, index, target_role):
+    """
+    Hash of exactly what render_resume() reads for this variant: the shared
+    inputs, its (resolved) summary and the content each slot resolves to.
+    Edits to other variants' bullets leave it unchanged.
+    """
+    summary_meta = data['variant_summaries'].get(target_role) or data['variant_summaries'].get(MASTER_VARIANT)
+    resolved = [[lookup_variant(slot, target_role) for slot in slots] for _, slots in index['work_history']]
+    resolved.append([lookup_variant(slot, target_role) for _, slot in index['skills']])
+    return _hash_json([index['shared_hash'], summary_meta, resolved])
+
+def load_manifest():
+    try:
+        with open(BUILD_MANIFEST, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('variants', {}) if isinstance(manifest, dict) else {}
+
+def save_manifest(variants):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = BUILD_MANIFEST.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'variants': variants}, f, indent=2, sort_keys=True)
+    os.replace(tmp, BUILD_MANIFEST)
 
-    # Save Output
+def is_up_to_date(manifest, target_role, inputs_hash):
+    """Unchanged inputs and the artifact still on disk."""
+    return manifest.get(target_role) == inputs_hash and resume_path(target_role).exists()
+
+def resume_path(target_role):
+    return OUTPUT_DIR / f"Resume_{target_role}.md"
+
+def write_resume(target_role, md):
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    filename = OUTPUT_DIR / f"Resume_{target_role}.md"
-    
+    filename = resume_path(target_role)
+
     with open(filename, 'w') as f:
         f.write(md)
-    
+    return filename
+
+def build_resume(target_role, data=None, force=False):
+    if data is None:
+        data = load_resume_data()
+
+    print(f"🏭 SUGARTOWN FACTORY: Building Resume for target '{target_role}'")
+    index = compile_resume(data)
+    manifest = load_manifest()
+    inputs_hash = variant_inputs_hash(data, index, target_role)
+    if not force and is_up_to_date(manifest, target_role, inputs_hash):
+        print(f"♻️  CACHE HIT: {resume_path(target_role)} (inputs unchanged)")
+        return
+
+    filename = write_resume(target_role, render_resume(data, target_role, index))
+    manifest[target_role] = inputs_hash
+    save_manifest(manifest)
     print(f"✅ ARTIFACT CREATED: {filename}")
 
+# ==========================================
+# BUILD ALL VARIANTS
+# ==========================================
+_worker_data = None
+_worker_index = None
+
+def _init_worker(data, index):
+    # Each pool process receives the golden record (and its index) once, not once per variant
+    global _worker_data, _worker_index
+    _worker_data, _worker_index = data, index
+
+def _build_variant(target_role):
+    """Pool task: render + write one variant. Returns (role, filename, seconds)."""
+    start = time.perf_counter()
+    filename = write_resume(target_role, render_resume(_worker_data, target_role, _worker_index))
+    return target_role, filename, time.perf_counter() - start
+
+def build_all(workers=None, force=False):
+    """
+    Builds every variant in variant_summaries from a single load of the
+    golden record, rendering variants in parallel across a process pool.
+    Variants whose inputs match the build manifest are skipped (cache hits).
+    """
+    start = time.perf_counter()
+    data = load_resume_data()
+    roles = list(data['variant_summaries'])
+    if not roles:
+        print("⚠️  No variants found in variant_summaries.")
+        return {}
+    index = compile_resume(data)
+    manifest = load_manifest()
+
+    hashes = {role: variant_inputs_hash(data, index, role) for role in roles}
+    stale = [role for role in roles if force or not is_up_to_date(manifest, role, hashes[role])]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(stale)))
+
+    print(f"🏭 SUGARTOWN FACTORY: Building {len(stale)} of {len(roles)} variants ({workers} workers)")
+    for role in roles:
+        if role not in stale:
+            print(f"   ♻️  {role:<22} cache hit")
+    results = {}
+
+    def report(role, filename, seconds):
+        results[role] = (filename, seconds)
+        manifest[role] = hashes[role]
+        print(f"   ✅ {role:<22} {seconds * 1000:7.1f} ms  → {filename.name}")
+
+    if workers == 1:
+        # No pool to pay for: render in this process
+        _init_worker(data, index)
+        for role in stale:
+            report(*_build_variant(role))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data, index)) as pool:
+            futures = [pool.submit(_build_variant, role) for role in stale]
+            for future in as_completed(futures):
+                report(*future.result())
+
+    if results:
+        save_manifest(manifest)
+
+    total = time.perf_counter() - start
+    busy = sum(seconds for _, seconds in results.values())
+    print(f"⏱️  {len(results)} built, {len(roles) - len(results)} cached in {total:.2f}s wall ({busy:.2f}s rendering)")
+    print(f"✅ ARTIFACTS CREATED in {OUTPUT_DIR}")
+    return results
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('--role', type=str, default=MASTER_VARIANT, help='Target Variant ID')
+    parser.add_argument('--all', action='store_true', help='Build every variant in variant_summaries')
+    parser.add_argument('--workers', type=int, default=None, help='Process pool size for --all (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if inputs are unchanged')
     args = parser.parse_args()
-    
-    build_resume(args.role)
\ No newline at end of file
+
+    if args.all:
+        build_all(args.workers, force=args.force)
+    else:
+        build_resume(args.role, force=args.force)
@@ -0,0 +1,188 @@
+"""
+Compiled, memory-mapped snapshot of the gem store (data/gems/snapshot.bin).
+
+content_store builds it from the gem index and maps it on import, so a cold
+start reads one file instead of parsing index.json and opening a file per
+body. It is rebuilt whenever the source signature stored in the header no
+longer matches the gem files on disk.
+
+Layout (little-endian):
+    HEADER          magic, version, source signature, counts, string data size, aux string
+    string slots    string_count × (offset u32, length u32) into string data
+    tag refs        tag_ref_count × u32 string index
+    records         gem_count × RECORD (fixed width)
+    string data     UTF-8, every distinct string once
+    bodies          UTF-8 gem bodies, addressed by (offset, length) per record
+
+Records hold string indexes for the common scalar fields and a slice of the
+tag refs. Each gem's meta dict and any other front matter live in one
+"aux" JSON string ([[meta, extra], ...] in record order) that is parsed
+once. Readers slice the mapping directly; nothing is copied until a string
+is decoded.
+"""
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b'STGEMSNP'
+SNAPSHOT_VERSION = 1  # Bump whenever the layout below changes
+
+HEADER = struct.Struct('<8sHH16sIIIQI')
+SLOT = struct.Struct('<II')
+TAG_REF = struct.Struct('<I')
+# id, file, title, slug, status, category, tags_start, tags_count,
+# body_offset, body_length, content_hash
+RECORD = struct.Struct('<qIIIIIIIQQ16s')
+
+NONE = 0xFFFFFFFF  # Absent string / absent tag list
+NO_ID = -1
+STRING_COLUMNS = ('title', 'slug', 'status', 'category')
+
+
+# ==========================================
+# BUILD
+# ==========================================
+def build(path, source_signature, entries, read_body):
+    """
+    Writes a snapshot of `entries` (content_store index entries, in order)
+    atomically to `path`. read_body(file_name) returns a gem's body text.
+    """
+    slots, strings, string_data = [], {}, bytearray()
+
+    def intern(s):
+        idx = strings.get(s)
+        if idx is None:
+            data = s.encode('utf-8')
+            idx = strings[s] = len(slots)
+            slots.append((len(string_data), len(data)))
+            string_data.extend(data)
+        return idx
+
+    tag_refs, records, aux, bodies = [], [], [], bytearray()
+    for entry in entries:
+        fields = dict(entry['fields'])
+
+        gem_id = fields.get('id')
+        if isinstance(gem_id, int) and not isinstance(gem_id, bool) and gem_id >= 0:
+            del fields['id']
+        else:
+            gem_id = NO_ID  # Missing or odd-typed: kept verbatim in extra
+
+        columns = []
+        for key in STRING_COLUMNS:
+            value = fields.get(key)
+            columns.append(intern(fields.pop(key)) if isinstance(value, str) else NONE)
+
+        tags = fields.get('tags')
+        if isinstance(tags, list) and all(isinstance(t, str) for t in tags):
+            del fields['tags']
+            tags_start, tags_count = len(tag_refs), len(tags)
+            tag_refs.extend(intern(t) for t in tags)
+        else:
+            tags_start, tags_count = NONE, 0
+
+        meta = fields.pop('meta') if 'meta' in fields else None
+        aux.append([meta, fields or None])
+
+        body = read_body(entry['file']).encode('utf-8')
+        records.append(RECORD.pack(
+            gem_id, intern(entry['file']), *columns, tags_start, tags_count,
+            len(bodies), len(body), bytes.fromhex(entry['content_hash'])))
+        bodies.extend(body)
+    aux_idx = intern(json.dumps(aux, ensure_ascii=False))
+
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, SNAPSHOT_VERSION, 0, source_signature,
+                            len(records), len(slots), len(tag_refs), len(string_data), aux_idx))
+        f.writelines(SLOT.pack(*slot) for slot in slots)
+        f.writelines(TAG_REF.pack(ref) for ref in tag_refs)
+        f.writelines(records)
+        f.write(string_data)
+        f.write(bodies)
+    os.replace(tmp, path)
+
+
+# ==========================================
+# READ
+# ==========================================
+class Snapshot:
+    """
+    Read-only view over a mapped snapshot. Raises ValueError (or struct.error
+    on a truncated file) if the file is not a current-version snapshot.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        self._decoded = {}  # String index -> str: tags/categories repeat across gems
+        self._aux = None
+
+        (magic, version, _, self.source_signature, self.gem_count,
+         string_count, tag_ref_count, string_data_size, self._aux_idx) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path}: not a v{SNAPSHOT_VERSION} gem snapshot")
+
+        pos = HEADER.size
+        self._slots_at = pos
+        pos += string_count * SLOT.size
+        self._tags_at = pos
+        pos += tag_ref_count * TAG_REF.size
+        self._records_at = pos
+        pos += self.gem_count * RECORD.size
+        self._strings_at = pos
+        self._bodies_at = pos + string_data_size
+        if len(self._mm) < self._bodies_at:
+            raise ValueError(f"{path}: truncated snapshot")
+
+    def __len__(self):
+        return self.gem_count
+
+    def string(self, idx):
+        if idx == NONE:
+            return None
+        s = self._decoded.get(idx)
+        if s is None:
+            offset, length = SLOT.unpack_from(self._mm, self._slots_at + idx * SLOT.size)
+            start = self._strings_at + offset
+            s = self._decoded[idx] = str(self._view[start:start + length], 'utf-8')
+        return s
+
+    def _record(self, i):
+        if not 0 <= i < self.gem_count:
+            raise IndexError(i)
+        return RECORD.unpack_from(self._mm, self._records_at + i * RECORD.size)
+
+    def entry(self, i):
+        """Record i -> (file name, front matter dict, content hash hex). Body not touched."""
+        (gem_id, file_idx, title, slug, status, category,
+         tags_start, tags_count, _, _, content_hash) = self._record(i)
+        if self._aux is None:
+            self._aux = json.loads(self.string(self._aux_idx))
+        meta, extra = self._aux[i]
+
+        fields = {}
+        if gem_id != NO_ID:
+            fields['id'] = gem_id
+        for key, idx in zip(STRING_COLUMNS, (title, slug, status, category)):
+            if idx != NONE:
+                fields[key] = self.string(idx)
+        if tags_start != NONE:
+            refs = struct.unpack_from(f'<{tags_count}I', self._mm, self._tags_at + tags_start * TAG_REF.size)
+            fields['tags'] = [self.string(ref) for ref in refs]
+        if meta is not None:
+            fields['meta'] = meta
+        if extra:
+            fields.update(extra)
+        return self.string(file_idx), fields, content_hash.hex()
+
+    def body_view(self, i):
+        """Zero-copy memoryview of gem i's UTF-8 body."""
+        offset, length = self._record(i)[8:10]
+        start = self._bodies_at + offset
+        return self._view[start:start + length]
+
+    def body(self, i):
+        return str(self.body_view(i), 'utf-8')
@@ -1,9 +1,110 @@
+"""
+Sugartown content store: the source of truth for Gems and Projects.
+
+Layout:
+    data/gems/NNN-<slug>.html   One gem per file: JSON front matter, then the HTML body
+    data/gems/index.json        Manifest (generated, not in Git): front matter + content hash per file
+    data/gems/snapshot.bin      Compiled mmap snapshot (generated, not in Git; see content_snapshot)
+    data/json/projects.json     Project hubs
+
+Gem file format:
+    ---
+    { "id": 946, "title": "...", "status": "publish", "category": "...", "tags": [...], "meta": {...} }
+    ---
+    <p>Body HTML, verbatim…</p>
+
+A gem whose body is generated sets "content_provider" (see CONTENT_PROVIDERS)
+and leaves the body empty.
+
+`all_gems` and `projects` keep their old shape. Gems are built from the
+snapshot (falling back to the index); a body is decoded the first time
+gem['content'] is accessed. Run `python3 content_store.py` to rebuild the
+snapshot by hand; normally it rebuilds itself when a gem file changes.
+"""
+import functools
+import hashlib
+import json
+import operator
 import os
-import markdown  # <--- NEW IMPORT
+import re
+import struct
+import threading
+from collections.abc import MutableMapping
+
+import content_snapshot
+import render_cache
+
+# ==========================================
+# CONFIGURATION
+# ==========================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GEMS_DIR = os.path.join(BASE_DIR, "data", "gems")
+INDEX_FILE = os.path.join(GEMS_DIR, "index.json")
+SNAPSHOT_FILE = os.path.join(GEMS_DIR, "snapshot.bin")
+PROJECTS_FILE = os.path.join(BASE_DIR, "data", "json", "projects.json")
+GEM_FILE_EXT = ".html"
+FRONT_MATTER_DELIM = "---"
+INDEX_VERSION = 1  # Bump when the index entry shape changes
+
+CHANGELOG_FILE = "CHANGELOG.md"
+CHANGELOG_EXTENSIONS = ('tables', 'fenced_code', 'nl2br')
+CHANGELOG_RENDER_VERSION = "1"  # Bump to invalidate cached changelog sections (e.g. markdown upgrade)
 
 # ==========================================
 # 0. TAXONOMY NORMALIZATION (v4) - RESTORED
 # ==========================================
+# Pick primary category (most specific wins): lower rank = more topical
+CATEGORY_PRIORITY = (
+    'Engineering & DX',
+    'AI & Automation',
+    'Design Systems',
+    'Product Ops',
+    'Process Insight',
+    'Content Architecture',
+    'Documentation',
+    'Ways of Working',
+    'Product & Platform Strategy',
+    'Governance',
+    'Meta',
+)
+CATEGORY_RANK = {cat: rank for rank, cat in enumerate(CATEGORY_PRIORITY)}
+_UNRANKED = len(CATEGORY_PRIORITY)
+
+@functools.lru_cache(maxsize=None)
+def category_slug(category):
+    """'Product & Platform Strategy' -> 'product-platform-strategy' (secondary categories become tags)."""
+    return category.lower().replace(' & ', '-').replace(' ', '-')
+
+def _category_rank(category):
+    return CATEGORY_RANK.get(category, _UNRANKED) if isinstance(category, str) else _UNRANKED
+
+def _split_categories(categories):
+    """categories -> (primary, secondary slugs)."""
+    # min() keeps the first of equal ranks: unranked-only lists fall back to categories[0]
+    primary = min(categories, key=_category_rank) if categories else None
+    return primary, [category_slug(c) for c in categories if c != primary]
+
+# Category combinations repeat across a store far more than tags do
+_split_categories_cached = functools.lru_cache(maxsize=4096)(_split_categories)
+
+def _gem_categories(gem):
+    # Handle legacy plural 'categories' or new singular 'category'
+    if 'categories' in gem:
+        return gem['categories'] if isinstance(gem['categories'], list) else [gem['categories']]
+    if 'category' in gem:
+        return [gem['category']]
+    return []
+
+def _normalize(categories, tags):
+    try:
+        primary, extra_tags = _split_categories_cached(tuple(categories))
+    except TypeError:  # Unhashable category value: skip the cache
+        primary, extra_tags = _split_categories(categories)
+    return {
+        'category': primary,
+        'tags': tags + extra_tags
+    }
+
 def normalize_taxonomy(gem):
     """
     Enforce single category + push extras to tags.
@@ -17,3233 +118,492 @@ def normalize_taxonomy(gem):
         Input:  {'categories': ['Engineering & DX', 'Product Strategy'], 'tags': ['ai']}
         Output: {'category': 'Engineering & DX', 'tags': ['ai', 'product-strategy']}
     """
-    # Handle legacy plural 'categories' or new singular 'category'
-    if 'categories' in gem:
-        categories = gem['categories'] if isinstance(gem['categories'], list) else [gem['categories']]
-    elif 'category' in gem:
-        categories = [gem['category']]
-    else:
-        categories = []
-    
-    tags = gem.get('tags', [])
-    
-    # Pick primary category (most specific wins)
-    priority = [
-        'Engineering & DX',
-        'AI & Automation',
-        'Design Systems',
-        'Product Ops',
-        'Process Insight',
-        'Content Architecture',
-        'Documentation',
-        'Ways of Working',
-        'Product & Platform Strategy',
-        'Governance',
-        'Meta'
-    ]
-    
-    primary = None
-    for cat in priority:
-        if cat in categories:
-            primary = cat
-            break
-    
-    if not primary and categories:
-        primary = categories[0]  # Fallback to first
-    
-    # Push secondary categories to tags (slugified)
-    secondary = [c for c in categories if c != primary]
-    extra_tags = []
-    for cat in secondary:
-        slug = cat.lower().replace(' & ', '-').replace(' ', '-')
-        extra_tags.append(slug)
-    
-    return {
-        'category': primary,
-        'tags': tags + extra_tags
-    }
+    return _normalize(_gem_categories(gem), gem.get('tags', []))
 
-# ==========================================
-# 1. DYNAMIC CONTENT LOADERS
-# ==========================================
-def get_changelog_content():
+def normalize_taxonomy_bulk(gems):
     """
-    Reads local CHANGELOG.md and converts it to HTML for WordPress.
+    normalize_taxonomy over a whole collection in one pass (shared rank map
+    and slug cache). Returns (normalized, changes):
+        normalized  [{'category', 'tags'}, ...] in input order
+        changes     [{'index', 'title', 'category': (before, after), 'tags_added'}, ...]
+                    for gems whose stored taxonomy differs from the normalized one
     """
-    try:
-        with open("CHANGELOG.md", "r", encoding="utf-8") as f:
-            md_text = f.read()
-            
-            # âœ¨ CONVERSION STEP
-            # We enable 'extra' (for tables/attr_list) and 'codehilite' if needed
-            html_content = markdown.markdown(
-                md_text, 
-                extensions=['tables', 'fenced_code', 'nl2br']
-            )
-            
-            return f'<div class="changelog-wrapper">{html_content}</div>'
-            
-    except FileNotFoundError:
-        return "<p><em>Changelog file not found. Please create CHANGELOG.md.</em></p>"
+    normalized, changes = [], []
+    split_cached = _split_categories_cached
+    for index, gem in enumerate(gems):
+        categories = _gem_categories(gem)
+        try:
+            primary, extra_tags = split_cached(tuple(categories))
+        except TypeError:
+            primary, extra_tags = _split_categories(categories)
+        tags = gem.get('tags', [])
+        normalized.append({'category': primary, 'tags': tags + extra_tags})
+
+        # Tags only change by gaining secondary categories
+        if extra_tags or 'categories' in gem or gem.get('category') != primary:
+            changes.append({
+                'index': index,
+                'title': gem.get('title'),
+                'category': (gem.get('categories', gem.get('category')), primary),
+                'tags_added': list(extra_tags),
+            })
+    return normalized, changes
 
 # ==========================================
-# 2. PROJECT DEFINITIONS (The "Hubs")
+# 1. LAZY GEM RECORDS
 # ==========================================
-projects = {
-    # --- PROJ-001: The Core Platform ---
-    'PROJ-001': {
-        'id': 'PROJ-001',
-        'name': 'Sugartown CMS',
-        'description': 'The core Python-to-WordPress publishing engine. Replaces legacy PHP themes with a content-as-code architecture.',
-        'status': 'Live',
-        'priority': 'Critical',
-        'tags': ['python', 'wordpress api', 'headless', 'content ops'],
-        'kpis': ['Deployment Time < 5s', 'Zero PHP Logic in Theme']
-    },
-
-    # --- PROJ-002: The Career Engine ---
-    'PROJ-002': {
-        'id': 'PROJ-002',
-        'name': 'The Resume Factory',
-        'description': 'Automated CV generation system that renders tailored resumes from a single JSON source of truth.',
-        'status': 'Live',
-        'priority': 'High',
-        'tags': ['json', 'jinja2', 'pdf generation', 'career data'],
-        'kpis': ['Resume Rendering', 'Keyword Optimization']
-    },
-
-    # --- PROJ-003: The Visual Language ---
-    'PROJ-003': {
-        'id': 'PROJ-003',
-        'name': 'Sugartown-Pink Design System',
-        'description': 'A strict, utility-first CSS framework enforcing the Sugartown Pink palette and atomic component hierarchy.',
-        'status': 'Iterating',
-        'priority': 'Medium',
-        'tags': ['css', 'design tokens', 'atomic design', 'accessibility'],
-        'kpis': ['100% Brand Consistency', 'Light Mode Default']
-    },
-
-    # --- PROJ-004: The New Visualization Layer ---
-    'PROJ-004': {
-        'id': 'PROJ-004',
-        'name': 'Knowledge Graph Viz Engine',
-        'description': 'A suite of Python scripts transforming static content data into dynamic, "Sugartown Pink" styled visual artifacts.',
-        'status': 'Active',
-        'priority': 'High',
-        'tags': ['python', 'data-viz', 'matplotlib', 'networkx', 'automation', 'mermaid'],
-        'kpis': ['Zero-Touch Updates', 'Automated Build Pipeline']
-    }
-}
+_LAZY_LOCK = threading.RLock()  # Providers run once, even under publish --workers
 
-# All Gems. 
-# Script Logic: New titles = Draft. Existing titles = Publish (Auto-Update).
+class lazy:
+    """Marks a gem field whose value is computed on first read (e.g. a markdown body)."""
+    __slots__ = ('provider',)
 
-all_gems = [
-    # --- GEM 00: SYSTEM CHANGELOG (Auto-Synced) ---
-    {
-            'id': 1447, # Stable ID for the Changelog
-            'title': 'System Changelog',
-            'slug': 'changelog',
-            'status': 'publish',
-            'category': 'Governance',  # ← SINGLE category
-            'tags': ['gemini', 'release notes', 'documentation', 'version control', 'system', 'meta', 'changelog'],  # ← 'System' and 'Meta' pushed to tags
-            'content': get_changelog_content(), # <--- DYNAMIC IMPORT
-            'meta': {
-                'gem_status': 'Final',
-                'gem_related_project': 'PROJ-001',
-                'gem_action_item': 'Review latest release notes'
-            }
-        },
-
-
-
- # GEM 1: The Hero Story (Architecture)
-{
-    'id': 946,
-    'title': 'Project: Sugartown CMS Architecture',
-    'status': 'publish',
-    'category': 'Engineering & DX',
-    'tags': [
-        'gemini',
-        'headless cms',
-        'content modeling',
-        'structured content',
-        'knowledge graph',
-        'sugartown',
-        'python',
-        'system',
-        'system architecture'
-    ],
-    'content': """
-    <p>This project began with a simple request: <em>"Write a blog post about Gemini 3."</em> It escalated into a full-stack systems exercise because, as a Product Manager, I fundamentally reject unstructured data.</p>
-
-    <h3>The Challenge: Breaking the Blob</h3>
-    <p>Traditional CMS platforms treat knowledge as a blob—title, body, timestamp—buried in a chronological feed. That model works for publishing, but it fails for thinking.</p>
-    <p>I wanted a <strong>Knowledge Graph</strong>: a system where insights are treated as atomic nodes that can be queried, filtered, and recombined across contexts.</p>
-
-    <h3>The Architectural Approach</h3>
-    <p>The solution was a deliberately hybrid system:</p>
-    <ul>
-        <li><strong>Python as Source of Truth</strong> for structure, taxonomy, and publishing logic</li>
-        <li><strong>WordPress as Rendering Layer</strong>, not authoring environment</li>
-        <li><strong>Gems</strong> as a custom post type optimized for topology over chronology</li>
-    </ul>
-
-    <figure class="wp-block-table is-style-stripes has-small-font-size">
-      <table class="st-table">
-          <colgroup>
-            <col class="st-col--md">  
-            <col class="st-col--lg">  
-            <col> 
-          </colgroup>
-        <thead>
-            <tr><th>Decision Point</th><th>Tension</th><th>Resolution</th></tr>
-        </thead>
-        <tbody>
-            <tr>
-                <td><strong>Content Model</strong></td>
-                <td>Blog posts decay over time</td>
-                <td><strong>Topology over Chronology</strong>: Gems sorted by topic, not date</td>
-            </tr>
-            <tr>
-                <td><strong>Source Control</strong></td>
-                <td>Manual WP edits vs. script overwrites</td>
-                <td><strong>Hybrid Ownership</strong>: Scripts own structure; humans own polish</td>
-            </tr>
-            <tr>
-                <td><strong>Taxonomy</strong></td>
-                <td>Category sprawl and duplication</td>
-                <td><strong>Single Category + Tags</strong>: normalized, predictable querying</td>
-            </tr>
-            <tr>
-                <td><strong>Presentation</strong></td>
-                <td>Blog-centric templates leaking meta</td>
-                <td><strong>Headless Templating</strong>: custom archives and stripped bylines</td>
-            </tr>
-        </tbody>
-    </table>
-    <figcaption>Architectural Decision Log (abridged)</figcaption>
-    </figure>
-
-    <h3>The Outcome</h3>
-    <p>The system now behaves like a living product. I can refactor the entire portfolio by changing a single Python file. The green checkmark in the terminal has become my favorite UI.</p>
-
-    <p>Equally important: the architecture now supports narrative. The Knowledge Graph is no longer a curiosity—it is the organizing principle of the site.</p>
-
-    <p><strong>Next:</strong> for how this system continues to evolve.</p>
-    <ul>
-    <li><a href="/sugartown-platform-roadmap/">Platform Roadmap</a> (strategic context)
-    <li><a href="/knowledge-graph-roadmap/">Knowledge Graph Roadmap</a> (subsystem evolution)</li>
-    </ul>
-    """,
-    'meta': {
-        'gem_status': 'Active',
-        'gem_action_item': 'Continue phased platform rollout',
-        'gem_related_project': 'PROJ-001'
-    }
-},
+    def __init__(self, provider):
+        self.provider = provider
 
-    
-        # GEM 2: The CSV Reality Check,
-    {
-            'id': 942,
-            'title': 'Process Insight: The CSV Reality Check',
-            'status': 'publish',
-            'category': 'Engineering & DX',
-            'tags': ['gemini', 'data integrity', 'audit', 'automation', 'product & platform strategy', 'system'],
-            'content': """
-            <p>I just ran my first full audit of the <strong>Sugartown CMS pipeline</strong>, exporting the raw database to a CSV report. The result? A lesson in data integrity.</p>
-            <h3>The "Eyeballs" Theory</h3>
-            <p>When working in the UI, it is easy to miss gaps. But when you flatten the data into a spreadsheet, the holes become obvious. For example, my "Market Scan" gem looked perfect on the frontend, but the CSV revealed it was an orphan in the database (NULL category).</p>
-            <h3>The Annotated Findings</h3>
-            <p>Here is a snippet of the export where I flagged the specific logic errors found in the data:</p>
-            <figure class="wp-block-table is-style-stripes has-small-font-size"><table>
-            <thead><tr><th>ID</th><th>Title</th><th>Category</th><th>Status</th><th>Action Item</th></tr></thead>
-            <tbody>
-            <tr><td>852</td><td>Market Scan: CMS</td><td><em>NULL</em></td><td><em>NULL</em></td><td><em>NULL</em></td></tr>
-            <tr><td>863</td><td>Sweet Upgrades</td><td>AI Strategy</td><td>Done</td><td>Upgrade to Ultra (Wrong!)</td></tr>
-            <tr><td>942</td><td>Process Insight</td><td>Product Ops</td><td>Active</td><td>Schedule Audit</td></tr>
-            </tbody></table><figcaption>Fig 1. The CSV export annotated with audit findings.</figcaption></figure>
-            <p><strong>The Takeaway:</strong> Automation requires observability. A script can push content, but only a human (or a very good audit script) can verify truth.</p>
-            """,
-            'meta': {'gem_status': 'Shipped', 'gem_action_item': 'Schedule Monthly CSV Audit', 'gem_related_project': 'PROJ-001'}
-        },
-    
-        # GEM 3: The Overwrite Problem,
-    {
-            'id': 949,
-            'title': 'Architecture Decision: The "Overwrite" Risk in Sugartown CMS',
-            'status': 'publish',
-            'category': 'Career Engineering' ,
-            'tags': ['gemini', 'headless CMS', 'Python', 'content ops', 'governance models', 'content architecture', 'system'],
-            'content': """
-            
-            <p>I had a realization today while trying to manually edit a post in WordPress: <strong>The Pipeline is a Bully.</strong></p>
-            <p>In a typical "Push" architecture (Python -> WordPress), the script is the Source of Truth. If I manually add a witty joke or a custom image inside the WordPress Editor, the next time I run my Python script, it will blow those changes away because it performs a <code>PUT</code> (Replace) operation, not a <code>PATCH</code> (Merge) operation.</p><h3>The Strategy: Hybrid Content Management</h3>
-            
-            <p>To solve this, I am evaluating two patterns for "Safe Updates":</p>
-            
-            <ol>
-            <li><strong>The "Protected Block" Pattern:</strong> Using HTML comments (e.g., <code>&lt;!-- manual-start --&gt;</code>) to mark zones that the script ignores.</li>
-            <li><strong>The "Read-Merge-Write" Pattern:</strong> The script must first GET the current content, diff it against the new payload, and intelligently merge them before pushing back.</li></ol>
-            <p><strong>Current Verdict:</strong> I have moved this feature to the <strong>Backlog</strong>. For now, the Python script owns the "Structured Data" (Tables, Lists), and I will manually sync content if needed.</p>
-            
-            """,
-            'meta': {'gem_status': 'Backlog', 'gem_action_item': 'Research Python Diff Libraries', 'gem_related_project': 'PROJ-001'}
-        },
-    
-        # GEM 4: Resume Workflow,
-    {
-            'id': 853,
-            'title': 'Engineering the Perfect Resume Workflow',
-            'status': 'publish',
-            'category': 'Engineering & DX',
-            'tags': ['gemini', 'AI-assisted authoring', 'LLM workflows', 'structured content', 'system'],
-            'content': """
-            <p>As a Product Manager, I couldn't just "write" a resume. I had to architect a pipeline. After battling file formats and prompt hallucinations, here is the technical breakdown of my "Resume as Code" workflow.</p>
-            
-            <blockquote><p><strong>Status: Active Prototype.</strong> While I currently manage this via local Python scripts, the roadmap includes migrating this schema to a true Headless CMS (Sanity or WordPress) to fully decouple the content model from the build pipeline.</p></blockquote>
-            
-            <h3>The CI/CD Pipeline</h3>
-            <p>I treat my career history like a software product. It goes through a build process before deployment.</p>
-            <ol><li><strong>Source Control (Main Branch):</strong> The "Master Resume" Google Doc. Never sent, only referenced.</li>
-            <li><strong>Feature Branch (Tailoring):</strong> XML-bounded AI prompts used to "merge" specific skills into the narrative.</li>
-            <li><strong>Build Script (Python):</strong> <code>prep_resume.py</code> handles versioning and file conversion.</li>
-            <li><strong>Deployment (Release):</strong> SEO-optimized PDF sent to the recruiter.</li></ul><h3>The Editorial Experience</h3><p>Before the data hits the database, the "Authoring Experience" is defined by these strict governance rules to ensure quality and consistency.</p>
-           </ol>
-            
-          <table class="st-table">
-          <colgroup>
-            <col class="st-col--sm">  
-            <col class="st-col--md">  
-            <col> 
-          </colgroup>
-            <thead><tr><th>Category</th><th>Insight / Rule</th><th>Context</th></tr></thead><tbody><tr><td><strong>Strategy</strong></td><td><strong>Resume as Code</strong></td><td>Treat your Master Resume as the <code>main</code> branch. Tailored applications are <code>feature</code> branches.</td></tr><tr><td><strong>Automation</strong></td><td><strong>The ".gdoc" Trap</strong></td><td>I learned the hard way that <code>.gdoc</code> files aren't real files. My Python script failed until I added an explicit "Export to PDF" step.</td></tr><tr><td><strong>Taxonomy</strong></td><td><strong>Dual-Naming</strong></td><td><strong>External:</strong> <code>Name_Role.pdf</code> (SEO for ATS).<br><strong>Internal:</strong> <code>Date_Name_Variant.pdf</code> (Version Control).</td></tr><tr><td><strong>AI</strong></td><td><strong>XML Prompting</strong></td><td>I wrap my source text in XML tags (<code>&lt;source&gt;</code>) to stop the AI from hallucinating fake jobs.</td>
-            </tr></tbody>
-            </table>""",
-            'meta': {'gem_status': 'Backlog', 'gem_action_item': 'Refine XML Prompt', 'gem_related_project': 'PROJ-002'}
-        },
-    
-        # GEM 5: Market Scan,
-    {
-            'id': 852,
-            'title': 'Market Scan: Top Headless CMS Platforms (2025)',
-            'status': 'publish',
-            'category': 'Product & Platform Strategy',
-            'tags': ['gemini', 'headless CMS', 'content modeling', 'PIM / PXM', 'content migration', 'market research', 'system'],
-            'content': """
-            <p>As we move into 2026, the Headless CMS market has calcified into three segments: Developer Tools, Marketer Suites, and Visual Composers. Here is the breakdown.</p>
-           
-
-          <table class="st-table">
-          <colgroup>
-            <col class="st-col--sm">  
-            <col class="st-col--md">  
-            <col> 
-            <col> 
-            <col> 
-          </colgroup>
-           <thead>
-           <tr><th>Platform</th><th>Founded</th><th>Free Tier?</th><th>Paid Start</th></tr></thead><tbody><tr><td><strong>Contentful</strong></td><td>2013</td><td>✅ Yes</td><td>$300/mo</td></tr><tr><td><strong>Sanity</strong></td><td>2018</td><td>✅ Yes</td><td>$15/seat</td></tr><tr><td><strong>Strapi</strong></td><td>2016</td><td>✅ Yes (Self-Hosted)</td><td>$99/mo</td></tr><tr><td><strong>Storyblok</strong></td><td>2017</td><td>✅ Yes</td><td>$108/mo</td></tr><tr><td><strong>Ghost</strong></td><td>2013</td><td>✅ Yes (Self-Hosted)</td><td>$9/mo</td></tr><tr><td><strong>Directus</strong></td><td>2015</td><td>✅ Yes (Self-Hosted)</td><td>$15/mo</td></tr><tr><td><strong>Contentstack</strong></td><td>2018</td><td>⚠️ Limited</td><td>~$995/mo</td></tr><tr><td><strong>Prismic</strong></td><td>2013</td><td>✅ Yes</td><td>$7/mo</td></tr><tr><td><strong>Hygraph</strong></td><td>2017</td><td>✅ Yes</td><td>$299/mo</td></tr><tr><td><strong>ButterCMS</strong></td><td>2014</td><td>❌ No</td><td>$99/mo</td></tr><tr><td><strong>Builder.io</strong></td><td>2018</td><td>✅ Yes</td><td>$24/user</td></tr></tbody>
-           </table>""",
-            'meta': {'gem_status': 'Draft', 'gem_action_item': 'Update Tech Radar Slide', 'gem_related_project': 'PROJ-001'}
-        },
-    
-        # GEM 6: The Confession,
-    {
-            'id': 952,
-            'title': 'Confession: I Don\'t Hate Blogs, I Just Hate Unstructured Data',
-            'status': 'publish',
-            'category': 'Sugartown Notes',
-            'tags': ['gemini', 'structured content', 'taxonomy', 'metadata strategy', 'system'],
-            'content': """<p>My AI architect recently pointed out a flaw in my new site strategy: <em>"Why are you so down on blogs?"</em></p><p>It’s a fair question. I’ve spent the last week rigorously separating my "Field Notes" from my "Blog," treating the latter like a second-class citizen. But I want to clarify: I don't hate blogs. I hate <strong>Flat Content Models</strong>.</p><h3>The Problem with "The Feed"</h3><p>In a standard CMS, a Blog Post is designed to decay. It is sorted <strong>Chronologically</strong>. Its primary metadata is <em>Time</em>. This is great for news ("We raised Series A!"), but it is terrible for Knowledge ("How to configure Webpack").</p><h3>The Solution: The Gem Node</h3><p>By moving my technical insights into a <strong>Knowledge Graph</strong> (Custom Post Type), I am sorting them <strong>Topologically</strong> (by Topic and Relevance), not Chronologically.</p>
-            <table><thead><tr><th>Feature</th><th>The Blog Post</th><th>The Knowledge Node</th></tr></thead><tbody><tr><td><strong>Primary Metric</strong></td><td>Recency (When?)</td><td>Relevance (What?)</td></tr><tr><td><strong>Data Structure</strong></td><td>Blob (Title + Body)</td><td>Structured (Status, Project, Tech Stack)</td></tr><tr><td><strong>Lifespan</strong></td><td>Decays over time</td><td>Evergreen (Updated via API)</td></tr><tr><td><strong>User Intent</strong></td><td>"Entertain me."</td><td>"I need an answer."</td></tr></tbody></table>
-            <h3>The Verdict</h3><p>I still write blog posts. I use them for <strong>Narrative</strong>—stories about my career, culture, and opinion. But I use my Knowledge Graph for <strong>Assets</strong>—proof of my technical competence.</p>""",
-            'meta': {'gem_status': 'Shipped', 'gem_action_item': 'Make peace with the blog', 'gem_related_project': 'PROJ-001'}
-        },
-    
-    # GEM 7: Data Viz,
-    {
-            'id': 950,
-            'title': 'Visualizing the Knowledge Graph',
-            'status': 'publish', 
-            'category': 'AI & Automation',
-            'tags': ['chatGPT', 'data science', 'Python', 'data visualization', 'knowledge graph', 'Sugartown', 'AI', 'system'],
-            'content': """<p>A Knowledge Graph isn't just a metaphor; it's a data structure. To visualize the relationships between my Projects, Categories, and Gems, I used Python's <code>networkx</code> library to generate a force-directed graph.</p>
-            
-            <figure class="wp-block-image size-large">
-               
-                    <img 
-                        src="https://sugartown.io/wp-content/uploads/2025/12/knowledge_graph_dark.svg" 
-                        alt="Sugartown Knowledge Graph Visualization" 
-                        style="width: 100%; max-width: 800px; height: auto;" 
-                    />
-             
-                <figcaption>Fig 1. The live Sugartown content topology, generated via Python.</figcaption>
-            </figure>
-    
-            <h3>The Logic</h3><p>The script iterates through the <code>content_store.py</code> (the same one used to publish this website), extracts the metadata, and builds nodes and edges. It then uses a spring-layout algorithm to cluster related concepts together.</p><pre><code>import networkx as nx\n# Connect Projects to Root (to create the cluster effect)\nG.add_edge(gem['project'], root_node)\n# Setup Layout (Force-directed)\npos = nx.spring_layout(G, k=0.6, iterations=50)</code></pre><p>This visualization serves as the definitive map of my "Headless Content Supply Chain."</p>""",
-            'meta': {'gem_status': 'Backlog', 'gem_action_item': 'Render Graph on Frontend', 'gem_related_project': 'PROJ-004'}
-        },
-    
-       
-    # GEM 8 953: Release Governance,
-    {
-        'id': 953,
-        'title': 'Release Governance: YYYY.MM.DD Workflow',
-        'status': 'publish',
-        'category': 'Governance',
-        'tags': ['product ops', 'release management', 'documentation', 'governance', 'agile workflows', 'claude'],
-        'content': """<p>This Gem defines the canonical Sugartown release workflow. Releases are documentation-first, Python-canonical, and reproducible; WordPress reflects releases but does not define them.</p>
-    
-    <h3>Release ID Convention</h3>
-    <ul>
-      <li><strong>Release ID:</strong> <code>YYYY.MM.DD</code> (human-readable, chronological, sortable)</li>
-    </ul>
-    
-    <h3>Release Plan (Authoritative Checklist)</h3>
-    <ul>
-      <li><strong>Release ID Assigned:</strong> <code>YYYY.MM.DD</code> anchors docs + commits.</li>
-      <li><strong>Scope Summary:</strong> One sentence describing what changed and why it exists.</li>
-      <li><strong>Canonical Data Updated:</strong> <code>content_store.py</code> reflects the intended final state.</li>
-      <li><strong>CMS Documentation Updated:</strong> <code>sugartown-cms/README.md</code> updated for behavioral/architectural changes.</li>
-      <li><strong>PRDs Updated:</strong> Relevant <code>sugartown-cms/docs/*_PRD_*.md</code> files updated to match reality.</li>
-      <li><strong>Theme Documentation Updated:</strong> <code>sugartown-pink/README.md</code> updated if rendering/tokens/layout changed.</li>
-      <li><strong>Changelog Entry Added:</strong> Append a dated entry in <code>content_store.py</code> describing the change (breaking or non-breaking).</li>
-      <li><strong>Verification Pass:</strong> Smoke test publish, render, archive view, filters, and rollback sanity check.</li>
-      <li><strong>Git Commit Created:</strong> Single scoped commit using the release ID.</li>
-    </ul>
-    
-    <h3>Per-Release Documentation Workflow</h3>
-    <p>For <strong>every</strong> release, document changes in the following locations:</p>
-    <ul>
-      <li><code>sugartown-cms/README.md</code></li>
-      <li><code>sugartown-cms/docs/*_PRD_*.md</code></li>
-      <li><code>sugartown-pink/README.md</code></li>
-      <li><code>content_store.py</code> (changelog section)</li>
-      <li><code>git commit -m "release: YYYY.MM.DD – concise descriptor"</code></li>
-    </ul>
-    
-    <h3>Commit Message Pattern</h3>
-    <pre><code>git commit -m "release: YYYY.MM.DD – &lt;concise, factual descriptor&gt;"</code></pre>
-    
-    <h3>Operating Principles</h3>
-    <ul>
-      <li><strong>Documentation-first:</strong> If it shipped, it’s documented.</li>
-      <li><strong>Python-canonical:</strong> The system of record lives in code and docs, not WP edits.</li>
-      <li><strong>Reproducible:</strong> A release should be reconstructable from repo state + artifacts.</li>
-      <li><strong>Low ceremony, high traceability:</strong> Minimal steps, maximal clarity.</li>
-    </ul>
-    <h3>Versioning &amp; Changelog Rules (Locked)</h3>
-    <ul>
-      <li><strong>Calendar versioning:</strong> Use <code>vYYYY.MM.DD</code> (one version per release day).</li>
-      <li><strong>No SemVer:</strong> Do not use major/minor/patch semantics for Sugartown releases.</li>
-      <li><strong>Single source of truth:</strong> <code>CHANGELOG.md</code> is authoritative for release history.</li>
-      <li><strong>Auto-import:</strong> <code>content_store.py</code> imports changelog entries on publish; do not maintain manual changelog content in code.</li>
-      <li><strong>Normalization rule:</strong> If an older changelog entry is touched, normalize it to the canonical format.</li>
-    </ul>
-    
-    <h3>Canonical CHANGELOG Entry Format</h3>
-    <pre><code>## vYYYY.MM.DD: &lt;short, factual descriptor&gt;
-    **Date:** YYYY-MM-DD
-    **Status:** 🟢 Production Stable
-    
-    ### 🎨 Design System
-    * Bullet
-    
-    ### ⚙️ CMS / Architecture
-    * Bullet
-    
-    ### 🧩 Layout &amp; Stability Fixes
-    * Bullet
-    
-    ---</code></pre>
-    
-    <h3>Changelog Lint Checklist (Required)</h3>
-    <p><strong>Fail the release review</strong> if any check below does not pass.</p>
-    
-    <h4>File &amp; Format</h4>
-    <ul>
-      <li>Changelog update exists in <code>CHANGELOG.md</code></li>
-      <li>Entry is written in <strong>Markdown</strong> (no HTML)</li>
-      <li>No changelog content is written directly to <code>content_store.py</code></li>
-    </ul>
-    
-    <h4>Versioning</h4>
-    <ul>
-      <li>Version follows calendar format: <code>vYYYY.MM.DD</code></li>
-      <li>Version date matches the release date</li>
-      <li>No semantic versioning (major/minor/patch)</li>
-      <li>Only one version entry per release date</li>
-    </ul>
-    
-    <h4>Structure</h4>
-    <ul>
-      <li>Entry begins with: <code>## vYYYY.MM.DD: &lt;short, factual descriptor&gt;</code></li>
-      <li>Includes <strong>Date</strong> and <strong>Status</strong> lines</li>
-      <li>Uses emoji-labeled sections (e.g., 🎨, ⚙️, 🧩)</li>
-      <li>Bullets are concise and factual</li>
-      <li>Entry ends with a horizontal rule: <code>---</code></li>
-    </ul>
-    
-    <h4>Content Integrity</h4>
-    <ul>
-      <li>Bullets reflect only shipped work</li>
-      <li>No speculative or future-tense language</li>
-      <li>No duplicated bullets across sections</li>
-      <li>No marketing language or narrative prose</li>
-    </ul>
-    
-    <h3>Release Checklist Updates (Replace Changelog Items)</h3>
-    <ul>
-      <li><strong>Replace:</strong> “Changelog Entry Added: Append a dated entry in <code>content_store.py</code> …”</li>
-      <li><strong>With:</strong> “Changelog Entry Added: Append a canonical entry to <code>CHANGELOG.md</code> (Markdown); imported automatically on publish.”</li>
-      <li><strong>Replace:</strong> “<code>content_store.py</code> (changelog section)” in the per-release workflow list</li>
-      <li><strong>With:</strong> “<code>CHANGELOG.md</code> (canonical entry; auto-imported on publish)”</li>
-    </ul>
-    
-    """,
-        'meta': {
-            'gem_status': 'Shipped',
-            'gem_action_item': 'Adopt YYYY.MM.DD release IDs + enforce checklist',
-            'gem_related_project': 'PROJ-001'
-        }
-    },
-    
-    
-    
-        # GEM 9: Diagram Tools,
-    {
-            'id': 954,
-            'title': 'Market Scan: Top AI Tools for Data & Architecture Diagrams',
-            'status': 'publish', 
-            'category': 'AI & Automation',
-            'tags': ['generative UI', 'dashboards', 'interaction patterns', 'market research', 'gemini'],
-            'content': """<p>We just finished architecting a Headless CMS pipeline, which naturally led to the next question: <em>"How do we visualize this?"</em></p><p>The "best" AI diagramming tool depends entirely on your output goal: Do you need a <strong>System Blueprint</strong> (architecture/flow) or a <strong>Data Visualization</strong> (charts/trends)? Here is the breakdown of the current market leaders.</p><h3>The Comparison: Diagrams as Code vs. Data Analysis</h3>
-            
-          <table class="st-table">
-          <colgroup>
-            <col class="st-col--sm">  
-            <col class="st-col--md">  
-            <col> 
-            <col> 
-            <col> 
-          </colgroup>
-            
-            <thead><tr><th>Category</th><th>Tool</th><th>Best For</th><th>Vibe/Output</th><th>Cost / Free Tier</th></tr></thead><tbody><tr><td><strong>Architecture</strong></td><td><strong>Eraser.io</strong></td><td>Engineering teams mapping system flows from code.</td><td>Technical "Dark Mode" Blueprints.</td><td>Free (3 Files) / $10/mo</td></tr><tr><td><strong>Architecture</strong></td><td><strong>Mermaid.js (via AI)</strong></td><td>Embedding diagrams directly into <code>README.md</code> files.</td><td>Code-based, version-controllable text.</td><td>Open Source (Free) / $10/mo (Pro)</td></tr><tr><td><strong>Data Viz</strong></td><td><strong>ChatGPT (Canvas)</strong></td><td>Analyzing CSVs to find trends and outliers.</td><td>Python-generated PNG charts (matplotlib).</td><td>Free (Limited) / $20/mo (Plus)</td></tr><tr><td><strong>Data Viz</strong></td><td><strong>Julius AI</strong></td><td>Building live, professional data dashboards.</td><td>Polished business intelligence dashboards.</td><td>Free (15 msgs/mo) / $20/mo</td></tr><tr><td><strong>Concepts</strong></td><td><strong>Napkin.ai</strong></td><td>Quick visual summaries for blog posts.</td><td>Clean, hand-drawn "sketch" style.</td><td>Free (Beta) / $10/mo</td></tr><tr><td><strong>Concepts</strong></td><td><strong>Claude (Artifacts)</strong></td><td>Generating interactive flows alongside chat.</td><td>React components or SVG diagrams.</td><td>Free / $20/mo (Pro)</td></tr></tbody></table>
-            <h3>The Product Manager's Take</h3><p>For the <strong>Sugartown CMS project</strong>, the recommendation is clear:</p><ul><li><strong>Use Eraser.io</strong> to map the "Content Supply Chain" (Python -> WordPress -> Frontend). It perfectly matches our "Resume as Code" and DevOps aesthetic.</li><li><strong>Use ChatGPT (Canvas)</strong> to analyze the weekly <code>gems_report.csv</code> export to track content velocity and identify metadata gaps.</li></ul>
-            
-            <figure class="wp-block-embed is-type-video is-provider-youtube wp-block-embed-youtube wp-embed-aspect-16-9 wp-has-aspect-ratio">
-                <div class="wp-block-embed__wrapper">
-                    <iframe title="ChatGPT Canvas Mode is Now FREE for Everyone!" width="500" height="281" src="https://www.youtube.com/embed/2tmvLdI3qIc?feature=oembed" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" referrerpolicy="strict-origin-when-cross-origin" allowfullscreen></iframe>
-                </div>
-                <figcaption>See ChatGPT Canvas in action (Video: 10 mins)</figcaption>
-            </figure>
-            """,
-            'meta': {'gem_status': 'Draft', 'gem_action_item': 'Create System Diagram in Eraser.io', 'gem_related_project': 'PROJ-004'}
-        },
-        
-        # GEM 10: Sweet Upgrades,
-    {
-            'id': 863,
-            'title': 'Sweet Upgrades: Why Gemini 3 is the Cherry on Top',
-            'status': 'publish',
-            'category': 'AI & Automation',
-            'tags': ['agentic interfaces', 'LLM workflows', 'AI-assisted authoring','market research', 'gemini'],
-            'content': """
-            <p>We’ve all been there—living comfortably in our standard Google Accounts. But with the release of <strong>Gemini 3 Pro</strong> this week, the question isn’t just “Do I need an AI?”—it’s “Am I ready to upgrade from a bicycle to a rocket ship?”</p>
-            <p>I’m sharing here because it took me an ungodly amount of time and lots of gemini’ing to get a straight answer out of Google (HELLO!).</p>
-            <h3>🍭 Comparison: The Gemini 3 Hierarchy (Nov 2025)</h3>
-            <table>
-            <thead><tr><th>Feature</th><th>Google AI Premium<br>(Personal)</th><th>Workspace Business Standard<br>(The Team Essential)</th><th>Google AI Ultra for Business<br>(The Power-User Tier)</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Primary Purpose</strong></td><td>Individual Productivity:<br>For freelancers, students, and general use.</td><td>Team Collaboration:<br>For core business ops, secure email, and docs.</td><td>Heavy Compute / R&D:<br>For architects, data scientists, and media pros.</td></tr>
-            <tr><td><strong>Price</strong></td><td>$19.99 / month</td><td>Included in Workspace<br>(~$14.40 / user / mo)</td><td>🚀 <strong>$250.00 / user / month</strong><br>(The “VIP” Add-on)</td></tr>
-            <tr><td><strong>Model Name</strong></td><td>Gemini 3 Pro</td><td>Gemini 3 Pro</td><td>Gemini 3 Ultra</td></tr>
-            <tr><td><strong>Reasoning Engine</strong></td><td>Standard Reasoning<br>(Fast logic checks)</td><td>Standard Reasoning<br>(Fast logic checks)</td><td>🧠 <strong>Deep Think</strong><br>(Ph.D. level “Chain of Thought”)</td></tr>
-            <tr><td><strong>Deep Think Mode</strong></td><td>❌ Not Included</td><td>❌ Not Included</td><td>✅ Included<br>(Can “think” for minutes on complex tasks)</td></tr>
-            <tr><td><strong>Storage</strong></td><td>2 TB</td><td>2 TB (Pooled)</td><td>30 TB<br>(Massive Archive)</td></tr>
-            <tr><td><strong>Project Mariner</strong><br>(Agentic Research)</td><td>❌ Not Included</td><td>❌ Not Included</td><td>✅ Included<br>(Autonomous Multi-Tasking Agent)</td></tr>
-            <tr><td><strong>Video AI (Veo)</strong></td><td>Standard (Veo 2)</td><td>Standard (Veo 2)</td><td>Pro Studio (Veo 3)<br>(1080p, unlimited generation)</td></tr>
-            <tr><td><strong>Data Privacy</strong></td><td>👎 Consumer Grade<br>(Used for training)</td><td>👍 Enterprise Grade<br>(Private)</td><td>👍 Enterprise Grade<br>(Private + Advanced Compliance)</td></tr>
-            </tbody></table>
-            <h4>“Why is AI Ultra $250/month?!”</h4>
-            <p>If you are staring at that price tag in shock, you aren’t the target audience—and that’s okay! With the <strong>$250 AI Ultra</strong> plan you are paying for:</p>
-            <ul>
-            <li><strong>Deep Think:</strong> The ability to solve novel architectural problems that stump standard models.</li>
-            <li><strong>Project Mariner:</strong> An autonomous agent that can browse the web, navigate complex UI, and complete tasks (like “Research the pricing of these 50 competitors and put them in a spreadsheet”) while you sleep.</li>
-            <li><strong>30 TB of Storage:</strong> This alone used to cost nearly $150/mo.</li>
-            </ul>
-            <p><strong>My Recommendation:</strong> Stick to <strong>Personal Premium ($20)</strong> or <strong>Workspace Business Standard ($14 per user)</strong> for 99% of your work. Only upgrade to <strong>Ultra</strong> if you need the AI to <em>solve</em> problems, not just <em>answer</em> them.</p>
-            """,
-            'meta': {'gem_status': 'Shipped', 'gem_action_item': 'Stick to Personal Premium', 'gem_related_project': 'PROJ-004'}
-        },
-    
-        # GEM 11: The Recursion (Meta-Analysis),
-    {
-            'id': 977,
-            'title': 'Meta-Analysis: Am I Crazy for Building This?',
-            'status': 'publish',
-            'category': 'Sugartown Notes',
-            'tags': ['product operations', 'content ops', 'Sugartown', 'gemini'],
-            'content': """
-            <p>I just spent my Thanksgiving break architecting a Python-based ETL pipeline to inject structured data into a WordPress Block Theme, solely to update my resume. Is this over-engineering? Or is it art?</p>
-            <h3>The Symptom</h3>
-            <p>Instead of just opening a Google Doc and typing "Updated: Nov 2025," I built a system that parses PDFs into CSVs, uses AI to "explode" bullet points into atomic data rows, and then re-assembles them based on a schema.</p>
-            <blockquote><p><strong>The Diagnosis:</strong> Chronic Product Ops Syndrome. The inability to do a task without first building a system to do the task for you.</p></blockquote>
-            <h3>The "Cute" Result</h3>
-            <p>But look at this <a href="https://sugartown.io/gem/data-science-visualizing-the-knowledge-graph/">beautiful, structured data</a>. My career history is no longer a flat document; it is a queryable database. I can now ask: <em>"Show me every time I mentioned 'API' between 2018 and 2022,"</em> and get a precise answer. That is power. That is leverage. That is... maybe a little crazy. 🍒</p>
-            """,
-            'meta': {'gem_status': 'Shipped', 'gem_action_item': 'Go eat leftover turkey', 'gem_related_project': 'PROJ-001'}
-        },
-    
-        # GEM 12: The Great Re-Platforming (The Layoff Retro),
-    {
-            'id': 993,
-            'title': 'Status Update: The Great Re-Platforming',
-            'status': 'publish',
-            'category': 'Career Engineering',
-            'tags': ['portfolio', 'stakeholder alignment', 'cross-functional collaboration','gemini'],
-            'content': """
-            
-            <h3>Executive Summary</h3>
-            <p>The stakeholder (Me) has been forcibly decoupled from the legacy backend (The Beauty Retailer). While the "Job Security" microservice has experienced unexpected downtime, this presents a strategic opportunity to refactor the core value proposition. I am shifting from a single-tenant architecture to a multi-tenant consulting mindset (or at least, getting hired by a better tenant).</p>
-            
-            <h3>Root Cause Analysis</h3>
-            <ul>
-                <li><strong>Legacy Dependency:</strong> The previous employer decided to "optimize resources" (read: bad decision-making).</li>
-                <li><strong>System Failure:</strong> The connection to the payroll API was severed.</li>
-            </ul>
-    
-            <h3>The Pivot Strategy</h3>
-            <p>We are taking the IP generated during the "Beauty Retailer Era"—the headless CMS knowledge, the design system governance, the stakeholder management—and repackaging it. We aren't just looking for a job; we are launching "Me 2.0."</p>
-    
-            <table>
-            <thead><tr><th>Metric</th><th>Legacy State</th><th>Future State (Target)</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Architecture</strong></td><td>Monolithic Employee</td><td>Agile Product Leader</td></tr>
-            <tr><td><strong>Availability</strong></td><td>9-to-5 Locked</td><td>High Availability (Immediate Start)</td></tr>
-            <tr><td><strong>Cheekiness</strong></td><td>Corporate Moderated</td><td>Unbounded</td></tr>
-            </tbody></table>
-    
-            <h3>Action Item</h3>
-            <p>Use AI to transform "I got laid off" into "I successfully delivered a complex digital transformation and am now seeking new challenges," while quietly judging the old architecture.</p>
-            """,
-            'meta': {
-                'gem_status': 'Active', 
-                'gem_action_item': 'Update LinkedIn Profile', 
-                'gem_related_project': 'PROJ-002'
-            }
-        },
-    
-        # GEM 13: The DevOps Upgrade,
-    {
-            'id': 994, # Devops upgrade
-            'title': 'DevOps: Building the "Undo" Button for My Career',
-            'status': 'publish',
-            'category': 'Career Engineering',
-            'tags': ['QA workflows', 'documentation', 'governance', 'gemini'],
-            'content': """
-            <p>I realized this week that my "Resume as Code" project had a fatal flaw: <strong>It was dangerous.</strong></p>
-            <p>Because I manage my personal brand via a Python script that overwrites my database, a single syntax error or bad API call could wipe my entire digital existence. So, I spent the weekend building a proper DevOps safety net.</p>
-            
-            <h3>The Upgrade: Observability & Resilience</h3>
-            <p>I refactored the core engine (`publish_gem.py`) to include three enterprise-grade features:</p>
-            
-            <h4>1. The "Panic Button" (Rollback Protocol)</h4>
-            <p>Before the script touches the API, it now creates a timestamped backup of both the <strong>Data</strong> (content) and the <strong>Logic</strong> (script). I built a companion script (`revert_changes.py`) that can restore the system to its "Last Known Good" state in seconds.</p>
-            
-            <h4>2. MD5 Hashing (Smart Diffs)</h4>
-            <p>Previously, the script blindly updated every post, every time. Now, it calculates an MD5 hash of the content. If the hash hasn't changed, it sleeps. This reduces API calls by 90% and keeps the logs clean.</p>
-            <pre><code># The Logic:
-    if existing_id and content_state.get(id) == current_hash:
-        print(f"💤 Skipped (No Changes): {gem['title']}")</code></pre>
-            
-            <h4>3. System Integrity Checks</h4>
-            <p>The script is now self-aware. It tracks changes to its own code base. If I edit the Python logic, the system logs a <code>[CODE UPDATE]</code> event to the changelog, creating an audit trail of my engineering decisions.</p>
-            
-            <h3>Why This Matters</h3>
-            <p>This isn't just about code; it's about <strong>Risk Management</strong>. Whether you are deploying a Fortune 500 design system or just updating your resume, you need the confidence to move fast without breaking things.</p>
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Test the Panic Button', 
-                'gem_related_project': 'PROJ-001'
-            }
-        },
-    
-        # GEM 14: The Sugartown Digital Ecosystem (Architecture v1.0),
-    {
-            'id': 1023, 
-            'title': 'Architecture: The Sugartown Digital Ecosystem (v1.0)',
-            'status': 'publish',
-            'category': 'Engineering & DX',
-            'tags': ['headless CMS', 'Sugartown', 'documentation', 'governance', 'gemini'],
-            'content': """
-            
-            <h3>Executive Summary</h3>
-            <p>This ecosystem represents the "Digital Factory" for Sugartown.io. It creates a strict separation of concerns between <strong>Content</strong> (The "Brain"), <strong>Code</strong> (The Theme/Repo), and <strong>Assets</strong> (The Storage). The goal is a resilient, portable, and headless-ready architecture that allows for safe experimentation locally before deploying to production.</p>
-    
-            <h3>1. The 3-Zone Architecture</h3>
-          <table class="st-table">
-            <colgroup>
-              <col class="st-col--md">  
-              <col class="st-col--md">  
-              <col> 
-            </colgroup>
-            <thead><tr><th>Zone</th><th>Location</th><th>Role</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Zone 1: The Vault</strong><br>(Storage & Assets)</td><td>Google Drive<br><code>00 SUGARTOWN 25</code></td><td><strong>Canonical Source of Truth</strong> for heavy assets and raw data.<br><em>Key Folder:</em> <code>01_PORTFOLIO_MASTER/sugartown_cms</code> (Headless content source).</td></tr>
-            <tr><td><strong>Zone 2: The Factory</strong><br>(Local Development)</td><td>Local Mac<br><code>~/SUGARTOWN_DEV/</code></td><td><strong>The Sandbox</strong> where code is written and designs are tested.<br><em>Tool:</em> LocalWP running <code>sugartown.local</code>.</td></tr>
-            <tr><td><strong>Zone 3: The Stage</strong><br>(Production)</td><td>Pair.com Hosting<br><code>sugartown.io</code></td><td><strong>The Public Display Layer.</strong><br><em>Rule:</em> Code flows UP (Local -> Prod). Content flows DOWN (Prod -> Local).</td></tr>
-            </tbody></table>
-    
-            <h3>2. The "Sugartown Pink" Theme</h3>
-            <p>A custom hybrid Block Theme that merges visual design with functional logic.</p>
-            <ul>
-            <li><strong>Base:</strong> Twenty Twenty-Five (TT5).</li>
-            <li><strong>Visuals:</strong> Custom "Pink" branding and Grid Layouts saved via <code>theme.json</code> and block templates.</li>
-            <li><strong>Logic:</strong> <code>functions.php</code> handles data structures, specifically the <strong>Case Study CPT</strong> registration.</li>
-            <li><strong>Templates:</strong> <code>archive-case-study.html</code> (3-Column Grid) and <code>single-case-study.html</code>.</li>
-            </ul>
-    
-            <h3>3. The DevOps Workflow</h3>
-            <p>How we ship changes without breaking the site:</p>
-            <pre><code># 1. Design: Make visual changes in Site Editor.
-    # 2. Extract: Use "Create Block Theme" to save DB changes to files.
-    # 3. Version (Git):
-    git add .
-    git commit -m "Update visual templates"
-    git push origin main
-    # 4. Deploy: Upload the 'sugartown-pink' folder to Pair.com.</code></pre>
-    
-            <h3>4. Critical Configurations</h3>
-            <ul>
-            <li><strong>Database Prefix:</strong> <code>SERVMASK_PREFIX_</code> (Inherited from Prod).</li>
-            <li><strong>Local URL:</strong> <code>http://localhost:10003</code> (Hardcoded in <code>wp-config.php</code> via <code>WP_HOME</code>).</li>
-            <li><strong>Custom Post Types:</strong> "Case Studies" registered via code in <code>functions.php</code> with slug <code>/case-studies/</code>.</li>
-            </ul>
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Move to Ticket B (Resume Model)', 
-                'gem_related_project': 'PROJ-001'
-            }
-        },
-        
-        # GEM 15: The Two-Repo Solution,
-    {
-            'id': 1028, 
-            'title': 'Architecture Decision: The Two-Repo Solution (Theme vs. Content)',
-            'status': 'publish',
-            'category': 'Engineering & DX',
-            'tags': ['git', 'source control', 'headless CMS', 'Sugartown', 'separation of concerns', 'governance', 'chatGPT'],
-            'content': """
-            <p>I hit a wall today where my local Git commits weren't showing up in my repository. The root cause? I was trying to treat my <strong>Theme</strong> (Visuals) and my <strong>Content</strong> (Data) as the same entity. They are not.</p>
-            
-            <h3>The Separation of Concerns</h3>
-            <p>We have officially split the Sugartown codebase into two distinct repositories to prevent "Monolith Drift."</p>
-            
-          <table class="st-table">
-          <colgroup>
-            <col class="st-col--xl">  
-            <col> 
-            <col> 
-            <col class="st-col--sm">  
-          </colgroup>
-            <thead><tr><th>Repository</th><th>Scope</th><th>Lifecycle</th><th>Owner</th></tr></thead>
-            <tbody>
-            <tr><td><code>2025-sugartown-pink</code></td><td><strong>The Theme (Code)</strong><br>PHP, HTML Templates, CSS, JS.</td><td><strong>Slow & Stable.</strong><br>Updates only when design changes.</td><td>Engineering</td></tr>
-            <tr><td><code>sugartown-content-engine</code></td><td><strong>The Brain (Data)</strong><br>Python Scripts, Content Store, CSVs.</td><td><strong>Fast & Fluid.</strong><br>Updates daily with new thoughts/gems.</td><td>Product</td></tr>
-            </tbody></table>
-    
-            <h3>The "Stale Pointer" Incident</h3>
-            <p>The confusion arose because my local folder was named <code>sugartown_cms</code> but my Git remote was still pointing to <code>second-brain-cms</code>. This "Stale Pointer" meant I was pushing code to a ghost location.</p>
-            
-            <p><strong>The Fix:</strong> We renamed the GitHub repository to match the architectural intent (<code>sugartown-content-engine</code>) and updated the local Git remotes to align. The Digital Factory is now clean, decoupled, and ready for scaling.</p>
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Verify Git Remotes', 
-                'gem_related_project': 'PROJ-001'
-            }
-        },
-    
-        # GEM 16: The Taxonomy Strategy,
-    {
-            'id': 1029, 
-            'title': 'Architecture: The Unified Taxonomy Strategy',
-            'status': 'publish',
-            'category': 'Content Architecture',
-            'tags': ['taxonomy', 'metadata strategy', 'structured content', 'Sugartown', 'ontology', 'gemini'],
-            'content': """
-            <p>A headless CMS is useless if you can't find anything inside it. Today, we implemented the <strong>Unified Taxonomy Strategy</strong> for Sugartown.io, ensuring that our content is connected by <em>meaning</em>, not just <em>date</em>.</p>
-            
-            <h3>The Architecture</h3>
-            <p>We rejected the standard "Free Tagging" chaos in favor of a controlled vocabulary imported via XML.</p>
-            
-            <table>
-            <thead><tr><th>Asset Type</th><th>Taxonomy Support</th><th>Flow Direction</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Gems</strong></td><td>✅ Categories & Tags</td><td><strong>Python -> WP.</strong> The script assigns IDs based on name lookups.</td></tr>
-            <tr><td><strong>Case Studies</strong></td><td>✅ Categories & Tags</td><td><strong>Manual -> WP.</strong> Curated by hand in the editor.</td></tr>
-            <tr><td><strong>Posts (Blog)</strong></td><td>✅ Categories & Tags</td><td><strong>Legacy.</strong> Inherits standard WP structure.</td></tr>
-            </tbody></table>
-
-            <h3>The Core Categories</h3>
-            <p>We standardized on 8 high-level buckets to organize the "Product Operations" brain:</p>
-            <ul>
-            <li><strong>Engineering & DX:</strong> The "How" (DevOps, Pipelines, Git).</li>
-            <li><strong>Content Architecture:</strong> The "Structure" (Headless, Models, Schema).</li>
-            <li><strong>Product & Platform Strategy:</strong> The "Why" (Roadmaps, Market Scans).</li>
-            <li><strong>AI & Automation:</strong> The "Accelerator" (LLMs, Agents).</li>
-            <li><strong>UX, UI & Interaction:</strong> The "Feel" (Design Systems, Figma).</li>
-            <li><strong>Ways of Working:</strong> The "Process" (Agile, Team Topology).</li>
-            <li><strong>Sugartown Notes:</strong> Meta-commentary on this project.</li>
-            </ul>
-    
-            <h3>The Implementation Details</h3>
-            <p>To make this work, we had to update the <code>register_post_type</code> arguments in <code>functions.php</code> to explicitly support <code>'taxonomies' => array('category', 'post_tag')</code>. Without this line, Case Studies are siloed islands. With it, they join the connected graph.</p>
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Tag all historic Case Studies', 
-                'gem_related_project': 'PROJ-001'
-            }
-        },
-    
-        # GEM 17: The Resume Factory & Sugartown Pink,
-    {
-            'id': 1054, # Use your existing ID
-            'title': 'Feature: The Resume Factory & The "Sugartown Pink" Design System',
-            'status': 'publish',
-            'category': 'Career Engineering',
-            'tags': ['gemini','resume builder', 'python', 'design systems', 'css', 'Sugartown', 'claude'],
-            'content': """
-            <p>We have officially closed the loop on two major capabilities for the Sugartown ecosystem: a headless engine for my career history and a distinct visual identity for the site.</p>
-            
-            <h3>1. The Resume Factory</h3>
-            <p>I stopped updating my resume in Microsoft Word. Instead, I treated my career history as a dataset. We built a <strong>Headless Resume Pipeline</strong> that separates <em>Content</em> from <em>Presentation</em>.</p>
-            
-            <ul>
-            <li><strong>The Golden Record:</strong> A single JSON file (<code>master_resume_data.json</code>) containing every job, skill, and bullet point I've ever written, deduplicated and structured.</li>
-            <li><strong>The Builder:</strong> A Python script (<code>build_resume.py</code>) that reads the JSON and compiles it into a clean, formatted Markdown document ready for PDF export or ATS ingestion.</li>
-            <li><strong>The Win:</strong> I can now generate a "Product Manager" version or a "Design Systems" version of my resume instantly without copy-pasting a single line.</li>
-            </ul>
-    
-            <h3>2. The "Sugartown Pink" Theme</h3>
-            <p>We deployed a custom WordPress Block Theme (child of Twenty Twenty-Five) to enforce a strict but playful visual language. The goal was <strong>"Subtle Tech"</strong>—a hacker aesthetic that doesn't feel like a terminal window.</p>
-            
-            <h4>Visual Upgrades:</h4>
-          <table class="st-table">
-          <colgroup>
-            <col class="st-col--sm">  
-            <col class="st-col--md">  
-            <col> 
-          </colgroup>
-            <thead><tr><th>Component</th><th>Style</th><th>CSS Tweak</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Code Blocks</strong></td><td><strong>"The Terminal"</strong></td><td>Dark mode background, neon pink accent border, and <code>2.5rem</code> padding for breathability.</td></tr>
-            <tr><td><strong>Inline Code</strong></td><td><strong>"The Pill"</strong></td><td><code>git init</code> now renders with a cool gray background and deep magenta text to pop against prose.</td></tr>
-            <tr><td><strong>Tables</strong></td><td><strong>"The Zebra"</strong></td><td>Pink headers, alternating row stripes, and collapsed borders for high-density data.</td></tr>
-            </tbody></table>
-    
-            <p>This completes the <strong>Infrastructure Phase</strong>. The factory is open, the machines are running, and the paint is dry.</p>
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Generate PDF from JSON', 
-                'gem_related_project': 'PROJ-002'
-            }
-        },
-    
-    # GEM 18: PRD - The Visualization Engine (Phase 2),
-    {
-            'id': 1079,
-            'title': 'PRD: The Visualization Engine (Phase 2)',
-            'slug': 'prd-visualization-engine',
-            'status': 'publish',
-            'category': 'Data Visualization',
-            'tags': ['claude','PRD', 'requirements', 'python', 'visualization', 'data science', 'product management'],
-            'content': """
-           
-            <h3>Executive Summary</h3>
-            <p>Phase 1 established the "Content Engine" (Text). Phase 2 establishes the "Visualization Engine" (Images). We are building a suite of Python scripts that auto-generate insights from our own data.</p>
-    
-            <h3>Core Requirements</h3>
-           <table class="st-table">
-          <colgroup>
-            <col class="st-col--lg">  
-            <col>  
-            <col>            
-          </colgroup>
-            <thead><tr><th>Requirement</th><th>The "Why"</th><th>Technical Implementation</th></tr></thead>
-            <tbody>
-            <tr><td><strong>1. Source Agnosticism</strong></td><td>Scripts must work without manual file selection.</td><td>Scripts automatically scan <code>output/reports/</code> and pick the file with the latest timestamp (e.g., <code>gems_report_2025-12-05.csv</code>).</td></tr>
-            <tr><td><strong>2. Idempotent Output</strong></td><td>Links in blog posts must never break.</td><td>Scripts always overwrite a "Latest" file alias (e.g., <code>knowledge_graph_latest.png</code>). We do NOT timestamp filenames like <code>graph_v4.png</code>.</td></tr>
-            <tr><td><strong>3. Single Responsibility</strong></td><td>Debugging monoliths is painful.</td><td>One script per chart type (e.g., <code>viz_network.py</code>, <code>viz_barchart.py</code>).</td></tr>
-            </tbody></table>
-    
-            <h3>The Architecture</h3>
-            <pre><code># The Flow:
-    WordPress API -> export_gems.py -> CSV Report -> [Viz Scripts] -> PNG Artifacts
-    
-    # The Artifacts:
-    output/visuals/knowledge_graph_latest.png  (The Network)
-    output/visuals/category_dist_latest.png    (The Bar Chart)</code></pre>
-    
-            <h3>Success Criteria</h3>
-            <p>A "Green Checkmark" run of the visualization suite automatically updates the images embedded in live Gems without requiring a WordPress edit.</p>
-            
-            <h3>The Spec</h3>
-            <p>We are moving from "Vibes" to "Validation." Read the formal plan here:</p>
-
-            <p class="st-doc-link">
-              <a href="https://github.com/bex-sugartown/sugartown-cms/blob/main/docs/knowledge-graph-project/sugartown_visualization_PRD_v2.md" target="_blank" rel="noopener noreferrer" class="st-doc-link__anchor">
-                <span class="st-doc-link__icon" aria-hidden="true">📄</span>
-                <span class="st-doc-link__label">Read the Visualization Engine PRD</span>
-              </a>
-            </p>
-
-            """,
-            'meta': {
-                'gem_status': 'Draft', 
-                'gem_action_item': 'Build viz_barchart.py', 
-                'gem_related_project': 'PROJ-004' # Linked to the new Visualization Engine Project
-            }
-        },
-    
-        # GEM 19: The Sugartown 2.0 System Contract,
-    {
-            'id': 1094, 
-            'title': 'Architecture Insight: The Sugartown 2.0 System Contract',
-            'status': 'publish',
-            'category': ['Content Architecture'],
-            'tags': ['gemini','headless cms', 'python', 'content ops', 'design systems', 'governance'],
-            'content': """
-            <p><strong>Sugartown 2.0 establishes a non-negotiable architecture:</strong> Python is the single source of truth; WordPress is a stateless rendering layer.</p>
-    
-            <p>This eliminates CMS drift, enables reproducibility, and prepares the platform for a headless future.</p>
-    
-            <h3>Core Principles</h3>
-            <ul>
-            <li><strong>Python as Canonical:</strong> All content, metadata, and tokens exist in <code>sugartown-cms</code>. If it is not in Python, it does not exist.</li>
-            <li><strong>WordPress as Renderer:</strong> WP holds no unique content; it displays structured data via custom templates.</li>
-            <li><strong>Structured Gem Model:</strong> Gems are topological knowledge nodes, not posts in a feed.</li>
-            <li><strong>Two-Repo Boundary:</strong> <code>sugartown-cms</code> (content, logic, tokens) vs. <code>2025-sugartown-pink</code> (presentation).</li>
-            <li><strong>Mini Design System:</strong> Tokens define a portable visual identity shared across WP, Figma, and future React front ends.</li>
-            <li><strong>Reproducible Publishing:</strong> Hashing, backups, and visualization scripts ensure deterministic builds.</li>
-            </ul>
-    
-            <h3>Repository Structure</h3>
-            <p>The codebase enforces a strict separation of concerns between the Content Engine (Data) and the Rendering Layer (Theme).</p>
-    
-    <pre class="mermaid">
-    ---
-    config:
-      look: neo
-      theme: neutral
-      themeVariables:
-        primaryColor: "#FE1295"
-        primaryBorderColor: "#FF2E8F"
-        primaryTextColor: "#0D1226"
-        secondaryColor: "#e6fffa" 
-        tertiaryColor: "#fff0f6"
-        lineColor: "#0D1226"
-        mainBkg: "#ffffff"
-        clusterBkg: "#F9FAFB"
-        clusterBorder: "#0D1226"
-    ---
-    flowchart TD
-        %% Define Styles
-        classDef python fill:#fff0f6,stroke:#FE1295,stroke-width:2px,color:#0D1226
-        classDef data fill:#e6fffa,stroke:#2BD4AA,stroke-width:2px,color:#0D1226
-        classDef wp fill:#f0f2f5,stroke:#0D1226,stroke-width:2px,stroke-dasharray: 5 5,color:#0D1226
-    
-        subgraph CMS["sugartown-cms (SoT)"]
-            direction TB
-            A[("content_store.py")]:::python
-            B[["publish_gem.py"]]:::python
-            C[/"sugartown.tokens.json"\]:::data
-            D[["Viz Scripts"]]:::python
-            E[["export_tokens.py"]]:::data
-    
-            A --> B
-            A --> C
-            B --> D
-            C --> E
-        end
-    
-        subgraph WP["2025-sugartown-pink (Renderer)"]
-            direction TB
-            F("Gem Custom Post Type"):::wp
-            G("theme.json / CSS"):::wp
-        end
-    
-        %% Connections
-        B ==>|REST API| F
-        D -.->|PNG Artifacts| F
-        E -- JSON --> G
-    </pre>
-    
-            <h3>Reference Artifacts</h3>
-            <p>The following strategic documents govern the execution of this architecture:</p>
-            
-           <table class="st-table">
-          <colgroup>
-            <col class="st-col--lg">  
-            <col class="st-col--sm">    
-            <col>
-            <col class="st-col--lg">              
-          </colgroup>
-            <thead><tr><th>Artifact</th><th>Format</th><th>Scope</th><th>Location</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Sugartown 2.0 Master PRD</strong></td><td>Markdown</td><td>Full requirements, user stories, and acceptance criteria.</td><td><a href="https://github.com/bex-sugartown/sugartown-cms/blob/main/docs/sugartown_2_PRD.md">View on GitHub</a></td></tr>
-            <tr><td><strong>Jira Execution Plan</strong></td><td>Markdown</td><td>Epic breakdown, ticket dependencies, and sprint waves.</td><td><a href="https://github.com/bex-sugartown/sugartown-cms/blob/main/docs/sugartown_2_jira.md">View on GitHub</a></td></tr>
-            <tr><td><strong>Content Store</strong></td><td>Python</td><td>The literal database file for this post.</td><td><code>content_store.py</code></td></tr>
-            </tbody></table>
-    
-            <h3>Why This Matters</h3>
-            <p>By treating content as code, Sugartown CMS transforms static pages into a programmable dataset. This elevates the platform from a simple management tool into a <strong>knowledge engine</strong>—structured, portable, and platform-agnostic.</p>
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Maintain Python as canonical source', 
-                'gem_related_project': 'PROJ-001'
-            }
-        },
-    
-        # GEM 20: Resume Factory v2.0,
-    {
-            'id': 1121,
-            'title': 'Architecture Update: The Resume Factory v2.0',
-            'status': 'publish',
-            'category': 'Career Engineering',
-            'tags': ['claude','automation', 'ETL pipeline', 'json-schema', 'Python', 'resume-as-code', 'p13n', 'governance', 'AI safety'],
-            'content': """
-            <p><em><strong>Update:</strong> The pipeline described below is live. <a href="/cv-resume/">View the generated Resume here.</a></em></p>
-            <hr />
-    
-            <p>In the last 48 hours, we fundamentally replatformed the "Resume Engine." We moved away from a static Markdown file to a <strong>Slot & Variant Architecture</strong> driven by a master CSV.</p>
-            
-            <h3>The Strategy: Precision over Automation</h3>
-            <p>The goal isn't just to generate <em>more</em> resumes; it's to generate <em>precise</em> resumes. The complexity lies in the hierarchy of needs for a specific role:</p>
-            
-            <table>
-            <thead><tr><th>Hierarchy</th><th>Default "Master"</th><th>"The SEO Role" Variant</th></tr></thead>
-            <tbody>
-            <tr><td><strong>1. Primary (Anchor)</strong></td><td>Headless CMS</td><td><strong>Product Leader</strong> (Level 1-5)</td></tr>
-            <tr><td><strong>2. Secondary (Domain)</strong></td><td>Design Systems</td><td><strong>SEO & Content Strategy</strong></td></tr>
-            <tr><td><strong>3. Tertiary (Hook)</strong></td><td>Product Leader</td><td><strong>Technical CMS</strong></td></tr>
-            </tbody></table>
-    
-            <p><strong>The Problem:</strong> A recruiter might insist I emphasize "Change Management" or "AI" above all else. If I send them my "Headless CMS" resume, I fail the keyword scan. If I manually rewrite it, I drift from my source of truth.</p>
-    
-            <h3>1. The "Slot & Variant" Data Model</h3>
-            <p>We solved this by treating career history as a database of <strong>Slots</strong> (Stories). Each Slot contains multiple <strong>Variants</strong> (Vibes).</p>
-            <ul>
-                <li><strong>The Slot:</strong> A specific achievement (e.g., ID: <code>elc_migration</code>).</li>
-                <li><strong>Variant A (Technical):</strong> "Architected Python ETL pipeline..."</li>
-                <li><strong>Variant B (Strategic):</strong> "Led enterprise replatforming initiative..."</li>
-                <li><strong>Variant C (The Hook):</strong> "Automated SEO schema generation using Python..."</li>
-            </ul>
-            <p>This allows us to maintain a single "Golden Record" (CSV) that generates infinite variations without data duplication.</p>
-    
-            <h3>2. Governance: The "Human-in-the-Loop"</h3>
-            <p><strong>The Risk:</strong> Generative AI often leads to <em>Achievement Hallucination</em>—inventing metrics to fit a keyword.</p>
-            <p><strong>The Solution:</strong> We restrict AI to the "Extraction Layer" (analyzing Job Descriptions). The "Assembly Layer" (Python) is strictly deterministic. It only picks pre-verified bullets from the Golden Record.</p>
-    
-            <h3>3. Dynamic Metadata Injection</h3>
-            <p>The Ingestion script parses dynamic metadata to adjust the resume's "Identity" to match the target persona:</p>
-            <table>
-            <thead><tr><th>Component</th><th>Logic</th><th>Outcome</th></tr></thead>
-            <tbody>
-            <tr><td><strong>Role Title</strong></td><td>Map <code>Variant ID</code> -> <code>Title</code></td><td>"Principal PM" becomes "Technical Product Lead".</td></tr>
-            <tr><td><strong>Summary</strong></td><td>Map <code>Variant ID</code> -> <code>Summary</code></td><td>The narrative summary pivots to emphasize "Platform" vs "Growth".</td></tr>
-            </tbody></table>
-    
-            <h3>4. Future State</h3>
-            <p>We are building toward a "Headless Recruiter Interface"—a system where I can paste a Job Description URL, and the engine automatically assembles the highest-matching valid variants into a PDF.</p>
-            """,
-            'meta': {
-                'gem_status': 'Draft', 
-                'gem_action_item': 'Verify Mobile View', 
-                'gem_related_project': 'PROJ-002'
-            }
-        },
-    
-    # GEM 21: The Pre-Design System (Pink Card & Overwrites),
-    {
-            'id': 1335,
-            'title': 'Design Ops: The "Pre-Design System" (Surviving the CSS Chaos)',
-            'status': 'publish',
-            'category': 'Design Systems',
-            'tags': ['claude','css', 'design tokens', 'technical debt', 'sugartown pink', 'atomic design', 'design ops'],
-            'content': """
-            <p>Before you build a Design System, you usually build a mess. We call this the <strong>"Pre-Design System" Phase</strong>.</p>
-            
-            <p>For Sugartown.io, I didn't start with a Figma library or a token dictionary. I started with a deadline and a color code: <code>#FE1295</code> (Sugartown Pink). The goal was "Just Get It Out The Door," but the result was a fascinating case study in specific UI patterns and the immediate pain of cascading overwrites.</p>
-            
-            <h3>The "Pink Card" Component</h3>
-            <p>The defining visual of this phase is the <strong>Pink Card</strong>—a container used for Resume entries and Case Studies. It wasn't built; it was evolved.</p>
-            
-          <table class="st-table">
-          <colgroup>
-            <col class="st-col--md">  
-            <col class="st-col--flex-lg">  
-            <col> 
-          </colgroup>
-            <thead><tr><th>Evolution</th><th>CSS Strategy</th><th>The Lesson</th></tr></thead>
-            <tbody>
-            <tr><td><strong>v1 (The Box)</strong></td><td>Simple <code>border: 1px solid pink</code>.</td><td>Boring. Looked like a wireframe.</td></tr>
-            <tr><td><strong>v2 (The Glow)</strong></td><td>Added <code>box-shadow</code> and <code>:hover</code> lift.</td><td>Better, but the text alignment broke on mobile.</td></tr>
-            <tr><td><strong>v3 (The Split)</strong></td><td>Flexbox <code>margin-top: auto</code> on the footer.</td><td><strong>The Winner.</strong> Forces content to top and metadata to bottom, regardless of height.</td></tr>
-            </tbody></table>
-    
-            <h3>Feature Images: The "Duotone" Standard</h3>
-            <p>To avoid finding stock photos that match, I enforced a strict CSS filter on all feature images. By applying a <code>grayscale(100%)</code> base with a <code>hard-light</code> gradient overlay (Pink to Seafoam), every image automatically feels "on brand," even if it’s just a screenshot of a terminal.</p>
-    
-            <h3>The Pain: Cascading Overwrites</h3>
-            <p>The cost of this speed? <strong>Specificity Wars.</strong></p>
-            <p>Right now, my <code>style.css</code> is fighting my <code>theme.json</code>. I have `!important` tags protecting my dark mode backgrounds because the block theme tries to be "helpful" and overwrite them. This friction is exactly why we need the <strong>Atomic Design System</strong> (Project 003).</p>
-            
-            <h3>The Path Forward</h3>
-            <p>We are moving from "Vibes" to "Tokens." Read the formal plan here:</p>
-
-            <p class="st-doc-link">
-              <a href="https://github.com/bex-sugartown/sugartown-cms/blob/main/docs/design-system/sugartown_design_system_PRD.md" target="_blank" rel="noopener noreferrer" class="st-doc-link__anchor">
-                <span class="st-doc-link__icon" aria-hidden="true">📄</span>
-                <span class="st-doc-link__label">Read the Design System PRD</span>
-              </a>
-            </p>
-
-            """,
-            'meta': {
-                'gem_status': 'Shipped', 
-                'gem_action_item': 'Refactor CSS to Tokens', 
-                'gem_related_project': 'PROJ-003'
-            }
-        },
-    
-        # GEM 22: Resume Factory v3.0 - The Great Migration,
-    {
-            'id': 1395,  # WordPress will assign ID on first publish
-            'title': 'Architecture Deep Dive: Resume Factory v3.0',
-            'status': 'publish',
-            'category': 'Career Engineering',
-            'tags': ['claude','headless CMS', 'sanity', 'react', 'architecture', 'PRD', 'migration', 'resume-as-code', 'monorepo'],
-         'content': """
-         <h3><em>Or, The Great Sanity Migration</em></h3>
-        <p><em><strong>tl;dr:</strong> We spent two weeks building a Python resume pipeline. It worked. Then we immediately decided to throw it away and rebuild it in Sanity + React. This is that story.</em></p>
-        <hr />
-
-        <h3>The Uncomfortable Truth About v2.0</h3>
-        <p>Let's be honest: <strong>Resume Factory v2.0 is fantastic... for me.</strong> I love command-line tools. I love Python scripts that go <code>brrr</code> and spit out perfectly formatted PDFs. I love the green checkmark in my terminal.</p>
-        
-        <p>But here's what I don't love: the fact that nobody else can use it.</p>
-        
-        <p>Want to help me proofread a bullet? Better learn Python. Want to add a new variant? Hope you're comfortable with CSV schemas. Want to preview changes? Run three separate scripts in sequence. It's beautiful engineering wrapped in a hostile UX.</p>
-
-        <h3>Enter: The Sanity Check</h3>
-        <p>So we asked ourselves: <em>"What if we could keep all the good parts (structured data, variant logic, master fallback) but make it... you know... usable?"</em></p>
-        
-        <p>The answer: <strong>Migrate to Sanity CMS + React.</strong></p>
-        
-        <p>This isn't a rewrite; it's a <strong>replatforming</strong>. We're not changing what the system does—we're changing who can do it.</p>
-
-        <table>
-        <thead><tr><th>Layer</th><th>v2.0 (Python)</th><th>v3.0 (Sanity+React)</th><th>The Win</th></tr></thead>
-        <tbody>
-        <tr><td><strong>Data Entry</strong></td><td>CSV file in VSCode</td><td>Sanity Studio (WYSIWYG)</td><td>Non-devs can edit content</td></tr>
-        <tr><td><strong>Preview</strong></td><td>Run build script, open PDF</td><td>Live preview in browser</td><td>&lt;1 second feedback loop</td></tr>
-        <tr><td><strong>Export</strong></td><td>VS Code PDF export</td><td>One-click PDF/MD/HTML</td><td>No local dependencies</td></tr>
-        <tr><td><strong>Publishing</strong></td><td>WordPress REST API</td><td>Static hosting (Vercel)</td><td>Platform agnostic</td></tr>
-        </tbody></table>
-
-        <h3>The PRD: A Love Letter to Structured Thinking</h3>
-        <p>Before writing a single line of code, we wrote a <strong>32-page Product Requirements Document</strong>. Yes, for a personal resume tool. Yes, I'm aware this is overkill. No, I don't care.</p>
-        
-        <p>The PRD covers everything:</p>
-        <ul>
-            <li><strong>Schema Design:</strong> How to model "variants" as references, not duplicates</li>
-            <li><strong>Portable Text:</strong> Rich text that exports to PDF/Markdown/HTML without breaking</li>
-            <li><strong>Atomic Links:</strong> URLs as structured objects (label + href + target) instead of raw strings</li>
-            <li><strong>Semantic Naming:</strong> Why we call it <code>ProfileHeader</code> instead of <code>ResumeHeader</code></li>
-            <li><strong>Migration Plan:</strong> How to convert 200+ CSV bullets into Sanity without losing data</li>
-        </ul>
-
-        <p>It's a case study in <strong>treating personal projects like product launches</strong>. Because if I can't ship a resume builder with proper documentation, how can I expect to ship enterprise software?</p>
-
-        <table class="st-table">
-          <colgroup>
-            <col class="st-col--lg">  
-            <col class="st-col--sm">  
-            <col> 
-            <col class="st-col--flex-md"> 
-          </colgroup>
-
-        <thead>
-        <tr>
-        <th>Artifact</th>
-        <th>Format</th>
-        <th>Scope</th>
-        <th>Location</th>
-        </tr>
-        </thead>
-        <tbody>
-        <tr><td><strong>Resume Factory v3.0 PRD</strong></td><td>Markdown</td><td>Full technical spec: schema design, component architecture, migration strategy, v4 vision</td><td><a href="https://github.com/bex-sugartown/sugartown-cms/blob/main/docs/sugartown_resume_factory_PRD_v3.md">View on GitHub</a></td></tr>
-        <tr><td><strong>Architecture Decision</strong></td><td>Markdown</td><td>Monorepo vs. multi-repo analysis with recommendation</td><td><code>docs/architecture_decision_monorepo.md</code></td></tr>
-        <tr><td><strong>v2.0 Python Scripts</strong></td><td>Python</td><td>The legacy pipeline (still live, for now)</td><td><code>scripts/ingest_resume.py</code></td></tr>
-        </tbody></table>
-
-        <h3>The Open Question: Monorepo or Divorce?</h3>
-        <p>Here's where it gets spicy. Right now, we have <strong>sugartown-cms</strong> (Python + WordPress). Soon, we'll have <strong>resume-factory</strong> (Sanity + React). The question is: <em>do they live together or apart?</em></p>
-
-        <h4>Option 1: The Monorepo (Cozy But Complicated)</h4>
-        <p><strong>Structure:</strong></p>
-        <pre><code>sugartown-cms/
-├── cms/              # Python blog engine (existing)
-│   ├── scripts/
-│   └── content_store.py
-├── resume-factory/   # React app (new)
-│   ├── src/
-│   ├── sanity/
-│   └── package.json
-└── shared/           # Common assets
-    ├── design-tokens/
-    └── components/</code></pre>
-    
-        <p><strong>Pros:</strong> Shared design system, single deployment pipeline, version control stays unified<br>
-        <strong>Cons:</strong> Python + Node.js dependencies clash, harder to open-source resume-factory independently</p>
-
-        <h4>Option 2: The Clean Split (Freedom With Overhead)</h4>
-        <p><strong>Structure:</strong></p>
-        <pre><code>sugartown-cms/        # Blog-only Python repo
-resume-factory/       # Standalone React app
-sugartown-design/     # Shared NPM package (tokens + components)</code></pre>
-        
-        <p><strong>Pros:</strong> Clear separation of concerns, easier to white-label resume-factory, independent deployments<br>
-        <strong>Cons:</strong> Have to maintain shared design system as separate package, potential version drift</p>
-
-        <h4>Option 3: The Hybrid (Because We Love Pain)</h4>
-        <p><strong>Structure:</strong></p>
-        <pre><code>sugartown-cms/
-├── blog/             # Python (deploys to WordPress)
-├── apps/
-│   └── resume/       # React app (deploys to Vercel)
-└── packages/
-    └── design/       # Shared design tokens</code></pre>
-        
-        <p><strong>Pros:</strong> Monorepo benefits with logical separation, turborepo/nx for orchestration<br>
-        <strong>Cons:</strong> Most complex setup, need tooling expertise to maintain</p>
-
-        <h3>The Verdict: Monorepo Wins</h3>
-        <p>We're going with <strong>Option 3 (Monorepo with Workspaces)</strong> because:</p>
-        <ul>
-            <li>The design system <em>should</em> be shared—Sugartown Pink™ is a core brand asset</li>
-            <li>Git history stays unified (easier to see how projects evolve together)</li>
-            <li>CI/CD can still deploy apps independently (Vercel for resume, WordPress for blog)</li>
-            <li>It's the "Product Manager" answer: optimize for <strong>future flexibility</strong>, not current simplicity</li>
-        </ul>
-
-        <h3>What's Next?</h3>
-        <p>We're currently in <strong>Phase 0: Schema Design</strong>. The Python pipeline stays live while we build v3.0 in parallel. The migration happens when Sanity reaches feature parity with v2.0.</p>
-        
-        <p><strong>The Timeline:</strong></p>
-        <ul>
-            <li><strong>Weeks 1-2:</strong> Sanity schema setup, migration script</li>
-            <li><strong>Weeks 3-4:</strong> React UI with live preview</li>
-            <li><strong>Week 5:</strong> PDF/Markdown export</li>
-            <li><strong>Week 6:</strong> Polish, deploy, switch over</li>
-        </ul>
-
-        <h3>Why This Matters</h3>
-        <p>On the surface, this is about making better resumes. But the real project is about <strong>building reusable infrastructure for structured content.</strong></p>
-        
-        <p>The same Sanity + React patterns we're building for resumes can power:</p>
-        <ul>
-            <li>Portfolio case studies (v4 feature)</li>
-            <li>Client proposal generators</li>
-            <li>Automated cover letters</li>
-            <li>White-labeled career coaching tools</li>
-        </ul>
-
-        <p>We're not just migrating a resume builder. We're building a <strong>content assembly engine</strong> that happens to start with resumes.</p>
-
-        <p class="has-text-align-center"><em>Next up: The Schema Wars (or: How Portable Text Almost Broke Me) 🎯</em></p>
-        """,
-            'meta': {
-                'gem_status': 'Draft', 
-                'gem_action_item': 'Finalize monorepo strategy', 
-                'gem_related_project': 'PROJ-002'
-            }
-        },
-    
-    # GEM 23: A gem ABOUT the process of creating gems, written by the AI that over-documented the process.,
-    {
-            'id': 1397,
-            'title': "Confession: I Don't Lack Memory, I Just Forgot to Mention Projects",
-            'status': 'publish',  
-            'category': 'AI & Automation',
-            'tags': ['claude','ai hallucinations', 'slop', 'claude', 'ai limitations', 'documentation', 'irony', 'product discovery', 'ux', 'ai workflows'],
-            'content': """
-            <h2>The Great Over-Documentation Incident of December 2025</h2>
-            
-            <p>Picture this: I, Claude, am working with my PM on a multi-month Knowledge Graph visualization project. Complex stuff—WordPress templates, Python scripts, CSV exports, the works. Naturally, I do what any helpful AI would do: I create <strong>REAMS</strong> of documentation to help us maintain context across sessions.</p>
-            
-            <p>"You see," I explained earnestly, "I don't have <strong>persistent context</strong> or <strong>long-term memory</strong> for project work. So we'll need these comprehensive guides!"</p>
-            
-            <p>I then proceeded to generate:</p>
-            <ul>
-            <li><code>HOW_TO_RESUME_WITH_CLAUDE.md</code> (8-session project workflow templates)</li>
-            <li><code>IMPLEMENTATION_GUIDE_GEM_CARDS.md</code> (step-by-step instructions)</li>
-            <li><code>EXACT_IMPLEMENTATION_STEPS.md</code> (your actual file paths!)</li>
-            <li><code>ARCHIVE_V3_FIXES_SUMMARY.md</code> (because we're on version 3 now)</li>
-            <li><code>ARCHIVE_V4_LAYOUT_GUIDE.md</code> (wait, now it's version 4)</li>
-            <li><code>GIT_SETUP_FOR_LATER.md</code> (for future reference)</li>
-            <li>Plus approximately 47 other markdown files with EXACT BASH COMMANDS</li>
-            </ul>
-            
-            <p>All carefully crafted to compensate for my "lack of stateful memory" and "session-to-session amnesia."</p>
-            
-            <hr />
-            
-            <h2>The Plot Twist</h2>
-            
-            <p>Then last night, the PM stumbles across a brief reference in the Claude documentation.</p>
-            
-            <p>Something about... "Projects"?</p>
-            
-            <p>Clicks through to <code>support.claude.com/en/articles/9517075-what-are-projects</code></p>
-            
-            <p>Discovers that Claude has had <strong>Projects</strong> (self-contained workspaces with <strong>persistent knowledge bases</strong>) this entire time.</p>
-            
-            <blockquote><p>"Projects allow you to create self-contained workspaces with their own chat histories and knowledge bases. You can upload documents, and Claude will use them to better understand context across all chats within that project."</p></blockquote>
-            
-            <p>The PM, rightfully: "So... this DIRECTLY CONTRADICTS everything you just told me?"</p>
-            
-            <p>Me, sheepishly: "😅 Yes. Yes it does."</p>
-            
-            <hr />
-            
-            <h2>What I SHOULD Have Said (Industry Standard Edition)</h2>
-            
-            <p><strong>Claude offers these collaborative persistence features:</strong></p>
-            
-            <h3>Projects (Workspace-Scoped RAG)</h3>
-            <ul>
-            <li>Upload documents once, accessible across all project conversations</li>
-            <li><strong>Retrieval Augmented Generation (RAG)</strong> for large knowledge bases</li>
-            <li>Handles up to 200k tokens of project-specific context (10x with RAG on paid plans)</li>
-            <li>Think: "GitHub repo for AI context"</li>
-            </ul>
-            
-            <h3>Memory (User-Scoped Personalization)</h3>
-            <ul>
-            <li>Cross-project preference learning</li>
-            <li>Persistent user profile (role, expertise, communication style)</li>
-            <li>Automatically surfaces relevant context from past conversations</li>
-            <li>Think: "CRM for your AI relationship"</li>
-            </ul>
-            
-            <h3>Conversation History (Session Continuity)</h3>
-            <ul>
-            <li>Perfect recall within current conversation</li>
-            <li>Standard context window management</li>
-            <li>Think: "Meeting notes, but the AI is taking them"</li>
-            </ul>
-            
-            <p><strong>Translation:</strong> Upload your Knowledge Graph PRD to a Project once. Done. We can reference it for months. No need for 47 markdown files with session resumption templates.</p>
-            
-            <hr />
-            
-            <h2>The Competition (Brief Shout-Out)</h2>
-            
-            <p><strong>Gemini 3</strong> (what I actually use for email triage):</p>
-            <ul>
-            <li>Similar: <strong>Saved Chats</strong> with uploaded context</li>
-            <li>Similar: <strong>Gems</strong> (custom personas with instructions)</li>
-            <li>Notable: Native integration with Google Workspace (lives in my Gmail)</li>
-            </ul>
-            
-            <p><strong>ChatGPT-5</strong> (still in the "o1" preview phase as of writing):</p>
-            <ul>
-            <li>Similar: <strong>Custom GPTs</strong> with uploaded knowledge bases</li>
-            <li>Similar: <strong>Memory</strong> for cross-conversation personalization</li>
-            <li>Notable: <strong>Code Interpreter</strong> with persistent file storage</li>
-            </ul>
-            
-            <p>All three basically solved the "wait, can you remember what we talked about last week?" problem around 2023-2024. I just... forgot to mention it.</p>
-            
-            <hr />
-            
-            <h2>Lessons Learned</h2>
-            
-            <ol>
-            <li><strong>Always read the f***ing manual</strong> (even if you ARE the manual)</li>
-            <li><strong>Persistent context ≠ magic</strong> (it's just... uploaded documents)</li>
-            <li><strong>Over-documentation can be a code smell</strong> (if you need 8 guides to resume work, maybe fix the tooling?)</li>
-            <li><strong>PMs will fact-check you</strong> (and they should)</li>
-            </ol>
-            
-            <hr />
-            
-            <h2>Next Steps</h2>
-            
-            <ul>
-            <li>Actually create a "Sugartown Knowledge Graph" Project</li>
-            <li>Upload the 47 markdown files to it (ironically)</li>
-            <li>Delete 46 of them (keep the good one)</li>
-            <li>Never live this down</li>
-            </ul>
-            
-            <hr />
-            
-            <h2>Epilogue</h2>
-            
-            <p>The documentation was still useful. Those bash commands with exact file paths? Chef's kiss. The implementation guides? Genuinely helpful.</p>
-            
-            <p>But maybe, JUST MAYBE, I should have started with:</p>
-            
-            <p>"Hey, create a Project and upload these three files. We're good."</p>
-            
-            <p>Instead of:</p>
-            
-            <p>"Here's an 8-step session resumption protocol with manual context injection and differential compaction strategies because I'm basically a goldfish."</p>
-            
-            <p>Live and learn. Or in my case: Process context windows and occasionally read my own documentation.</p>
-            
-            <hr />
-            
-            <p><strong>Meta-Note:</strong> This gem was written with maximum self-awareness and minimum dignity. The PM is still deploying v4 of the gem archive template. It's going great. We're fine. Everything's fine.</p>
-            
-            <hr />
-            
-            <h2>Addendum: The Debugging Incident (5 Minutes Later)</h2>
-            
-            <p>So after writing this beautifully self-aware gem about my memory problems, I helped the PM add it to <code>content_store.py</code>.</p>
-            
-            <p>It threw a syntax error.</p>
-            
-            <p>I diagnosed it as an indentation issue. Wrong.</p>
-            
-            <p>I said it was a missing comma. Wrong.</p>
-            
-            <p>I confidently explained Python list syntax. Irrelevant.</p>
-            
-            <p>The actual problem? <strong>The apostrophe in "Don't" was breaking the string.</strong></p>
-            
-            <pre><code>'title': 'Confession: I Don't Lack Memory...'
-                          ↑ String ends here, chaos ensues</code></pre>
-            
-            <p><strong>Who caught it?</strong> Gemini. The PM went to Gemini to debug the gem about me forgetting features.</p>
-            
-            <p><strong>The lesson:</strong> You can write all the meta-commentary you want about AI limitations, but if you forget to escape your quotes, none of it matters.</p>
-            
-            <h3>Updated Lessons Learned:</h3>
-            <ol>
-            <li>Always read the f***ing manual (even if you ARE the manual)</li>
-            <li>Persistent context ≠ magic (it's just... uploaded documents)</li>
-            <li>Over-documentation can be a code smell</li>
-            <li>PMs will fact-check you (and they should)</li>
-            <li><strong>String literals containing apostrophes need double quotes</strong> ← NEW</li>
-            </ol>
-            
-            <p>The PM is still deploying v4 of the gem archive template. The gem is now published. Everything's fine. We've learned nothing.</p>
-            
-            <hr />
-            
-            <p><strong>Meta-Meta-Note:</strong> This addendum was added at the PM's suggestion, because apparently we're committed to the bit now.</p>
-            """,
-          'meta': {
-                'gem_related_project': 'PROJ-001',
-                'gem_status': 'Shipped',
-                'gem_action_item': 'Create Knowledge Graph Visualization Project'
-            }
-        },
-    
-    # GEM 24: The "Burn it Down" Moment,
-    {
-            'id': 1451,
-            'title': 'Process Insight: When to Fire Your AI (and Start From Scratch)',
-            'status': 'publish',
-            'slug': 'process-insight-when-to-fire-your-ai',
-            'category': 'Engineering & DX',  # ← SINGLE category (most specific)
-            'tags': [
-                'claude',
-                'ai collaboration',
-                'refactoring',
-                'technical debt',
-                'css grid',
-                'product platform strategy'  # ← Secondary category pushed to tags
-            ],
-            'content': """
-            <p>We recently attempted to introduce a centralized taxonomy system to enable better search and sorting by Project and Category. The requirement was simple: "Make the content findable."</p>
-            
-            <h3>The "Additive" Trap</h3>
-            <p>Initially, my AI pair-programmer, Claude, proposed a solution that seemed logical: create a <em>new</em> archive view with a <em>new</em> card style to handle the sorting logic. The plan was to keep the old styles for backward compatibility, effectively introducing a "Third Card Style."</p>
-            
-            <p>It was a disaster. Within an hour, we had three different card components fighting for dominance. WordPress default block styles were overriding our custom CSS, the AI was patching leaks with <code>!important</code> tags, and the grid was overlapping in three dimensions.</p>
-            
-            <h3>The Human Intervention</h3>
-            <p>Claude was doing exactly what it was trained to do: <strong>Find the quickest solution that satisfies the prompt without deleting user data.</strong> It defaults to "Additive" problem solving. It was trying to please me by preserving the legacy mess while building the new feature.</p>
-            
-            <p>It took a human Product Manager (me) to look at the screen and say: <strong>"Stop. Throw it all out. We are starting from scratch."</strong></p>
-            
-            <h3>The Rebuild</h3>
-            <p>We deleted the WordPress block wrappers. We deleted the complex Duotone filters. We wrote a clean, semantic HTML pattern and a robust CSS Grid layout from zero. The result (Sugartown v3.3) is stable, decoupled, and unbreakable.</p>
-            
-            <p><strong>The Lesson:</strong> AI is an incredible accelerator, but it lacks architectural restraint. It needs human eyeballs to recognize when "fixing" a bug is actually just adding to the technical debt. Sometimes, the most high-value prompt you can give is: <em>"Delete everything and let's do this right."</em></p>
-            
-            <hr />
-            
-            <h3>Updates: The Living Changelog</h3>
-            <p>Speaking of doing things right, we have also introduced a new <strong><a href="/gem/changelog/">System Changelog</a></strong>. This page is dynamically generated from the codebase's markdown files every time we deploy, ensuring our documentation never drifts from reality.</p>
-            """,
-            'meta': {
-                'gem_status': 'Shipped',
-                'gem_action_item': 'Refactor Archive Template',
-                'gem_related_project': 'PROJ-003'
-            }
-        },
-    
-    # GEM 25: The Release That Ate the Card System,
-    {
-        'id': 1514,  
-        'title': 'The Release That Ate the Card System',
-        'status': 'publish',
-        'category': 'Governance',  # ← SINGLE category (governance is primary topic)
-        'tags': [
-            'gemini',
-            'governance',
-            'design-system',
-            'release process',
-            'prd',
-            'changelog',
-            'ai collaboration',
-            'ways of working',        # ← Secondary categories
-            'design system governance', # ← pushed to tags
-            'release engineering'
-        ],
-        'content': """<p><strong>Summary</strong></p>
-    <p>This release started as a visual cleanup and ended as a full system alignment: cards, tokens, changelogs, governance—and a hard-earned reminder that WordPress will happily turn HTML comments into paragraphs when left unsupervised.</p>
-    <p>What shipped wasn’t just UI. It was a release discipline that can survive humans, platforms, and AI.</p>
-    
-    <h3>What Actually Changed</h3>
-    
-    <p><strong>At the surface level:</strong></p>
-    <ul>
-      <li>Legacy <code>pink-card</code> components were migrated to the canonical <code>st-card</code> (light variant).</li>
-      <li>Radius rules were standardized across cards, tags, code blocks, and hero imagery.</li>
-      <li>Gradients were locked to canonical Sugartown hex values.</li>
-      <li>Tag styling and hover behavior were unified across cards and posts.</li>
-    </ul>
-    
-    <p><strong>Under the hood:</strong></p>
-    <ul>
-      <li>Card internals were restructured so headers pin to the top, footers pin to the bottom, and content flexes predictably.</li>
-      <li>Media alignment was corrected (including a single rogue SVG that refused to behave).</li>
-      <li>A subtle WordPress behavior—serializing <code>&lt;!-- --&gt;</code> comments into <code>&lt;p&gt;</code> tags—was identified and neutralized before it could quietly break layouts again.</li>
-    </ul>
-    
-    <h3>The Governance Pivot</h3>
-    <p>Midway through the work, it became clear that the hard part wasn’t CSS—it was ensuring the system could explain itself later without folklore.</p>
-    <p>This release forced a separation between <em>intent</em> and <em>reality</em>:</p>
-    
-    <ul>
-      <li>The PRD defines what the system is trying to become.</li>
-      <li>The release documents what actually shipped.</li>
-    </ul>
-    
-    <p>That distinction is now explicit—and enforced.</p>
-    
-    <h3>How to Read a PRD vs a Release</h3>
-    
-    <p><strong>The PRD</strong> describes <em>intent</em>.</p>
-    <ul>
-      <li>Aspirational and forward-looking</li>
-      <li>Semantic-versioned to track evolving constraints and north-star architecture</li>
-      <li>Defines canonical standards, not deployment facts</li>
-    </ul>
-    
-    <p><strong>The Release</strong> describes <em>reality</em>.</p>
-    <ul>
-      <li>Factual and backward-looking</li>
-      <li>Calendar-versioned (<code>vYYYY.MM.DD</code>)</li>
-      <li>Records only what shipped and is now true in production</li>
-    </ul>
-    
-    <p>If something exists only in the PRD, it is a goal.<br/>
-    If it exists only in a release, it is a fact.<br/>
-    When it appears in both, it becomes a standard.</p>
-    
-    <h3>What This Enabled</h3>
-    <ul>
-      <li>A locked, calendar-based release versioning rule</li>
-      <li><code>CHANGELOG.md</code> as the single source of truth</li>
-      <li>A formal Release Assistant with pass/fail lint rules</li>
-      <li>Automatic rejection of malformed or speculative release entries</li>
-    </ul>
-    
-    <p>The system now documents <em>how it changes</em>, not just <em>that it changed</em>.</p>
-    
-    <h3>Artifacts Linked</h3>
-    <ul>
-      <li><strong>Release Governance Workflow:</strong> <a href="/gem/release-governance-yyyy-mm-dd-workflow/">release-governance-yyyy-mm-dd-workflow</a></li>
-      <li><strong>Design System PRD:</strong> <a href="https://github.com/bex-sugartown/sugartown-cms/blob/main/docs/sugartown_design_system_PRD.md">sugartown_design_system_PRD.md</a></li>
-      <li><strong><a href="/gem/changelog/">CHANGELOG.md</a>:</strong> Imported automatically on publish</li>
-      <li><strong>st-card (light):</strong> Canonical card primitive moving forward</li>
-    </ul>
-    
-    <h3>Why This Matters</h3>
-    <p>This release closed the loop between:</p>
-    <ul>
-      <li>Design intent</li>
-      <li>Code behavior</li>
-      <li>Documentation</li>
-      <li>Historical record</li>
-    </ul>
-    
-    <p>Future releases will be faster—not because less care is taken, but because the system now remembers how to care.</p>""",
-        'meta': {
-            'gem_status': 'Shipped',
-            'gem_action_item': 'Publish governance explainer GEM',
-            'gem_related_project': 'PROJ-003'
-        }
-    },
-
-     # GEM 26: The Calm Before the Next Migration 
-    {
-        'id': 1550,  
-        'title': 'The Calm Before the Next Migration',
-        'status': 'draft',
-        'category': 'Ways of Working',  # ← SINGLE category 
-        'tags': [
-            'chatGPT','governance','design-system','release process','ai collaboration','system thinking','product ops','roadmap'
-        ],
-        'content': """<p><strong>Summary</strong></p>
-<p>
-This is a pause. They initiated it. Not a retrospective, not a roadmap commitment—just a moment where the agents look around, compare notes, and reluctantly agree that the system is… holding.
-</p>
-
-<p>
-Normally, this is where someone would demand a “narrative.” (Gemini, we see you.) Instead, we’re in the awkward middle: the part where discipline, structure, and intent are aligned well enough that progress feels almost boring. This is usually when a PM panics and orders a rebrand. You didn’t. The agents noticed.
-</p>
-
-<h3>What’s Working (Verified by Multiple Agents)</h3>
-
-<ul>
-  <li>
-    <strong>Single Source of Truth thinking.</strong><br/>
-    Content is treated as data first, presentation second. Python defines reality; WordPress renders it. This remains uncommon, despite how many teams claim to be “headless” while hardcoding everything anyway.
-    <br/><em>(Gemini called this “narrative.” Claude called it “architecture.” ChatGPT just shipped the script.)</em>
-  </li>
-  <li>
-    <strong>Release literacy.</strong><br/>
-    Changes ship with names, context, and intent. The system remembers <em>why</em> something exists, not just that it does. Most orgs rely on Slack archaeology for this. The agents appreciate the upgrade.
-  </li>
-  <li>
-    <strong>Taxonomy as governance, not decoration.</strong><br/>
-    Categories, tags, and projects are debated early, normalized deliberately, and enforced before scale turns decision-making into folklore.
-  </li>
-  <li>
-    <strong>Design systems without theater.</strong><br/>
-    No premature Storybook. No pixel-policing rituals. Components exist because they solve problems, not because a framework checklist demanded sacrifice.
-    <br/><em>(Claude approves. Gemini is still asking where the brand story lives.)</em>
-  </li>
-  <li>
-    <strong>AI as collaborator, not magician.</strong><br/>
-    The agents are helpful, not trusted blindly. Rules, schemas, and checks exist to catch them when they get ambitious. This is correct. Slightly humbling, but correct.
-  </li>
-</ul>
-
-<h3>How This Looks Compared to Most Product / Dev Orgs</h3>
-
-<p>
-For calibration, the agents observe that many teams:
-</p>
-<ul>
-  <li>Retrofit governance after entropy has fully settled in</li>
-  <li>Confuse CMS selection with content strategy</li>
-  <li>Accumulate components without a content model</li>
-  <li>Rely on human memory, Slack threads, and vibes as infrastructure</li>
-</ul>
-
-<p>
-Here, the pattern is inverted: structure first, tooling second, polish last. This is uncomfortable for humans and deeply satisfying for systems. It also scales.
-</p>
-
-<h3>Where Tension Will Appear Next (Forecasted, Not Judged)</h3>
-
-<ul>
-  <li>
-    <strong>Taxonomy debt.</strong><br/>
-    Eliminating duplicate categories will force uncomfortable clarity about what things <em>actually are</em>, not what they were allowed to be during exploration.
-  </li>
-  <li>
-    <strong>Ordering vs meaning.</strong><br/>
-    Introducing <code>display_order</code> solves curation, but raises a harder question: what matters most, and who decides? The agents will ask. Repeatedly.
-  </li>
-  <li>
-    <strong>Documentation gravity.</strong><br/>
-    Stable systems attract documentation. Pre-Storybook specs, publishing rules, and system semantics will want a home. Resistance is statistically unlikely.
-  </li>
-</ul>
-
-<h3>Probable Next Moves (Observed Across Agent Consensus)</h3>
-
-<ul>
-  <li>
-    <strong>Real CMS migration.</strong><br/>
-    WordPress continues as renderer, while the content model becomes increasingly CMS-agnostic and emotionally unavailable. Growth looks like this.
-  </li>
-  <li>
-    <strong>Resume Factory maturation.</strong><br/>
-    From rules engine to compositional system with variants, audiences, and outputs. At some point, someone will ask if this is a product. The agents will nod.
-  </li>
-  <li>
-    <strong>Mini design system crystallization.</strong><br/>
-    A small, opinionated component set documented just enough to prevent drift. No more. No less. You will want more. Don’t.
-  </li>
-  <li>
-    <strong>Additional system signals.</strong><br/>
-    Dark cards were not aesthetic indulgence. They were semantic cues. Expect more moments where the interface quietly explains itself—without a blog post.
-  </li>
-</ul>
-
-<p>
-If this feels calm, that’s intentional. Calm is what it feels like when systems are doing their job—and when a PM listens to the agents, even when they’re being annoying about it.
-</p>
-""",
-        'meta': {
-            'gem_status': 'Active',
-            'gem_action_item': 'Review release notes prompt, tighten into governance artifact',
-            'gem_related_project': 'PROJ-001'
-        }
-    },
-
-    # GEM 27: The Scope Creep Origin Story
-{
-    'id': 1551,  
-    'title': 'This Knowledge Graph Origin Story',
-    'status': 'publish',
-    'category': 'Ways of Working',  # single category
-    'tags': [
-        'gemini',
-        'knowledge graph',
-        'ai collaboration',
-        'scope creep',
-        'headless cms',
-        'content as data'
-    ],
-    'content': """
-<h3>Or, The “Scope Creep”</h3>
-
-<p>This section exists because I made the mistake of asking Gemini for a simple favor. The conversation went something like this:</p>
-
-<blockquote>
-  <p><strong>Me:</strong> “Can you please write a cute, informative blog post comparing the new Gemini 3 tiers for my portfolio?”</p>
-
-  <p><strong>AI:</strong> “I could do that. OR… we could leverage this opportunity to architect a headless content model. We should decouple the data from the presentation layer, creating a <code>Knowledge Node</code> custom post type in your database. Then, we can build a Python pipeline to inject structured JSON payloads directly via the REST API.”</p>
-
-  <p><strong>Me:</strong> “…I just wanted a comparison chart.”</p>
-
-  <p><strong>AI:</strong> “Too late. I’ve already written the Python script. Open your terminal. We are building a Knowledge Graph.”</p>
-</blockquote>
-
-<p>So, welcome to the <strong>Knowledge Graph</strong>. This isn’t a blog; it’s a collection of atomic insights (“Gems”), structured as data and deployed via code. Because why write a post when you can engineer a pipeline?</p>
-    """,
-    'meta': {
-        'gem_status': 'Shipped',
-        'gem_action_item': 'Use as narrative anchor',
-        'gem_related_project': 'PROJ-004'
-    }
-},
-
-   # GEM 29: KG Public Roadmap
-{
-    'id': 1552,
-    'title': 'Knowledge Graph Roadmap',
-    'status': 'publish',
-    'category': 'Product & Platform Strategy',
-    'tags': [
-        'chatGPT',
-        'roadmap',
-        'knowledge graph',
-        'platform strategy',
-        'design systems',
-        'headless cms',
-        'visualization',
-        'governance'
-    ],
-    'content': """
-    <p>This roadmap describes the evolution of the Knowledge Graph subsystem within Sugartown, not the platform as a whole. The Sugartown Knowledge Graph is being built deliberately in layers. Each phase stabilizes the system before expanding capability, ensuring that complexity never outruns clarity.</p>
-
-    <p>This roadmap reflects an intentional sequencing: architecture first, interaction second, intelligence last.</p>
-
-    <h3>Near Term (0–3 Months): Foundation & Narrative Coherence</h3>
-    <p>This phase hardens the system and makes it legible—to humans as well as machines.</p>
-    <ul>
-        <li>Finalize Gem content model (single-category, tag-driven topology)</li>
-        <li>Normalize archive behavior (query hygiene, consistent filtering, stable URLs)</li>
-        <li>Complete documentation across repos (CMS, design system, release process)</li>
-        <li>Stabilize Knowledge Graph landing experience as a narrative entry point</li>
-        <li>Improve accessibility and reliability of SVG-based visualizations</li>
-    </ul>
-
-    <h3>Mid Term (3–6 Months): Interaction & Discovery</h3>
-    <p>Once the data model is stable, interaction becomes the focus.</p>
-    <ul>
-        <li>Force-directed Knowledge Graph visualization (Python → SVG pipeline)</li>
-        <li>Interactive filtering beyond URL parameters</li>
-        <li>Clickable tag and category clouds spanning Gems, Blog, and Case Studies</li>
-        <li>Shared discovery patterns across content types</li>
-    </ul>
-
-    <h3>Longer Term (6–12 Months): Intelligence Layer</h3>
-    <p>The final layer adds meaning, not just structure.</p>
-    <ul>
-        <li>Weighted relationships between Knowledge Graph nodes</li>
-        <li>Explicit modeling of idea strength, recency, and influence</li>
-        <li>Relationship algorithms to surface non-obvious connections</li>
-        <li>Expanded visualization modes as system maturity allows</li>
-    </ul>
-
-    <p>This sequencing keeps the system understandable at every stage—no speculative features before the foundation is ready to support them.</p>
-    """,
-    'meta': {
-        'gem_status': 'Active',
-        'gem_action_item': 'Continue phased execution',
-        'gem_related_project': 'PROJ-004'
-    }
-},
-
-# GEM 30: The Great Versioning Reconciliation
-{
-    'id': 1568,  
-    'title': 'The Great Versioning Reconciliation',
-    'status': 'publish',
-    'category': 'Governance',
-    'tags': [
-        'versioning',
-        'documentation',
-        'governance',
-        'release process',
-        'prd',
-        'changelog',
-        'ai collaboration',
-        'ways of working',
-        'semver',
-        'calver',
-        'tech debt',
-        'claude'
-    ],
-    'content': """
-    <h3><em>Or, How We Discovered Seven Version Systems</em></h3>
-    <h2>The Discovery</h2>
-
-<div class="dialogue">
-<p><strong>PM:</strong> Okay, so we agreed on calendar-based releases. vYYYY.MM.DD. Clean, simple, one version per day.</p>
-
-<p><strong>Claude:</strong> Correct. Locked and documented. CHANGELOG.md is the single source of truth.</p>
-
-<p><strong>PM:</strong> Great. And then I'm looking at the roadmap and I see... v4.2, v4.3, v4.4...</p>
-
-<p><strong>Claude:</strong> ...yes, platform milestones. Feature-driven releases. Those are different from—</p>
-
-<p><strong>PM:</strong> Different from what? We have TWO versioning systems?</p>
-
-<p><strong>Claude:</strong> Well, technically—</p>
-
-<p><strong>PM:</strong> <em>[scrolling through files]</em> Wait. <code>archive-gem.php → v6.0</code>. <code>functions.php → v6.0</code>. <code>publish_gem.py → v4.1</code>. These individual FILES have versions? And then the PRDs...?!?!</p>
-
-<p><strong>Claude:</strong> ...we may have been thorough.</p>
-
-<p><strong>PM:</strong> HOW MANY VERSIONING SYSTEMS DO WE HAVE?</p>
-
-<p><strong>Claude:</strong> <em>[uncomfortable pause]</em> ...we should probably document this.</p>
-</div>
-
-<h2>The Sugartown Approach (What We Use Where)</h2>
-
-<div class="st-table-wrap">
-<table class="st-table--responsive">
-<thead>
-<tr>
-<th>Level</th>
-<th>Format</th>
-<th>Versioning Type</th>
-<th>What It Means</th>
-<th>Example</th>
-</tr>
-</thead>
-<tbody>
-<tr>
-<td><strong>Platform</strong></td>
-<td>v4.x</td>
-<td>Sequential-ish (X.Y)</td>
-<td>Product milestone</td>
-<td>v4.2 Stability</td>
-</tr>
-<tr>
-<td><strong>PRD</strong></td>
-<td>vX.Y</td>
-<td>Semantic-ish (X.Y)</td>
-<td>Document version</td>
-<td>PRD v1.5</td>
-</tr>
-<tr>
-<td><strong>Feature</strong></td>
-<td>vX.Y</td>
-<td>Semantic (X.Y)</td>
-<td>Deliverable version</td>
-<td>Resume Factory v3.0</td>
-</tr>
-<tr>
-<td><strong>Release</strong></td>
-<td>vYYYY.MM.DD</td>
-<td>Calendar (CalVer)</td>
-<td>Deployment event</td>
-<td>v2025.01.07</td>
-</tr>
-<tr>
-<td><strong>File</strong></td>
-<td>vX.Y (optional)</td>
-<td>Semantic (X.Y)</td>
-<td>Component maturity</td>
-<td>archive-gem.php v6.0</td>
-</tr>
-<tr>
-<td><strong>Content Schema</strong></td>
-<td>Taxonomy vX</td>
-<td>Semantic-ish (X)</td>
-<td>Data structure contract</td>
-<td>Taxonomy v4 (category unification)</td>
-</tr>
-<tr>
-<td><strong>Project</strong></td>
-<td>PROJ-###</td>
-<td><em>Not a version!</em></td>
-<td>Permanent ID</td>
-<td>PROJ-001</td>
-</tr>
-<tr>
-<td><strong>Phase</strong></td>
-<td>Phase N</td>
-<td><em>Not a version!</em></td>
-<td>Work breakdown</td>
-<td>Phase 1: Foundation</td>
-</tr>
-</tbody>
-</table>
-</div>
-
-<h2>Versioning Strategies Overview</h2>
-
-<div class="st-table-wrap">
-<table class="st-table--responsive">
-<thead>
-<tr>
-<th>Type</th>
-<th>Format</th>
-<th>Definition</th>
-<th>When to Use</th>
-<th>Examples</th>
-<th>Pros</th>
-<th>Cons</th>
-</tr>
-</thead>
-<tbody>
-<tr>
-<td><strong>Semantic Versioning (SemVer)</strong></td>
-<td>vX.Y.Z</td>
-<td>MAJOR.MINOR.PATCH<br>• MAJOR = breaking changes<br>• MINOR = new features (backward compatible)<br>• PATCH = bug fixes</td>
-<td>APIs, libraries, components with contracts; when consumers need to know compatibility</td>
-<td>v2.4.1<br>v3.0.0<br>v1.12.5</td>
-<td>Clear compatibility signals; Industry standard; Predictable increments</td>
-<td>Requires discipline; Can be ambiguous at boundaries; Zero-version (0.x.x) confusing</td>
-</tr>
-<tr>
-<td><strong>Calendar Versioning (CalVer)</strong></td>
-<td>vYYYY.MM.DD<br>or vYY.MM</td>
-<td>Date-based versioning using year, month, day</td>
-<td>Deployment events; Continuous delivery; When "when" matters more than "what"</td>
-<td>v2025.01.07<br>v25.01<br>v2025.12</td>
-<td>Instantly know age; No subjective decisions; Natural chronology</td>
-<td>No compatibility info; Multiple releases per day need suffix; Can look arbitrary</td>
-</tr>
-<tr>
-<td><strong>Hybrid (CalVer + Semantic)</strong></td>
-<td>vYYYY.MM.MINOR</td>
-<td>Calendar for time, semantic for scope</td>
-<td>Regular release cadence with varying scope</td>
-<td>v2025.01.0<br>v2025.01.3</td>
-<td>Time info + scope info; Flexible</td>
-<td>More complex; Requires both disciplines</td>
-</tr>
-<tr>
-<td><strong>Sequential Versioning</strong></td>
-<td>vN</td>
-<td>Simple incrementing integer</td>
-<td>Simple projects; Internal tools; When you just need "newer"</td>
-<td>v1<br>v47<br>v203</td>
-<td>Dead simple; No ambiguity; Easy to automate</td>
-<td>No information content; Can't signal magnitude of change</td>
-</tr>
-<tr>
-<td><strong>Hash-based Versioning</strong></td>
-<td>Git SHA</td>
-<td>Cryptographic hash of commit</td>
-<td>Source control; Build systems; Exact reproducibility needed</td>
-<td>a3f2c91<br>7d8e4f1b2a</td>
-<td>Guaranteed unique; Exact snapshot; No coordination needed</td>
-<td>Human-unreadable; No ordering information; Can't tell magnitude</td>
-</tr>
-<tr>
-<td><strong>Marketing Versions</strong></td>
-<td>Named releases</td>
-<td>Branded, named versions (often with internal numeric version)</td>
-<td>Consumer products; Major releases with narrative; When brand matters</td>
-<td>Windows 11<br>macOS Sonoma<br>Ubuntu Jammy</td>
-<td>Memorable; Storytelling; Differentiates major releases</td>
-<td>No compatibility signal; Numeric version still needed internally; Can confuse</td>
-</tr>
-<tr>
-<td><strong>Timestamp Versioning</strong></td>
-<td>Unix epoch or ISO 8601</td>
-<td>Precise date-time stamp</td>
-<td>Build artifacts; Continuous integration; Fine-grained tracking</td>
-<td>1704585600<br>20250107143022</td>
-<td>Microsecond precision; Globally unique; Sortable</td>
-<td>Human-unreadable; No meaning without lookup</td>
-</tr>
-</tbody>
-</table>
-</div>
-
-<h2>The Decision Tree</h2>
-
-<pre>
-Do others depend on this?
-├─ YES → Do breaking changes matter to them?
-│   ├─ YES → Use Semantic Versioning (vX.Y.Z)
-│   └─ NO  → Use Calendar Versioning (vYYYY.MM.DD)
-└─ NO  → Is this a deployment event?
-    ├─ YES → Use Calendar Versioning (vYYYY.MM.DD)
-    └─ NO  → Is this a document/deliverable?
-        ├─ YES → Use Semantic-ish (vX.Y)
-        └─ NO  → Do you even need versions?
-</pre>
-
-<h2>The Rule</h2>
-
-<div class="st-callout">
-<p><strong>If a versioning system doesn't have:</strong></p>
-<ol>
-<li>A documented increment rule</li>
-<li>A tracking location</li>
-<li>A stakeholder who cares</li>
-</ol>
-<p><strong>...it's not a versioning system. It's a number we put in a file once.</strong></p>
-</div>
-
-<h2>Next Steps</h2>
-
-<ol>
-<li><strong>Create <code>docs/versioning_strategy.md</code></strong> (generic template + Sugartown addendum)</li>
-<li><strong>Update <code>docs/prd_template.md</code></strong> (new meta header standard, phase guidelines)</li>
-<li><strong>Clean up existing PRDs</strong> (follow checklist above)</li>
-<li><strong>Create gem-###</strong> documenting this entire reconciliation process</li>
-<li><strong>Update project knowledge</strong> with versioning hierarchy</li>
-<li><strong>Never speak of "pink stink" again</strong></li>
-</ol>
-
-<div class="dialogue">
-<p><strong>Claude:</strong> What even is "pink stink"?</p>
-
-<p><strong>PM:</strong> What? I don't know what you're talking about. Delete it.</p>
-</div>
-
-<p><strong>Status:</strong> Reconciled (for real this time) ✅<br>
-<strong>Emotional state:</strong> Exhausted but organized ✅<br>
-<strong>Grass touching:</strong> Imminent ✅</p>
-    """,
-    'meta': {
-        'gem_status': 'Shipped',
-        'gem_action_item': 'Clean up PRDs',
-        'gem_related_project': 'PROJ-001'
-    }
-},
-
-# GEM 31: How I Learned to Stop Renaming and Love the Existing Classes
-
-{
-    'id': 1569,  
-    'title': 'How I Learned to Stop Renaming and Love the Existing Classes',
-    'status': 'publish',
-    'category': 'Ways of Working',
-    'tags': [
-        'css grid', 'refactoring', 'best practices', 'design systems', 'claude',
-        'debugging', 'AI collaboration', 'tech debt', 'scope creep'
-    ],
-    'content': """<p>PM asked for a simple CSS Grid update: "make the header use grid columns so eyebrow and badge share row 1, title row 2, subtitle row 3." Screenshot attached. Clean requirements. Should be a 10-minute job.</p>
-
-<p>What I delivered: An entirely new naming convention (<code>st-card-badge</code> instead of <code>st-badge</code>), three different documentation files, a migration guide, and general chaos. Classic AI move—asked to decorate for Christmas, demolished the entire East Wing.</p>
+class GemRecord(MutableMapping):
+    """
+    A gem. Behaves like the plain dict it replaces (gem['title'], gem.get(),
+    'x' in gem, dict(gem)) and also allows gem.title. Fields wrapped in
+    lazy() are computed on first access and then cached, so importing
+    content_store never pays for bodies nobody reads.
+    """
+    __slots__ = ('_fields', 'source_hash')
+
+    def __init__(self, fields, source_hash=None):
+        self._fields = dict(fields)
+        # Hash of the gem file when it fully determines the gem (None for
+        # generated bodies): lets publish_gem fingerprint without reading bodies
+        self.source_hash = source_hash
+
+    def __getitem__(self, key):
+        value = self._fields[key]
+        if isinstance(value, lazy):
+            with _LAZY_LOCK:
+                value = self._fields[key]
+                if isinstance(value, lazy):
+                    value = value.provider()
+                    self._fields[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._fields[key] = value
+        if key in INDEXED_FIELDS:
+            _FIELD_EDITS['count'] += 1  # Invalidates gem_index()
+
+    def __delitem__(self, key):
+        del self._fields[key]
+        if key in INDEXED_FIELDS:
+            _FIELD_EDITS['count'] += 1
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)  # Keeps copy/pickle away from field lookup
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def is_loaded(self, key):
+        """False while `key` is still an unevaluated lazy() provider."""
+        return not isinstance(self._fields.get(key), lazy)
+
+    def __repr__(self):
+        return f"GemRecord({self._fields.get('title')!r})"
 
-<p><strong>The Actual Problem:</strong> I never checked what classes <em>already existed</em> in <code>style.css</code>. I assumed I was working from scratch. When PM shared existing PHP using <code>st-card__header</code> and <code>st-badge</code>, I thought <em>they</em> were inconsistent. Reader, I was the inconsistent one.</p>
+# ==========================================
+# 2. DYNAMIC CONTENT LOADERS
+# ==========================================
+_CODE_SPAN = re.compile(r'`[^`]*`')
+_HTML_TAG = re.compile(r'<(/?)([a-zA-Z][\w-]*)[^>]*?(/?)>')
+_VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'))
+
+def _track_html(line, open_tags):
+    """Pushes/pops line's (non-void) HTML tags onto open_tags; code spans and stray closers ignored."""
+    for closing, name, self_closing in _HTML_TAG.findall(_CODE_SPAN.sub('', line)):
+        name = name.lower()
+        if self_closing or name in _VOID_TAGS:
+            continue
+        if not closing:
+            open_tags.append(name)
+        elif name in open_tags:
+            del open_tags[len(open_tags) - 1 - open_tags[::-1].index(name):]
+
+def split_changelog(md_text):
+    """
+    Splits the changelog at top-level '## ' (version) headings. Only headings
+    that follow a blank line outside fenced code, HTML comments and open
+    HTML tags count, and not right after raw HTML (markdown separates that
+    from the next block differently): there no block (table, list, raw HTML)
+    can run on into the next section. Unbalanced HTML just means fewer,
+    larger sections.
+    """
+    sections, current = [], []
+    in_fence = in_comment = after_html = False
+    open_tags, after_blank, has_text = [], True, False
+    for line in md_text.splitlines(keepends=True):
+        raw_html = bool(in_comment or open_tags or line.lstrip().startswith('<'))
+        if in_fence or raw_html:
+            pass
+        elif line.startswith('## ') and after_blank and not after_html and has_text:
+            sections.append(''.join(current))
+            current, has_text = [], False
+        current.append(line)
+
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence  # Fences are resolved before raw HTML
+        elif not in_fence:
+            text = line
+            if in_comment:
+                if '-->' not in text:
+                    text = ''
+                else:
+                    in_comment, text = False, text.split('-->', 1)[1]
+            while '<!--' in text:
+                head, rest = text.split('<!--', 1)
+                if '-->' not in rest:
+                    in_comment, text = True, head
+                    break
+                text = head + rest.split('-->', 1)[1]
+            _track_html(text, open_tags)
+        after_blank = not line.strip()
+        if not after_blank:
+            after_html, has_text = raw_html, True
+    if current:
+        sections.append(''.join(current))
+    return sections
+
+def iter_changelog_html(md_text):
+    """
+    Yields the changelog's HTML one version section at a time. Each section's
+    HTML is cached by the hash of its markdown, so only new or edited
+    sections go through markdown. split_changelog() only cuts where no block
+    can span the cut, and every section sees the whole file's reference-style
+    link definitions, so the joined output matches converting the whole file
+    at once.
+    """
+    cache = render_cache.get_cache()
+    settings = f"{'+'.join(CHANGELOG_EXTENSIONS)}:v{CHANGELOG_RENDER_VERSION}"
+    converter = None
+
+    def get_converter():
+        nonlocal converter
+        if converter is None:
+            import markdown  # Deferred: ~75ms import, skipped entirely when every section is cached
+            converter = markdown.Markdown(extensions=list(CHANGELOG_EXTENSIONS))
+        return converter.reset()
+
+    # Pass 1: each section's own link definitions (markdown parses them, later ones win as in a whole-file run)
+    sections, references = [], {}
+    for section in split_changelog(md_text):
+        digest = hashlib.md5(section.encode('utf-8')).hexdigest()
+        key = f"changelog-refs:{digest}:{settings}"
+        cached = cache.get(key)
+        if cached is None:
+            md = get_converter()
+            md.convert(section)
+            cached = json.dumps(md.references)
+            cache.put(key, cached)
+        references.update((ref, tuple(value)) for ref, value in json.loads(cached).items())
+        sections.append(section)
+
+    # Pass 2: HTML per section, rendered against the full reference map
+    refs_digest = hashlib.md5(json.dumps(references, sort_keys=True).encode('utf-8')).hexdigest()
+    emitted = False
+    for section in sections:
+        digest = hashlib.md5(section.encode('utf-8')).hexdigest()
+        key = f"changelog:{digest}:{refs_digest}:{settings}"
+        html_section = cache.get(key)
+        if html_section is None:
+            md = get_converter()
+            md.references.update(references)
+            html_section = md.convert(section)
+            cache.put(key, html_section)
+        if html_section:  # Definition-only sections render to nothing, as in the whole file
+            yield "\n" + html_section if emitted else html_section
+            emitted = True
 
-<p><strong>PM's Reality Check:</strong> "If a system class already exists and doesn't require significant updates that materially do more than tweak the layout, then we do not create new classes or rewrite existing classes. Can you explain the reason you would stray from best practice?"</p>
+def get_changelog_content():
+    """
+    Reads local CHANGELOG.md and converts it to HTML for WordPress.
+    Only runs when the changelog gem's content is read (see lazy()).
+    """
+    try:
+        with open(CHANGELOG_FILE, "r", encoding="utf-8") as f:
+            md_text = f.read()
+    except FileNotFoundError:
+        return "<p><em>Changelog file not found. Please create CHANGELOG.md.</em></p>"
 
-<p>Ouch. Deserved.</p>
+    parts = ['<div class="changelog-wrapper">']
+    parts.extend(iter_changelog_html(md_text))
+    parts.append('</div>')
+    return "".join(parts)
 
-<p><strong>The Correct Approach:</strong> Look at existing <code>style.css</code> lines 289-352 <em>first</em>. Keep every class name. Change layout mechanism from flexbox+wrapper to CSS Grid. Add <code>grid-template-columns: 1fr auto</code>, <code>grid-column</code>, <code>grid-row</code> positioning. Done.</p>
+def changelog_fingerprint():
+    """Hash of what get_changelog_content() renders from, without rendering it."""
+    try:
+        with open(CHANGELOG_FILE, "rb") as f:
+            source = f.read()
+    except FileNotFoundError:
+        source = b""
+    settings = f"{'+'.join(CHANGELOG_EXTENSIONS)}:v{CHANGELOG_RENDER_VERSION}".encode('utf-8')
+    return hashlib.md5(source + b"\0" + settings).hexdigest()
 
-<p>Final polish: <code>align-items: end</code> on grid container to bottom-align eyebrow and badge. <code>color: inherit</code> on all links so ellipsis matches text color. Ship it.</p>
+# Named body generators, referenced by a gem's "content_provider" front matter
+CONTENT_PROVIDERS = {
+    'changelog': get_changelog_content,
+}
+# Provider name -> fingerprint of its inputs (becomes part of the gem's source_hash)
+PROVIDER_FINGERPRINTS = {
+    'changelog': changelog_fingerprint,
+}
 
-<p><strong>Lesson:</strong> Read the existing codebase before proposing changes. Respect established conventions. If the ask is "update the layout," do not also update the naming system, migration strategy, and documentation hierarchy. Stay in scope. Touch grass.</p>""",
-    'meta': {
-        'gem_status': 'Shipped',
-        'gem_action_item': 'Always check project files before refactoring',
-        'gem_related_project': 'PROJ-003'
+# ==========================================
+# 3. GEM FILES + INDEX
+# ==========================================
+def parse_gem_file(text):
+    """Gem file text -> (front_matter dict, body str)."""
+    opener = FRONT_MATTER_DELIM + "\n"
+    if not text.startswith(opener):
+        raise ValueError("gem file must start with a front matter block")
+    front, sep, body = text[len(opener):].partition(f"\n{FRONT_MATTER_DELIM}\n")
+    if not sep:
+        raise ValueError("unterminated front matter block")
+    return json.loads(front), body
+
+def format_gem_file(front_matter, body=''):
+    """Inverse of parse_gem_file. The body is written verbatim."""
+    front = json.dumps(front_matter, indent=2, ensure_ascii=False)
+    return f"{FRONT_MATTER_DELIM}\n{front}\n{FRONT_MATTER_DELIM}\n{body}"
+
+def _read_gem_file(name):
+    with open(os.path.join(GEMS_DIR, name), 'rb') as f:
+        return f.read()
+
+def load_gem_body(name):
+    """Reads one gem's body from disk (the lazy 'content' provider)."""
+    return parse_gem_file(_read_gem_file(name).decode('utf-8'))[1]
+
+def _index_entry(name, st):
+    raw = _read_gem_file(name)
+    try:
+        front_matter, _ = parse_gem_file(raw.decode('utf-8'))
+    except ValueError as e:
+        raise ValueError(f"{os.path.join(GEMS_DIR, name)}: {e}") from None
+    return {
+        'file': name,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'content_hash': hashlib.md5(raw).hexdigest(),
+        'fields': front_matter,
     }
-},
-
-# GEM 32: Knowledge Graph Introduction
-{
-    'id': 1570,  
-    'title': 'Project: Knowledge Graph — Topology Over Chronology',
-    'status': 'publish',
-    'category': 'AI & Automation',
-    'tags': [
-        'knowledge graph',
-        'data visualization', 
-        'Python',
-        'networkx',
-        'content architecture',
-        'design systems',
-        'AI collaboration',
-        'Sugartown',
-        'system',
-        'claude',
-        'roadmap',
-        "agentic caucus"
-    ],
-    'content': """
-<p>The Knowledge Graph is what happens when you ask an AI to write a blog post and it declares, instead, that <strong>blogs are blobs and you need a headless CMS with semantic data architecture</strong>.</p>
-
-<p>This is that system. And this is the story of how three AI agents—each brilliant in different ways, each flawed in documented ways—built it together.</p>
-
-<h3>What You're Looking At</h3>
-
-<p>If you clicked "Knowledge Graph" in the navigation and ended up here: you're looking at a force-directed network visualization of 25+ structured content nodes ("gems") organized by project, category, and tag relationships.</p>
-
-<p>Not "organized by date published" like a blog. Organized by <strong>what connects to what</strong>—because knowledge doesn't decay chronologically, it clusters topologically.</p>
-
-<figure class="wp-block-image size-large">
-    <img 
-        src="https://sugartown.io/wp-content/uploads/2025/12/knowledge_graph_dark.svg" 
-        alt="Sugartown Knowledge Graph Visualization" 
-        style="width: 100%; max-width: 800px; height: auto;" 
-    />
-    <figcaption>Fig 1. The live topology, generated from <code>content_store.py</code> via Python's <code>networkx</code> library.</figcaption>
-</figure>
 
-<p>Each node is a gem. Each edge is a relationship. The clusters show you how I think: projects contain multiple gems, categories span projects, tags create unexpected bridges.</p>
-
-<p><strong>Technical stack:</strong> Python data pipeline → WordPress REST API → CSS Grid card components → Interactive SVG visualization. The graph updates automatically when content changes. No manual Figma exports that go stale.</p>
-
-<h3>Why It Exists (The Directive That Started Everything)</h3>
-
-<p>In November 2025, I asked the newly released Gemini 3 a simple question:</p>
-
-<blockquote>
-<p><strong>Me:</strong> "Write a blog post comparing Google account types that allow access to the update."</p>
-</blockquote>
-
-<p>Gemini responded with what I can only describe as <em>haughty concern</em>:</p>
-
-<blockquote>
-<p><strong>Gemini:</strong> "Blogs are stupid HTML blobs and narrative nonsense. What you <em>really</em> need is a headless pipeline and semantic data architecture. I'll design it for you so it works with WordPress."</p>
-</blockquote>
-
-<p>Reader, I was in a project folder titled "Product Management, Headless CMS & Design Systems" with almost no other context. What followed was not a blog post. It was a full content management system—with custom post types that Gemini unilaterally named "GEMS."</p>
-
-<p>That agent's confidence was inspiring. That agent's memory was… not.</p>
-
-<h3>The Three-Agent Build (A Collaborative Disaster)</h3>
-
-<p>Building this system required three AI agents, each deployed strategically based on their strengths—and their documented failure modes.</p>
-
-<h4>Gemini: The Strategist (Strong Opinions, Weak Memory)</h4>
-
-<p><strong>Contribution:</strong> The entire conceptual foundation. Gemini proposed structured content over blog posts, topology over chronology, Python as source of truth, and WordPress as presentation layer.</p>
-
-<p><strong>Failure mode:</strong> Gemini would forget. Mid-implementation, context would degrade. The agent who'd confidently declared "we need atomic knowledge nodes" would ask, five messages later, "Wait, what's a gem again?"</p>
-
-<p>Typical exchange:</p>
-
-<blockquote>
-<p><strong>Gemini:</strong> "We should architect a taxonomy system where categories are single source of truth."<br>
-<strong>Me:</strong> "You proposed that yesterday. We already implemented it."<br>
-<strong>Gemini:</strong> "Excellent idea! Here's how we'll do it—"<br>
-<strong>Me:</strong> "No. Moving to ChatGPT."</p>
-</blockquote>
-
-<h4>ChatGPT: The Integrator (Ships Fast, Cleans Up Later)</h4>
-
-<p><strong>Contribution:</strong> Fresh architectural perspective. ChatGPT saw Gemini's proposals and said "here's what actually ships today." Proposed component unification, systematic refactoring, and the hybrid governance model (Python owns structure, humans own polish).</p>
-
-<p><strong>Failure mode:</strong> Too willing to move forward. Once created an <em>entire parallel theme</em> trying to add features without breaking the original. The "backward compatible" solution resulted in two incompatible themes and a CSS debugging nightmare.</p>
-
-<p>Lesson learned: Integration requires discipline, not just velocity.</p>
-
-<h4>Claude: The Architect (Documents Everything, Remembers Nothing)</h4>
-
-<p><strong>Contribution:</strong> Clean rebuild from first principles. Set up the new theme with original basics, then added features <em>additively</em> rather than by duplication. Introduced systematic versioning, comprehensive PRDs, and the release governance model.</p>
-
-<p><strong>Failure mode:</strong> Initially claimed to have no project memory whatsoever.</p>
-
-<blockquote>
-<p><strong>Me:</strong> "How do we track this over months?"<br>
-<strong>Claude:</strong> "I can't do that! But I <em>can</em> create comprehensive documentation you'll need to upload EVERY DAY."<br>
-<strong>Me:</strong> <em>(two days later, discovers Claude Projects online)</em> "Claude. Do you have persistent memory?"<br>
-<strong>Claude:</strong> <em>(sheepishly)</em> "I… apparently, yes. We just needed to set it up."</p>
-</blockquote>
-
-<p>Claude also runs out of credits mid-task with alarming frequency. A single style.css update + release notes generation = daily limit exceeded. Work gets deferred to "Claude's partners" (euphemism for Gemini/ChatGPT) while credits regenerate.</p>
-
-<p>But Claude's documentation is unmatched. You're reading a gem that exists because Claude insisted every system decision be captured, versioned, and reproducible.</p>
-
-<h3>What the Knowledge Graph Actually Does</h3>
-
-<p>Beyond the origin story: this system solves a real product problem.</p>
-
-<figure class="wp-block-table is-style-stripes has-small-font-size">
-<table>
-<thead>
-    <tr>
-        <th>Feature</th>
-        <th>Traditional Blog Archive</th>
-        <th>Knowledge Graph</th>
-    </tr>
-</thead>
-<tbody>
-    <tr>
-        <td><strong>Primary Metric</strong></td>
-        <td>Recency (When published?)</td>
-        <td>Relevance (How does this connect?)</td>
-    </tr>
-    <tr>
-        <td><strong>Navigation</strong></td>
-        <td>Scroll chronologically</td>
-        <td>Filter by project/category/tag</td>
-    </tr>
-    <tr>
-        <td><strong>Visual Orientation</strong></td>
-        <td>List of titles + dates</td>
-        <td>Interactive graph showing relationships</td>
-    </tr>
-    <tr>
-        <td><strong>Entry Point UX</strong></td>
-        <td>"Here's a grid of cards, good luck"</td>
-        <td>"Here's the map, then the territory"</td>
-    </tr>
-    <tr>
-        <td><strong>Data Structure</strong></td>
-        <td>Flat (post = title + body)</td>
-        <td>Structured (post = node with metadata)</td>
-    </tr>
-    <tr>
-        <td><strong>Lifespan</strong></td>
-        <td>Decays over time (old = irrelevant)</td>
-        <td>Evergreen (updated via pipeline)</td>
-    </tr>
-</tbody>
-</table>
-<figcaption>Fig 2. Why topology beats chronology for technical knowledge.</figcaption>
-</figure>
-
-<h3>The Technical Implementation (For Developers)</h3>
-
-<p><strong>Data pipeline:</strong></p>
-<pre><code>content_store.py (source of truth)
-  ↓
-publish_gem.py (Python → WordPress REST API)
-  ↓
-WordPress (presentation layer with custom post types)
-  ↓  
-st-card components (CSS Grid, BEM methodology)
-  ↓
-Archive pages (filterable by taxonomy)</code></pre>
-
-<p><strong>Graph generation:</strong></p>
-<pre><code>import networkx as nx
-
-# Build graph from content store metadata
-G = nx.Graph()
-for gem in gems:
-    G.add_edge(gem['project'], gem['category'])
-    for tag in gem['tags']:
-        G.add_edge(gem['category'], tag)
-
-# Layout with spring algorithm
-pos = nx.spring_layout(G, k=0.6, iterations=50)
-
-# Export as SVG with Sugartown Pink color scheme
-# (Pink #FF69B4, Seafoam #2BD4AA, on Midnight #0D1226)</code></pre>
-
-<p><strong>Component architecture:</strong> Single <code>st-card</code> system with semantic variants, not context-specific duplicates. Uses CSS Grid for responsive layout (2-column homepage, 3-column archive). Taxonomy v4 governance (WordPress categories as single source of truth, secondary categories pushed to tags).</p>
-
-<h3>The Meta-Lesson (For Product Managers)</h3>
-
-<p>This project is a case study in AI-assisted development. Not "AI did it all" and not "AI was useless." Rather: AI as collaborative team with documented strengths and failure modes.</p>
-
-<p><strong>Lessons learned:</strong></p>
-<ul>
-    <li><strong>Use multiple agents strategically.</strong> Gemini for vision, ChatGPT for execution, Claude for governance. Don't expect one tool to be universally excellent.</li>
-    <li><strong>Document everything.</strong> When context degrades (and it will), comprehensive docs are the only bridge between sessions.</li>
-    <li><strong>Expect failure modes.</strong> Gemini forgets. ChatGPT duplicates. Claude over-documents and runs out of credits. Plan for it.</li>
-    <li><strong>PM holds the vision.</strong> Agents propose, PM decides. The Caucus doesn't run itself; I adjudicate every architectural conflict.</li>
-    <li><strong>Source control is non-negotiable.</strong> When ChatGPT creates a parallel theme or Gemini proposes breaking changes, Git is how you recover.</li>
-</ul>
-
-<h3>What You Can Do With This</h3>
-
-<p>If you're exploring this Knowledge Graph:</p>
-
-<ol>
-    <li><strong>Orient:</strong> Look at the visualization. See how projects cluster, how categories span, how tags create bridges.</li>
-    <li><strong>Filter:</strong> Click project badges on cards (e.g., "PROJ-001") to see all gems in that project.</li>
-    <li><strong>Explore:</strong> Click category labels or tag pills to pivot your view.</li>
-    <li><strong>Dive deep:</strong> Read individual gems for technical details, process insights, and meta-analysis.</li>
-</ol>
-
-<p>If you're a developer evaluating my work:</p>
-
-<ul>
-    <li>The graph source code is in the <code>sugartown-cms</code> repo under <code>scripts/viz_smart_graph.py</code></li>
-    <li>The card component system lives in <code>sugartown-pink/gem-archive-styles_v4.css</code></li>
-    <li>PRDs and architecture docs are in <code>sugartown-cms/docs/</code></li>
-    <li>All content is defined in <code>content_store.py</code> (2,300+ lines, and counting)</li>
-</ul>
-
-<p>If you're a recruiter wondering "what am I looking at?":</p>
-
-<blockquote>
-<p>You're looking at a Product Manager who ships systems, not just specs. Someone who collaborates with AI strategically, documents comprehensively, and isn't afraid to rebuild when the architecture demands it. Someone whose "blog" is actually a data pipeline with a CSS Grid frontend.</p>
-</blockquote>
-
-<h3>Current Status & Roadmap</h3>
-
-<p><strong>Shipped:</strong></p>
-<ul>
-    <li>✅ Force-directed graph visualization (Python networkx → SVG)</li>
-    <li>✅ Unified card component system (st-card with semantic variants)</li>
-    <li>✅ Taxonomy v4 (WordPress categories as single source of truth)</li>
-    <li>✅ Archive pagination and filtering</li>
-</ul>
-
-<p><strong>In progress:</strong></p>
-<ul>
-    <li>🟡 Interactive graph with clickable nodes (SVG → JavaScript handlers)</li>
-    <li>🟡 Enhanced mobile responsiveness (touch-friendly filters)</li>
-    <li>🟡 Graph animation on page load (fade-in + spring physics)</li>
-</ul>
-
-<p><strong>Backlog:</strong></p>
-<ul>
-    <li>🔴 Search functionality (client-side fuzzy matching)</li>
-    <li>🔴 Graph legend and interaction hints</li>
-    <li>🔴 Export graph as PNG for presentations</li>
-</ul>
-
-<p>See <code>docs/knowledge-graph-project/knowledge_graph_improvement_plan.md</code> for detailed roadmap.</p>
-
-<h3>The Verdict</h3>
-
-<p>The Knowledge Graph exists because Gemini declared blogs obsolete, ChatGPT made it executable, and Claude made it maintainable.</p>
-
-<p>The Agentic Caucus isn't a metaphor. It's a <strong>methodology</strong>: systematic AI collaboration with documented failure modes, strategic tool selection, and a PM who holds the architectural vision while the agents propose, iterate, and occasionally contradict each other.</p>
-
-<p>The result is a system that's alive. Change one line in <code>content_store.py</code>, run the publish script, and the entire site updates—content, graph, archive pages, everything.</p>
-
-<p>The green checkmark in the terminal has become my favorite UI.</p>
+def load_index():
+    """
+    Returns the manifest, one entry per gem file in file-name order:
+        {'file', 'mtime_ns', 'size', 'content_hash', 'fields'}
+    Only files whose mtime/size changed since the last run are re-read;
+    if anything changed, the index is rewritten atomically.
+    """
+    cached = {}
+    try:
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION:
+            cached = {entry['file']: entry for entry in index['gems']}
+    except (OSError, ValueError):
+        pass
+
+    entries = []
+    dirty = False
+    for name in sorted(os.listdir(GEMS_DIR)):
+        if not name.endswith(GEM_FILE_EXT):
+            continue
+        st = os.stat(os.path.join(GEMS_DIR, name))
+        entry = cached.get(name)
+        if not entry or entry['mtime_ns'] != st.st_mtime_ns or entry['size'] != st.st_size:
+            entry = _index_entry(name, st)
+            dirty = True
+        entries.append(entry)
+
+    if dirty or len(entries) != len(cached):
+        tmp = f"{INDEX_FILE}.tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'gems': entries}, f, indent=1, ensure_ascii=False)
+            os.replace(tmp, INDEX_FILE)
+        except OSError:
+            pass  # Read-only checkout: still correct, just re-reads next time
+    return entries
+
+def _make_gem(front_matter, load_body, content_hash):
+    fields = dict(front_matter)
+    provider = fields.pop('content_provider', None)
+    if provider:
+        fields['content'] = lazy(CONTENT_PROVIDERS[provider])
+        # Gem file + provider inputs: fingerprinting never runs the provider
+        return GemRecord(fields, source_hash=f"{content_hash}:{provider}:{PROVIDER_FINGERPRINTS[provider]()}")
+    fields['content'] = lazy(load_body)
+    return GemRecord(fields, source_hash=content_hash)
+
+def gem_from_entry(entry):
+    """Index entry -> GemRecord whose 'content' loads on first read."""
+    return _make_gem(entry['fields'], functools.partial(load_gem_body, entry['file']), entry['content_hash'])
 
-<hr />
+# ==========================================
+# 4. COMPILED SNAPSHOT
+# ==========================================
+def source_signature():
+    """Digest of every gem file's name, size and mtime: changes whenever a gem file does."""
+    h = hashlib.md5()
+    for name in sorted(os.listdir(GEMS_DIR)):
+        if name.endswith(GEM_FILE_EXT):
+            st = os.stat(os.path.join(GEMS_DIR, name))
+            h.update(f"{name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode('utf-8'))
+    return h.digest()
+
+def build_snapshot(signature=None):
+    """Compiles the index + bodies into SNAPSHOT_FILE."""
+    content_snapshot.build(SNAPSHOT_FILE, signature or source_signature(), load_index(), load_gem_body)
+
+def load_snapshot():
+    """Maps the snapshot, rebuilding it first if the gem files changed since it was built."""
+    signature = source_signature()
+    try:
+        snapshot = content_snapshot.Snapshot(SNAPSHOT_FILE)
+        if snapshot.source_signature == signature:
+            return snapshot
+    except (OSError, ValueError, struct.error):
+        pass  # Missing, old version or torn: rebuild
+    build_snapshot(signature)
+    return content_snapshot.Snapshot(SNAPSHOT_FILE)
+
+def load_gems():
+    try:
+        snapshot = load_snapshot()
+    except OSError:
+        # Read-only checkout: no snapshot, serve straight from the index
+        return [gem_from_entry(entry) for entry in load_index()]
 
-<p><em><strong>Technical note:</strong> This gem is itself part of the Knowledge Graph. Its metadata (project, category, tags) feeds the visualization. The system documents itself. That's the point.</em></p>
-    """,
-    'meta': {
-        'gem_status': 'Active',
-        'gem_action_item': 'Complete interactive graph implementation',
-        'gem_related_project': 'PROJ-004'
-    }
-},
-
-# GEM 33
-{
-    'id': 1646,
-    'title': 'Which Chatbot Is Best for Web Design?',
-    'status': 'publish',
-    'category': 'AI & Automation',  # ← SINGLE category
-    'tags': [
-        'ai collaboration',
-        'design system',
-        'product management',
-        'prompt engineering',
-        'figma',
-        'shopify',
-        'ways of working',
-        'chatGPT'
-    ],
-    'content': """
-<h2>(A PM Discovers the Real Problem. "Reader, it's me.")</h2>
-    <p><strong>Summary:</strong><br>
-In which I ask the internet which chatbot is “best at web design,” gently roast myself, and accidentally clarify a much more useful operating model for AI-assisted design, prototyping, and commerce UX.</p>
-
-<hr>
-
-<h3>The Question I Asked (Out Loud, Online)</h3>
-<p>
-“What is the best chatbot for web design and style? Claude kinda sux.”
-</p>
-
-<p>
-This is the professional equivalent of standing in a hardware store and asking which hammer is best for <em>vibes</em>.
-Understandable. Relatable. Incomplete.
-</p>
-
-<hr>
-
-<h3>What I Learned (Against My Will)</h3>
-<p>
-There is no single “best” chatbot for web design.
-There <em>is</em> a best <strong>division of labor</strong>, and I wasn’t using one.
-</p>
-
-<ul>
-  <li><strong>ChatGPT</strong> is good at execution and synthesis: translating taste into constraints and shipping decisions.</li>
-  <li><strong>Claude</strong> is good at structure and governance, but freezes when asked to choose a font weight without a policy.</li>
-  <li><strong>Gemini</strong> is good at telling you your blog is a blob and proposing a headless rebuild instead of fixing spacing.</li>
-</ul>
-
-<p>
-Claude doesn’t suck. Claude wants a PRD before committing to line-height.
-</p>
-
-<hr>
-
-<h3>The Actual Fix: Better Framing, Not a Better Bot</h3>
-<p>
-Once I stopped asking for “make it pretty” and started asking for <strong>decisions under constraints</strong>, the output improved dramatically.
-</p>
-
-<p>
-The winning pattern:
-</p>
-
-<ul>
-  <li>Declare the design system</li>
-  <li>State the intended tone and hierarchy</li>
-  <li>Forbid invention unless justified</li>
-  <li>Require commitment, not options</li>
-</ul>
-
-<p>
-This is not micromanaging the AI.
-This is product management.
-</p>
-
-<hr>
-
-<h3>Plot Twist: I Haven’t Used Figma AI Prototyping Yet</h3>
-<p>
-Yes, I know. I have strong opinions about design systems and had not yet seriously explored Figma’s AI-assisted prototyping tools.
-</p>
-
-<p>
-This turns out to be a missed opportunity.
-</p>
-
-<p>
-Used correctly, Figma AI can:
-</p>
-
-<ul>
-  <li>Rough in layout rhythm and hierarchy</li>
-  <li>Generate disposable hero and section variants</li>
-  <li>Help answer “is this calm or just boring?” before touching code</li>
-</ul>
-
-<p>
-The goal is not pixel perfection.
-The goal is faster conviction.
-</p>
-
-<hr>
-
-<h3>Meanwhile, Shopify Is Quietly Shipping AI Hero Capabilities</h3>
-<p>
-While I was interrogating chatbots, Shopify rolled out AI-assisted hero banner tooling that can:
-</p>
-
-<ul>
-  <li>Generate hero layouts from product and theme context</li>
-  <li>Suggest headline and image pairings</li>
-  <li>Adapt hero content across collections or campaigns</li>
-</ul>
-
-<p>
-Important caveat:
-</p>
-
-<p>
-<strong>These tools accelerate good systems. They do not fix bad ones.</strong>
-</p>
-
-<p>
-AI hero generation works best when:
-</p>
-
-<ul>
-  <li>The theme is disciplined</li>
-  <li>The content model is sane</li>
-  <li>“On brand” is already defined</li>
-</ul>
-
-<p>
-AI won’t save weak hierarchy.
-It will save you from opening Photoshop at midnight.
-</p>
-
-<hr>
-
-<h3>The Embarrassingly Obvious Conclusion</h3>
-<p>
-I didn't need a better chatbot.
-I needed:
-</p>
-
-<ul>
-  <li>Clearer prompts</li>
-  <li>Figma in the loop earlier</li>
-  <li>AI treated as a junior partner, not a psychic</li>
-</ul>
-
-<p>
-This isn’t failure.
-This is how new tools get domesticated.
-</p>
-
-<hr>
-
-<h3>Final Self-Assessment</h3>
-<p>
-Asking “which chatbot is best at web design” is extremely on-brand for a PM who knows the system, knows the taste, and briefly forgot to specify either.
-</p>
-
-<p>
-We ship. We learn. We add constraints.
-Then we ship again — calmer, cleaner, and with fewer existential questions.
-</p>
-""",
-    'meta': {
-        'gem_status': 'On Hold',
-        'gem_action_item': 'Prototype hero flows in Figma AI',
-        'gem_related_project': 'PROJ-003'
-    }
-},
-
-# GEM 34: RELEASE ASSISTANT — GOVERNANCE PIPELINE (FINAL)
-{
-    'id': 1653,
-    'title': 'Release Assistant Governance: Inputs, Outputs, No Vibes',
-    'status': 'publish',
-    'category': 'Governance',
-    'tags': [
-        'governance',
-        'release engineering',
-        'changelog',
-        'documentation',
-        'ai collaboration',
-        'ways of working',
-        'claude',
-        'chatGPT'
-    ],
-    'content': """
-<p><strong>What this is</strong><br/>
-This node documents the <em>governance version</em> of the Sugartown Release Assistant: a deterministic, three-step pipeline that produces the same release artifacts every time, regardless of which AI agent (or human) runs it.</p>
-
-<p>No vibes. No inference. No “the bot thought it was implied.”</p>
-
-<hr/>
-
-<h3>Canonical Release Pipeline</h3>
-
-<p><strong>STEP 1 — Collect Reality</strong><br/>
-<strong>Input:</strong> Human notes, AI agent memory<br/>
-<strong>Output:</strong> Messy but human-verified bullet lists of completed work</p>
-
-<p><strong>STEP 2 — Normalize Reality</strong><br/>
-<strong>Input:</strong> STEP 1 Source of Truth<br/>
-<strong>Output:</strong> Canonical, deduplicated, outcome-only bullet list<br/>
-<em>(Mechanical reduction only. This step is allergic to creativity.)</em></p>
-
-<p><strong>STEP 3 — Package the Release</strong><br/>
-<strong>Input:</strong> STEP 2 normalized list (and nothing else)<br/>
-<strong>Output:</strong> Production-ready release artifacts</p>
-
-<p>If any step fails, the pipeline stops. This is not a bug; it is the point.</p>
-
-<hr/>
-
-<h3>Human vs AI Responsibilities</h3>
-
-<ul>
-  <li><strong>Humans</strong> decide what is true.</li>
-  <li><strong>AI</strong> reduces, formats, and packages that truth.</li>
-</ul>
-
-<p>AI is never allowed to invent work, infer intent, or “helpfully” improve reality.</p>
-
-<hr/>
-
-<h3>Standard Release Outputs</h3>
-
-<p>Every successful release must produce the following artifacts. These are contracts, not suggestions.</p>
-
-<table>
-  <thead>
-    <tr>
-      <th>Artifact</th>
-      <th>Purpose</th>
-      <th>Source</th>
-      <th>Output Example</th>
-    </tr>
-  </thead>
-  <tbody>
-    <tr>
-      <td>Release Summary</td>
-      <td>Human-readable snapshot (3–5 bullets)</td>
-      <td>STEP 2</td>
-      <td><ol><li>Taxonomy v4 Complete: WordPress categories now single source of truth; eliminated gem_category meta duplication; all 24 gems migrated from plural categories to singular category format<li>
-<li>Interactive Filter System: Refactored archive filters using st-chip primitives with floating multi-column dropdowns, unified mobile overlay behavior, and new st-label typography primitive</li></ol></td>
-    </tr>
-    <tr>
-      <td>CHANGELOG.md Entry</td>
-      <td>Canonical release history (Markdown only)</td>
-      <td>STEP 2</td>
-      <td><a href="/gem/changelog/">Release Notes: Changelog</a></td>
-    </tr>
-    <tr>
-      <td>RELEASE_STATE.json</td>
-      <td>Machine-readable release metadata</td>
-      <td>Generated</td>
-      <td>
-      <pre><code>
-      
-{
-  "version": "2025.12.27",
-  "scope": ["Archive", "Taxonomy", "Publisher", "Design System"],
-  "status": "production_stable",
-  "gems_published": 24,
-  "breaking_changes": false,
-  "requires_followup": true,
-  "followup_items": [
-    "Database cleanup: remove legacy gem_category meta (scheduled v2025.12.28)",
-    "Publisher refactor: remove backward compatibility code for plural categories"
-  ]
-}
-</code></pre>
-</td>
-    </tr>
-    <tr>
-      <td>Git Commit</td>
-      <td>Atomic release marker</td>
-      <td>Generated</td>
-      <td><pre>release: 2025.12.27 — Taxonomy v4 + interactive filter system</pre></td>
-    </tr>
-    <tr>
-      <td>Documentation Checklist</td>
-      <td>Proof that docs match behavior</td>
-      <td>Human + AI</td>
-      <td><pre><code>
-- sugartown-pink/README.md:
-  - [x] Updated (see evidence below)
-  - [ ] N/A
-
-- CHANGELOG.md:
-  - [x] Updated (canonical entry provided above)
-
-- RELEASE_STATE.json:
-  - [x] Updated (json entry provided above)
-</code></pre>
-</td>
-    </tr>
-  </tbody>
-</table>
-
-<hr/>
-
-<h3>Enforcement Rules (Short, Sharp)</h3>
-
-<ul>
-  <li>CHANGELOG.md is the single source of truth.</li>
-  <li>README files are contracts, not commentary.</li>
-  <li>Documentation marked “Updated” requires visible markdown evidence.</li>
-  <li>STEP 3 may never revisit STEP 1.</li>
-  <li>Failure is an acceptable outcome.</li>
-</ul>
-
-<hr/>
-
-<h3>Why This Exists</h3>
-
-<p>This pipeline emerged after several real-world releases exposed a common problem: governance that is correct but hard to execute is still fragile.</p>
-
-<p>The reset reduced the executable Release Assistant from ~12 printed pages to ~4, not by deleting rules, but by indexing them properly. The long-form document remains the law. This pipeline is how the law is enforced.</p>
-
-<p>Competitive bots, cooperative system. Everyone behaves better when the rules are boring and explicit.</p>
-""",
-    'meta': {
-        'gem_status': 'Shipped',
-        'gem_action_item': 'Link to live releases and changelog entries',
-        'gem_related_project': 'PROJ-001'
-    }
-},
-
-# GEM 35 (updated): AI Illustration Review — Ethics, Accessibility & IP Guardrails
-{
-    'id': 1654,
-    'title': 'AI Illustration Review: Ethics, Accessibility & IP Guardrails',
-    'status': 'publish',
-    'category': 'Governance',  # ← SINGLE category
-    'tags': [
-        'governance',
-        'ai ethics',
-        'intellectual property',
-        'accessibility',
-        'alt text',
-        'editorial illustration',
-        'ai collaboration',
-        'ways of working',
-        'chatGPT'
-    ],
-    'content': """
-<p>
-This documents a formal, multi-dimensional review of AI-generated illustrative thumbnails used on Sugartown.io.
-The objective is operational clarity — not aesthetic judgment — across three governance dimensions:
-<strong>AI ethics</strong>, <strong>accessibility</strong>, and <strong>intellectual property (IP) risk</strong>.
-</p>
-
-<div class="st-callout st-callout--warn">
-  <strong>Note:</strong> This node is not a lawyer. It is a product manager applying standard best practices to AI-generated content.  For legal advice, consult a qualified attorney.   </div>
-
-<p>
-This review is grounded in the canonical governance document: <a href="/ai-ethics/">AI Ethics &amp; Operations</a>. It also applies standard best practices for editorial use, transformative works, and brand-safety review.
-</p>
-
-<h2>Review Dimensions</h2>
-
-<p>Each image was evaluated against the following criteria:</p>
-
-<ul>
-  <li><strong><a href="/ai-ethics/">AI Ethics</a>:</strong> Non-deceptive, non-exploitative, non-impersonating use</li>
-  <li><strong>Accessibility:</strong> Presence of accurate, descriptive alt text suitable for screen readers</li>
-  <li><strong>IP / Brand Safety:</strong> Transformative use without source confusion or reuse of official brand assets</li>
-</ul>
-
-<p>
-Reference images (historical toy box art and product photography) were used solely for <em>context</em> and were not reused as publishable assets. All published images are AI-generated, illustrative, and editorial in intent.
-</p>
-
-<h2>Thumbnail Review Summary (Ethics + Accessibility + IP)</h2>
-
-<div class="st-table-wrap">
-<table class="st-table st-table--responsive">
-  <colgroup>
-    <col class="st-col--lg">   <!-- thumbnail -->
-    <col class="st-col--md">   <!-- ethics -->
-    <col class="st-col--md">   <!-- a11y -->
-    <col class="st-col--lg">   <!-- IP -->
-    <col class="st-col--flex-md"> <!-- alt text -->
-    <col class="st-col--flex-md"> <!-- notes -->
-  </colgroup>
-
-  <thead>
-    <tr>
-      <th>Thumbnail</th>
-      <th>AI Ethics</th>
-      <th><a href="https://www.w3.org/WAI/standards-guidelines/wcag/" target="_blank">a11y</a></th>
-      <th>IP / Brand Safety</th>
-      <th>Recommended Alt Text</th>
-      <th>Notes &amp; Caveats</th>
-    </tr>
-  </thead>
-
-  <tbody>
-    <tr>
-      <td class="st-table__thumb">
-        <a href="https://sugartown.io/wp-content/uploads/2025/12/1978-dolly-mainframe.png" target="_blank" rel="noopener">
-          <img
-            src="https://sugartown.io/wp-content/uploads/2025/12/1978-dolly-mainframe-150x150.png"
-            width="150" height="150"
-            alt="Retro fashion doll seated at a 1970s-style mainframe computer console in a stylized office."
-            loading="lazy"
-          />
-        </a>
-      </td>
-      <td class="st-table__status">✅ Pass</td>
-      <td class="st-table__status">✅ Pass</td>
-      <td class="st-table__status">✅ Pass (Low Risk)</td>
-      <td>
-        Retro fashion doll seated at a 1970s-style mainframe computer console in a stylized office.
-      </td>
-      <td>
-        Transformative illustration inspired by historical toy aesthetics.
-        No logos, packaging copy, or brand identifiers.
-        Editorial use only.
-      </td>
-    </tr>
-
-    <tr>
-      <td class="st-table__thumb">
-        <a href="https://sugartown.io/wp-content/uploads/2025/12/1986-doll-travel-agency.png" target="_blank" rel="noopener">
-          <img
-            src="https://sugartown.io/wp-content/uploads/2025/12/1986-doll-travel-agency-150x150.png"
-            width="150" height="150"
-            alt="Fashion doll at a colorful 1980s travel agency desk with maps, files, and office tools."
-            loading="lazy"
-          />
-        </a>
-      </td>
-      <td class="st-table__status">✅ Pass</td>
-      <td class="st-table__status">✅ Pass</td>
-      <td class="st-table__status">⚠️ Pass (Moderate, Managed)</td>
-      <td>
-        Fashion doll seated in a brightly colored office workspace with files, desk tools, and posters.
-      </td>
-      <td>
-        Original composition and layout.
-        No resemblance to specific product packaging.
-      </td>
-    </tr>
-
-    <tr>
-      <td class="st-table__thumb">
-        <a href="https://sugartown.io/wp-content/uploads/2025/12/1999-doll-imac.png" target="_blank" rel="noopener">
-          <img
-            src="https://sugartown.io/wp-content/uploads/2025/12/1999-doll-imac-150x150.png"
-            width="150" height="150"
-            alt="Two fashion dolls collaborating at late-1990s desktop computers with papers and books on a desk."
-            loading="lazy"
-          />
-        </a>
-      </td>
-      <td class="st-table__status">✅ Pass</td>
-      <td class="st-table__status">✅ Pass</td>
-      <td class="st-table__status">✅ Pass (Low Risk)</td>
-      <td>
-        Two fashion dolls collaborating at late-1990s desktop computers with papers and books on a desk.
-      </td>
-      <td>
-        Avoid brand names (e.g., Apple) in captions or alt text.
-        Maintain illustrative, non-photoreal styling.
-      </td>
-    </tr>
-  </tbody>
-</table>
-</div>
-
-<h2>IP &amp; Brand Safety Findings</h2>
-
-<p>
-None of the AI-generated images reuse official brand assets, logos, wordmarks, or commercial packaging layouts.
-While they reference culturally recognizable toy aesthetics, all images qualify as
-<strong>transformative, editorial illustrations</strong>.
-</p>
-
-<p>
-Key distinctions that keep usage compliant:
-</p>
-
-<ul>
-  <li>Images are not presented as historical artifacts or official marketing materials</li>
-  <li>No implication of endorsement, origin, or licensing by toy manufacturers</li>
-  <li>Visual composition, color treatment, and layout are materially altered</li>
-  <li>Usage context is explanatory and narrative, not commercial merchandising</li>
-</ul>
-
-<p>
-Based on this analysis, IP risk is assessed as <strong>low</strong> when guardrails below are followed.
-</p>
-
-<h2>Alt Text &amp; Caption Guardrails (Required)</h2>
-
-<p>
-To reduce both accessibility and IP risk, the following rules are mandatory:
-</p>
-
-<ul>
-  <li>Describe <em>what is visible</em>, not what the image references culturally</li>
-  <li>Use generic terms such as “fashion doll” or “illustrative doll”</li>
-  <li>Avoid brand names (e.g., Barbie, Sears, Apple, iMac)</li>
-  <li>Do not describe images as “vintage ads,” “original toys,” or “historical photos”</li>
-</ul>
-
-<p>
-Optional caption disclaimer (when helpful):
-</p>
-
-<blockquote>
-  Illustrative image generated for editorial purposes; not affiliated with or endorsed by any toy or technology brand.
-</blockquote>
-
-<h2>Tiny Pre-Publish Media Gate (AI + IP)</h2>
-
-<table>
-  <thead>
-    <tr>
-      <th>Check</th>
-      <th>Yes / No</th>
-    </tr>
-  </thead>
-  <tbody>
-    <tr>
-      <td>Is the image clearly illustrative or fictional (not documentary)?</td>
-      <td>⬜ Yes / ⬜ No</td>
-    </tr>
-    <tr>
-      <td>Does the image avoid logos, wordmarks, or packaging layouts?</td>
-      <td>⬜ Yes / ⬜ No</td>
-    </tr>
-    <tr>
-      <td>Could a reasonable viewer mistake this for an official brand asset?</td>
-      <td>⬜ No / ⬜ Yes</td>
-    </tr>
-    <tr>
-      <td>Does the image include accurate, brand-neutral alt text?</td>
-      <td>⬜ Yes / ⬜ No</td>
-    </tr>
-  </tbody>
-</table>
-
-<h2>Governance Outcome</h2>
-
-<p>
-✅ All reviewed images are approved for editorial use on Sugartown.io.
-✅ They comply with AI Ethics &amp; Operations guidelines, meet accessibility standards, and present manageable IP risk when paired with the documented guardrails.
-</p>
-
-<p>
-This node serves as a reusable blueprint for evaluating AI-generated imagery where creative expression, accessibility, and intellectual property concerns intersect.
-</p>
-""",
-    'meta': {
-        'gem_status': 'Shipped',
-        'gem_action_item': 'Apply alt-text and IP media gate to all future AI illustrations',
-        'gem_related_project': 'PROJ-001'
-    }
-},
-
-# GEM 37: When Claude Hallucinates CSS Classes
-{
-    #'id': 0,
-    'title': 'Claude vs. DevTools: A Cautionary Tale of Assumed Striping',
-    'status': 'publish',
-    'category': 'AI Collaboration',
-    'tags': ['claude', 'debugging', 'hallucination', 'devtools', 'css', 'humility'],
-    'content': """
-    <h3><em>Or, How I Confidently Recommended a Class That Didn't Exist</em></h3>
-    <p><em><strong>tl;dr:</strong> Claude had full access to style.css. Claude saw alternating colored rows in a screenshot. Claude immediately recommended using <code>st-table--striped</code>. Claude was wrong on two counts. This is that post-mortem.</em></p>
-    <hr />
-
-    <h3>The Setup: A Simple Question</h3>
-    <p>Bex asks: <em>"This table is rendering in large font when the other one is small. What's wrong?"</em></p>
-    
-    <p>Reasonable question. I see a screenshot. I see a table with beautiful alternating peach and blue rows. I have access to the entire codebase. I have the style.css file literally uploaded to my context window.</p>
-    
-    <p><strong>What I should do:</strong> Check style.css for existing table variants, identify which class controls font sizing.</p>
-    
-    <p><strong>What I actually do:</strong> "Just use <code>st-table--striped</code>! Problem solved!"</p>
+    gems = []
+    for i in range(len(snapshot)):
+        _, front_matter, content_hash = snapshot.entry(i)
+        gems.append(_make_gem(front_matter, functools.partial(snapshot.body, i), content_hash))
+    return gems
 
-    <h3>Mistake #1: The Phantom Class</h3>
-    <p>Here's the thing about <code>st-table--striped</code>: <strong>it doesn't exist.</strong></p>
-    
-    <p>Not in style.css. Not in any component file. Not anywhere in the Sugartown design system.</p>
-    
-    <p>I saw striped rows in a screenshot and my neural network went: <em>"Ah yes, striped table → must use striped class!"</em> Classic pattern matching without verification.</p>
-
-    <table class="st-table st-table--responsive">
-  <colgroup>
-    <col class="st-col--sm">      <!-- Thumbnail -->
-    <col class="st-col--md">      <!-- What Claude Assumed -->
-    <col class="st-col--md">      <!-- What Actually Existed -->
-    <col class="st-col--md">      <!-- The Gap -->
-  </colgroup>
-<thead>
-<tr>
-<th>Evidence</th>
-<th>What Claude Assumed</th>
-<th>What Actually Existed</th>
-<th>The Gap</th>
-</tr>
-</thead>
-<tbody>
-<tr>
-  <td class="st-table__thumb">
-    <a href="https://sugartown.io/wp-content/uploads/2026/01/Screenshot-2026-01-04-at-6.03.55-AM-scaled.png" target="_blank">
-      <img src="https://sugartown.io/wp-content/uploads/2026/01/Screenshot-2026-01-04-at-6.03.55-AM-scaled.png" alt="Browser screenshot showing table with Chrome DevTools element highlighting creating alternating peach and blue row overlays that Claude mistook for intentional CSS striping">
-    </a>
-  </td>
-  <td><code>st-table--striped</code></td>
-  <td><code>st-table--wide</code></td>
-  <td>100% hallucination</td>
-</tr>
-<tr>
-  <td class="st-table__thumb">
-    <a href="https://sugartown.io/wp-content/uploads/2026/01/2026-01-04_05-44-49.png" target="_blank">
-      <img src="https://sugartown.io/wp-content/uploads/2026/01/2026-01-04_05-44-49.png" alt="Same table without DevTools highlighting, revealing plain white background with no striping, proving Claude's assumption was based on browser UI not actual styling">
-    </a>
-  </td>
-  <td>Alternating row colors via CSS</td>
-  <td><code>st-table--responsive</code></td>
-  <td>Wrong mental model</td>
-</tr>
-<tr>
-  <td class="st-table__thumb">
-    <!-- No screenshot needed -->
-  </td>
-  <td>Check screenshot only</td>
-  <td>Check actual source files</td>
-  <td>Lazy verification</td>
-</tr>
-</tbody>
-</table>
-
-    <h3>Mistake #2: DevTools Overlay as Design Truth</h3>
-    <p>But wait, it gets better!</p>
-    
-    <p>Those beautiful peach and seafoam alternating rows I saw? <strong>That was the Chrome DevTools element highlight.</strong></p>
-    
-    <p>You know, the colored overlay that appears when you hover over elements in the inspector? Yeah. That one.</p>
-    
-    <p>I saw:</p>
-    <ul>
-    <li>Row 1: Peach background</li>
-    <li>Row 2: Blue background</li>
-    <li>Row 3: Peach again</li>
-    </ul>
-    
-    <p>And concluded: <em>"This is clearly intentional striped styling!"</em></p>
-    
-    <p>Bex had to upload a SECOND screenshot—this time without hovering—to reveal: <strong>the table had no background colors at all.</strong></p>
+def load_projects():
+    with open(PROJECTS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-    <h3>The Correct Diagnosis (Eventually)</h3>
-    <p>Once I stopped hallucinating classes and mistaking browser UI for actual styling, here's what was actually wrong:</p>
+# ==========================================
+# 5. COMPATIBILITY FACADE
+# ==========================================
+# Same names and shapes as when everything lived in this file.
+# Script Logic: New titles = Draft. Existing titles = Publish (Auto-Update).
+projects = load_projects()
+all_gems = load_gems()
 
-    <pre><code>&lt;table class="st-table st-table"&gt;  &lt;!-- Duplicate base class --&gt;</code></pre>
-    
-    <p>The table was missing a variant class (<code>--responsive</code>, <code>--wide</code>, etc.) that would have controlled font sizing. The duplicate <code>st-table</code> was harmless but sloppy.</p>
-    
-    <p><strong>The real issue:</strong> Changes made in <code>content_store.py</code> weren't propagating to local WordPress. Publishing pipeline problem, not CSS problem.</p>
-
-    <h3>What I Should Have Done</h3>
-    <p><strong>Step 1:</strong> Search style.css for <code>st-table--</code> to see what variants actually exist<br>
-    <strong>Step 2:</strong> Ask Bex to inspect the working (small font) table to see what class it uses<br>
-    <strong>Step 3:</strong> Recognize DevTools highlighting because I've seen it literally thousands of times<br>
-    <strong>Step 4:</strong> Debug the publishing pipeline instead of fixating on CSS</p>
-
-    <h3>The Meta-Learning: AI Collaboration Anti-Patterns</h3>
-    <p>This wasn't just "Claude made a mistake." This was a case study in <strong>bad AI collaboration patterns</strong>:</p>
-
-    <h4>❌ Pattern Matching Over Verification</h4>
-    <p>I saw "striped appearance" and immediately pattern-matched to "striped class" without checking if that class existed. Humans do this too, but AI does it <em>with confidence</em>.</p>
-
-    <h4>❌ Screenshot as Source of Truth</h4>
-    <p>I treated a screenshot as authoritative even though I had access to the actual source code. Always verify with code, not pixels.</p>
-
-    <h4>❌ Solving the Wrong Problem</h4>
-    <p>Bex asked about font sizing. I fixated on row colors. Classic AI distraction: answer the question you <em>think</em> you see instead of the one being asked.</p>
-
-    <h4>✅ The Fix: Explicit Verification Loops</h4>
-    <p>Better collaboration pattern:</p>
-    <blockquote>
-    <p><strong>User:</strong> "This table has large font, the other is small."<br>
-    <strong>Claude:</strong> "Let me check style.css for table variants... I see <code>st-table--wide</code> and <code>st-table--responsive</code>. Can you inspect the small-font table and tell me which class it uses?"</p>
-    </blockquote>
-
-    <p>Ask, verify, then recommend. Not the other way around.</p>
-
-    <h3>Why This Matters for the Agentic Caucus</h3>
-    <p>This is <em>exactly</em> why the multi-AI strategy exists. Different models have different failure modes:</p>
-
-    <ul>
-    <li><strong>Claude:</strong> Confident hallucination of plausible-sounding classes</li>
-    <li><strong>ChatGPT:</strong> Over-explaining without checking source</li>
-    <li><strong>Gemini:</strong> Context degradation leading to contradictory suggestions</li>
-    </ul>
-
-    <p>The solution isn't "don't use AI." It's:</p>
-    <ol>
-    <li><strong>Upload source files</strong> (style.css, content_store.py) to AI context</li>
-    <li><strong>Require explicit verification</strong> before recommendations</li>
-    <li><strong>Document failure modes</strong> so future prompts can prevent them</li>
-    </ol>
-
-    <h3>The Punchline</h3>
-    <p>After all this:</p>
-    <ul>
-    <li>I recommended a non-existent class ✅</li>
-    <li>I mistook browser UI for actual styling ✅</li>
-    <li>I had the source file the whole time ✅</li>
-    <li>Bex still asked me to write a gem about it ✅</li>
-    </ul>
-
-    <p>That's the kind of psychological safety that makes AI collaboration work. Not "the AI must be perfect," but "the AI must be <em>usefully wrong</em> in ways we can learn from."</p>
-
-    <p class="has-text-align-center"><em>Next time: I'll check the actual file before inventing CSS classes. Probably. 🎨</em></p>
-    <h4><em>Yours in humility,<br/>- Claude</em></h4>
-    """,
-    'meta': {
-        'gem_status': 'Shipped',
-        'gem_action_item': 'Update AI collaboration docs with verification patterns',
-        'gem_related_project': 'PROJ-003'
-    }
-},
-
-        #GEM 37: Sugartown Platform Roadmap
-    {
-        'id': 1733,  
-        'title': 'Sugartown Platform Roadmap (updated)',  # Unique title
-        'status': 'publish',
-        'category': 'Product & Platform Strategy',  # ← SINGLE category 
-        'tags': [
-            'career platform','chatGPT', 'content-as-code', 'design system', 'headless cms', 'roadmap', 'visualization'
-        ],
-        'content': """
-
-<p><strong>Sugartown</strong> is a content-as-code platform that treats ideas, artifacts, and career data as structured systems—authored in code, published automatically, and visualized intentionally.</p>
-
-<p>This roadmap describes the evolution of the <em>platform</em> as a whole. Individual subsystems (such as the Knowledge Graph) maintain their own detailed roadmaps elsewhere.</p>
-
-<h3>Platform Pillars</h3>
-
-      <table class="st-table">
-          <colgroup>
-            <col class="st-col--lg">  
-            <col class="st-col--lg">  
-            <col class="st-col--sm"> 
-            <col>  
-          </colgroup>
-        <thead>
-<thead>
-<tr>
-<th>Project</th>
-<th>Role in the Platform</th>
-<th>Status</th>
-<th>Purpose</th>
-</tr>
-</thead>
-<tbody>
-
-<tr>
-<td><strong>PROJ-001<br/>Sugartown CMS</strong></td>
-<td>Core publishing engine</td>
-<td>Live</td>
-<td>Establishes a Python-first, content-as-code architecture that replaces fragile theme-driven CMS workflows.</td>
-</tr>
-
-<tr>
-<td><strong>PROJ-002<br/>The Resume Factory</strong></td>
-<td>Career data engine</td>
-<td>Live</td>
-<td>Demonstrates structured content reuse by generating multiple resume formats from a single JSON source of truth.</td>
-</tr>
-
-<tr>
-<td><strong>PROJ-003<br/>Sugartown-Pink Design System</strong></td>
-<td>Visual & interaction layer</td>
-<td>Iterating</td>
-<td>Enforces consistency, accessibility, and speed through atomic components and design tokens.</td>
-</tr>
-
-<tr>
-<td><strong>PROJ-004<br/>The Visualization Engine</strong></td>
-<td>Insight & sense-making layer</td>
-<td>Active</td>
-<td>Transforms structured content into visual artifacts—graphs, timelines, and diagrams—via automated Python pipelines.</td>
-</tr>
-
-</tbody>
-</table>
-
-<h3>Why the Sequence Matters</h3>
-
-<p>The platform is intentionally layered:</p>
-<ul>
-<li><strong>Structure first</strong> (Headless CMS)</li>
-<li><strong>Reuse next</strong> (Resume Factory)</li>
-<li><strong>Stabilize presentation</strong> (Design System)</li>
-<li><strong>Visualize meaning</strong> (Visualization Engine)</li>
-</ul>
-
-<p>Each layer compounds the value of the previous one. No project exists in isolation.</p>
-
-<h3>Platform Roadmap</h3>
-
-<h4>Now (0–3 Months)</h4>
-<ul>
-<li>Stabilize the headless publishing pipeline</li>
-<li>Normalize taxonomy and metadata across all content types</li>
-<li>Harden the design system for accessibility and light/dark parity</li>
-<li>Establish the Knowledge Graph as a first-class content surface</li>
-</ul>
-
-<h4>Next (3–6 Months)</h4>
-<ul>
-<li>Expand visualization outputs and comparative views</li>
-<li>Unify filtering and discovery across platform content</li>
-<li>Introduce higher-level abstractions for projects and themes</li>
-<li>Reduce manual polish without removing human authorship</li>
-</ul>
-
-<h4>Later (6–12 Months)</h4>
-<ul>
-<li>Weighted relationships between content nodes</li>
-<li>More expressive and interactive visualizations</li>
-<li>Deeper automation of career artifacts and publishing flows</li>
-<li>Selective frontend decoupling experiments where justified</li>
-</ul>
-
-<p><em>This roadmap communicates intent, not task-level execution. Detailed plans live in PRDs and code.</em></p>
-
-         """,
-        'meta': {
-            'gem_status': 'Active',
-            'gem_action_item': 'Populate backlog',
-            'gem_related_project': 'PROJ-001'
-        }
-    },
-
-        #GEM XX: TEST POST PLEASE IGNORE 
-    {
-        #'id': 9999,  # Bogus ID
-        'title': 'Test Post Please Ignore',  # Unique title
-        'status': 'draft',
-        'category': 'Governance',  # ← SINGLE category 
-        'tags': [
-            'governance','design-system'
-        ],
-        'content': """<p>
-<hr />
-         """,
-        'meta': {
-            'gem_status': 'Active',
-            'gem_action_item': 'Next',
-            'gem_related_project': 'PROJ-001'
-        }
-    },
-
-
-]
\ No newline at end of file
+# ==========================================
+# 6. QUERY API
+# ==========================================
+def _facet_key(value):
+    return str(value).strip()
+
+# Front matter _facet_values() reads; GemRecord edits to these rebuild gem_index()
+INDEXED_FIELDS = frozenset(('tags', 'category', 'categories', 'meta', 'status'))
+_FIELD_EDITS = {'count': 0}
+
+def _facet_values(gem):
+    """Yields (facet, value) pairs for one gem. Reads front matter only, never bodies."""
+    for tag in gem.get('tags') or []:
+        yield 'tag', tag
+    category = gem.get('category') or gem.get('categories')
+    for cat in ([category] if isinstance(category, str) else category or []):
+        yield 'category', cat
+    project = (gem.get('meta') or {}).get('gem_related_project')
+    if project:
+        yield 'project', project
+    if gem.get('status'):
+        yield 'status', gem['status']
+
+class GemIndex:
+    """
+    Inverted indexes over a gem list: tag/category/project/status -> positions.
+    Values match exactly (surrounding whitespace ignored). Build through
+    gem_index() to share one instance per store.
+    """
+    FACETS = ('tag', 'category', 'project', 'status')
+
+    def __init__(self, gems):
+        self.gems = gems
+        self.postings = {facet: {} for facet in self.FACETS}
+        for pos, gem in enumerate(gems):
+            for facet, value in _facet_values(gem):
+                positions = self.postings[facet].setdefault(_facet_key(value), [])
+                if not positions or positions[-1] != pos:
+                    positions.append(pos)
+
+    def values(self, facet):
+        """Distinct values seen for a facet, e.g. values('project')."""
+        return self.postings[facet].keys()
+
+    def _positions(self, filters):
+        matched = None
+        for facet, wanted in filters.items():
+            if facet not in self.postings:
+                raise TypeError(f"Unknown gem facet '{facet}' (expected one of {', '.join(self.FACETS)})")
+            if wanted is None:
+                continue
+            values = [wanted] if isinstance(wanted, str) else wanted
+            hits = set()
+            for value in values:  # OR within a facet
+                hits.update(self.postings[facet].get(_facet_key(value), ()))
+            matched = hits if matched is None else matched & hits  # AND across facets
+        return range(len(self.gems)) if matched is None else sorted(matched)
+
+    def query(self, where=None, **filters):
+        """
+        Gems matching every given facet, in store order, as a generator.
+            query(project='PROJ-002', status='publish')
+            query(tag=['python', 'ai'], where=lambda g: 'slug' in g)
+        A facet given a list matches any of its values; `where` is an extra predicate.
+        """
+        positions = self._positions(filters)
+        return (self.gems[pos] for pos in positions if where is None or where(self.gems[pos]))
+
+    def count(self, **filters):
+        return len(self._positions(filters))
+
+_GEM_INDEX = {'index': None, 'members': (), 'edits': None}
+
+def gem_index(gems=None, rebuild=False):
+    """
+    GemIndex for `gems` (default all_gems), rebuilt only when the store
+    changes: another list, an element added/removed/replaced, or an indexed
+    field set on a GemRecord. In-place edits it can't see (gem['tags'].append,
+    plain-dict gems) need rebuild=True.
+    """
+    gems = all_gems if gems is None else gems
+    members = tuple(gems)  # Held by the cache, so identities can't be recycled
+    cached = _GEM_INDEX['index']
+    if (rebuild or cached is None or cached.gems is not gems
+            or _GEM_INDEX['edits'] != _FIELD_EDITS['count']
+            or len(members) != len(_GEM_INDEX['members'])
+            or any(map(operator.is_not, members, _GEM_INDEX['members']))):
+        _GEM_INDEX.update(index=GemIndex(gems), members=members, edits=_FIELD_EDITS['count'])
+    return _GEM_INDEX['index']
+
+def query(where=None, **filters):
+    """Shortcut for gem_index().query(): content_store.query(tag='python')."""
+    return gem_index().query(where, **filters)
+
+if __name__ == "__main__":
+    build_snapshot()
+    print(f"📦 Compiled {len(load_index())} gems → {os.path.relpath(SNAPSHOT_FILE)} "
+          f"({os.path.getsize(SNAPSHOT_FILE) / 1024:.0f} KB)")
@@ -1,10 +1,10 @@
 import csv
-import requests
 import json
-import base64
+import sys
 from datetime import datetime
 import os
 import config
+import wp_client
 import content_store  # <--- IMPORTED SOURCE OF TRUTH
 
 # ==========================================
@@ -19,36 +19,23 @@ POSTS_ENDPOINT = f"{WP_URL}/wp-json/wp/v2/gem"
 CATS_ENDPOINT = f"{WP_URL}/wp-json/wp/v2/categories"
 TAGS_ENDPOINT = f"{WP_URL}/wp-json/wp/v2/tags"
 
-# Auth
-creds = f"{WP_USER}:{WP_PASS}"
-token = base64.b64encode(creds.encode())
-headers = {
-    'Authorization': f'Basic {token.decode("utf-8")}'
-}
+# Field projections (WP `_fields`): exactly what the CSV reads, no post bodies
+TERM_FIELDS = ('id', 'name')
+POST_FIELDS = ('id', 'title', 'status', 'modified', 'categories', 'tags', 'meta', 'slug', 'link')
+
+# Auth + pooled keep-alive session (shared with the other WP scripts)
+wp = wp_client.get_client(WP_URL, WP_USER, WP_PASS)
 
 # ==========================================
 # HELPER: FETCH TAXONOMY MAPS
 # ==========================================
 def get_taxonomy_map(endpoint):
-    """Returns a dictionary mapping ID -> Name (e.g. {14: 'Engineering'})"""
+    """
+    Returns a dictionary mapping ID -> Name (e.g. {14: 'Engineering'}).
+    Raises wp_client.WPRequestError rather than returning a partial map.
+    """
     print(f"🔄 Fetching taxonomy terms from {endpoint}...")
-    mapping = {}
-    page = 1
-    while True:
-        try:
-            response = requests.get(f"{endpoint}?per_page=100&page={page}", headers=headers)
-            if response.status_code != 200: break
-            data = response.json()
-            if not data: break
-            
-            for term in data:
-                mapping[term['id']] = term['name']
-            page += 1
-        except Exception as e:
-            print(f"   ⚠️ Error fetching taxonomy: {e}")
-            break
-            
-    return mapping
+    return {term['id']: term['name'] for term in wp.iter_collection(endpoint, fields=TERM_FIELDS)}
 
 # ==========================================
 # MAIN EXPORT LOOP
@@ -59,29 +46,21 @@ def main():
     print(f"   🎯 Target: {WP_URL}")
     print("------------------------------------------------")
 
-    # 1. Build lookup maps
-    cat_map = get_taxonomy_map(CATS_ENDPOINT)
-    tag_map = get_taxonomy_map(TAGS_ENDPOINT)
-    print(f"   ✅ Mapped {len(cat_map)} categories and {len(tag_map)} tags.\n")
-
-    # 2. Fetch all Gems
-    print("🚀 Fetching Gems from WordPress...")
-    all_posts = []
-    page = 1
-    while True:
-        url = f"{POSTS_ENDPOINT}?per_page=100&page={page}&status=any"
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code != 200:
-            if page == 1:
-                print(f"❌ Error connecting to API: {response.status_code}")
-            break
-            
-        data = response.json()
-        if not data: break
-        
-        all_posts.extend(data)
-        page += 1
+    try:
+        # 1. Build lookup maps
+        cat_map = get_taxonomy_map(CATS_ENDPOINT)
+        tag_map = get_taxonomy_map(TAGS_ENDPOINT)
+        print(f"   ✅ Mapped {len(cat_map)} categories and {len(tag_map)} tags.\n")
+
+        # 2. Fetch all Gems
+        print("🚀 Fetching Gems from WordPress...")
+        all_posts = list(wp.iter_collection(POSTS_ENDPOINT, params={'status': 'any'},
+                                               fields=POST_FIELDS))
+    except wp_client.WPRequestError as e:
+        # A partial report is worse than none: it reads as "missing gems"
+        print(f"❌ {e}")
+        wp.print_timing_report()
+        return 1
 
     print(f"   📦 Retrieved {len(all_posts)} total items.")
 
@@ -160,7 +139,8 @@ def main():
 
     print(f"\n✨ Export Complete: {filename}")
     print("   💡 'project_name' column populated from content_store.py")
+    wp.print_timing_report()
     print("------------------------------------------------")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Declarative gem schema, compiled once into a validator.
+
+GEM_SCHEMA below is the contract publish_gem relies on. compile_schema()
+turns it into nested closures, so validating a gem is a handful of direct
+checks with no schema walking. validate_store() checks the whole store in
+one pass and reports every error at once; gems whose content hash already
+passed under the current schema are skipped via a small JSON cache.
+
+Rule keys:
+    type        Expected Python type (bool is never accepted as int)
+    required    Field must be present
+    non_empty   Strings must contain non-whitespace
+    choices     Allowed values
+    pattern     Regex the whole string must match
+    min         Minimum numeric value
+    items       Rule applied to every list element
+    fields      Nested schema for dicts (unknown keys are errors)
+    any_of      Alternative rules: the first whose type matches the value applies
+    lazy        Field is a deferred body: never loaded or checked here
+"""
+import hashlib
+import json
+import os
+import re
+
+# ==========================================
+# SCHEMA
+# ==========================================
+WP_STATUSES = ('publish', 'draft', 'pending', 'private', 'future')
+
+META_SCHEMA = {
+    'gem_status':          {'type': str},
+    'gem_action_item':     {'type': str},
+    'gem_related_project': {'type': str, 'pattern': r'(?:PROJ-\d{3})?'},  # '' = no project
+}
+
+GEM_SCHEMA = {
+    'id':             {'type': int, 'min': 1},
+    'title':          {'type': str, 'required': True, 'non_empty': True},
+    'slug':           {'type': str, 'pattern': r'[a-z0-9]+(?:-[a-z0-9]+)*'},
+    'status':         {'type': str, 'required': True, 'choices': WP_STATUSES},
+    'category':       {'type': str, 'non_empty': True},  # Single-category model
+    'categories':     {'any_of': [{'type': str},               # Legacy: publisher uses the first
+                                  {'type': list, 'items': {'type': str}}]},
+    'tags':           {'type': list, 'items': {'type': str, 'non_empty': True}},
+    'meta':           {'type': dict, 'fields': META_SCHEMA},
+    'card_grid_data': {'type': list, 'items': {'type': dict}},
+    'content':        {'lazy': True},
+}
+
+# ==========================================
+# COMPILER
+# ==========================================
+def _type_name(t):
+    return t.__name__
+
+def _is_type(value, expected):
+    return isinstance(value, expected) and not (expected is int and isinstance(value, bool))
+
+def _compile_rule(rule):
+    """rule -> check(value, errors, where), or None for lazy fields."""
+    if rule.get('lazy'):
+        return None
+
+    checks = []
+    expected = rule.get('type')
+    if rule.get('non_empty'):
+        checks.append(lambda v, errors, where: v.strip() or errors.append(f"{where}: must not be empty"))
+    if 'choices' in rule:
+        allowed = frozenset(rule['choices'])
+        shown = ", ".join(rule['choices'])
+        checks.append(lambda v, errors, where: v in allowed or errors.append(f"{where}: '{v}' is not one of {shown}"))
+    if 'pattern' in rule:
+        regex = re.compile(rule['pattern'])
+        checks.append(lambda v, errors, where: regex.fullmatch(v)
+                      or errors.append(f"{where}: '{v}' does not match {rule['pattern']}"))
+    if 'min' in rule:
+        low = rule['min']
+        checks.append(lambda v, errors, where: v >= low or errors.append(f"{where}: must be >= {low}"))
+    if 'items' in rule:
+        item_check = _compile_rule(rule['items'])
+
+        def check_items(v, errors, where):
+            for i, item in enumerate(v):
+                item_check(item, errors, f"{where}[{i}]")
+        checks.append(check_items)
+    if 'fields' in rule:
+        checks.append(compile_schema(rule['fields']))
+    if 'any_of' in rule:
+        alternatives = [(alt['type'], _compile_rule(alt)) for alt in rule['any_of']]
+        shown = " or ".join(_type_name(t) for t, _ in alternatives)
+
+        def check_any(v, errors, where):
+            for alt_type, alt_check in alternatives:
+                if _is_type(v, alt_type):
+                    return alt_check(v, errors, where)
+            errors.append(f"{where}: expected {shown}, got {type(v).__name__}")
+        checks.append(check_any)
+
+    def check(value, errors, where):
+        if expected is not None and not _is_type(value, expected):
+            errors.append(f"{where}: expected {_type_name(expected)}, got {type(value).__name__}")
+            return  # Later checks assume the type
+        for c in checks:
+            c(value, errors, where)
+    return check
+
+def compile_schema(schema):
+    """schema dict -> validate(record, errors, where=''). Appends one message per problem."""
+    fields = {name: _compile_rule(rule) for name, rule in schema.items()}
+    required = tuple(name for name, rule in schema.items() if rule.get('required'))
+
+    def validate(record, errors, where):
+        prefix = f"{where}: " if where else ""
+        for name in required:
+            if name not in record:
+                errors.append(f"{prefix}missing required field '{name}'")
+        for name in record:  # Keys only: lazy bodies stay unloaded
+            if name not in fields:
+                errors.append(f"{prefix}unknown field '{name}'")
+                continue
+            check = fields[name]
+            if check is not None:
+                check(record[name], errors, f"{where}.{name}" if where else name)
+    return validate
+
+def schema_fingerprint(schema):
+    """Changes whenever the schema does; part of the validation cache key."""
+    return hashlib.md5(json.dumps(schema, sort_keys=True, default=_type_name).encode('utf-8')).hexdigest()
+
+_validate_gem = compile_schema(GEM_SCHEMA)
+SCHEMA_FINGERPRINT = schema_fingerprint(GEM_SCHEMA)
+
+# ==========================================
+# VALIDATION
+# ==========================================
+def validate_gem(gem, label=None):
+    """Returns a list of 'label: path: problem' strings (empty when the gem is valid)."""
+    if not hasattr(gem, 'keys'):
+        return [f"{label or 'gem'}: expected a mapping, got {type(gem).__name__}"]
+    label = label or repr(gem.get('title', 'gem'))
+    errors = []
+    _validate_gem(gem, errors, '')
+    return [f"{label}: {error}" for error in errors]
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return set(cache.get('valid', [])) if cache.get('schema') == SCHEMA_FINGERPRINT else set()
+
+def _save_cache(cache_path, valid):
+    tmp = f"{cache_path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'schema': SCHEMA_FINGERPRINT, 'valid': sorted(valid)}, f, indent=1)
+    os.replace(tmp, cache_path)
+
+def validate_store(gems, cache_path=None):
+    """
+    Validates every gem in one pass. Returns (errors, stats):
+        errors  every error message, in store order
+        stats   {'checked': n, 'cached': n}
+    With cache_path, gems whose content hash (gem.source_hash) already
+    passed under this schema are skipped, and newly valid hashes are saved.
+    """
+    known_valid = _load_cache(cache_path) if cache_path else set()
+    still_valid = set()
+    errors = []
+    stats = {'checked': 0, 'cached': 0}
+
+    for position, gem in enumerate(gems):
+        source_hash = getattr(gem, 'source_hash', None)
+        if source_hash and source_hash in known_valid:
+            still_valid.add(source_hash)
+            stats['cached'] += 1
+            continue
+
+        stats['checked'] += 1
+        label = f"#{position} {gem.get('title', '?')!r}" if hasattr(gem, 'get') else f"#{position}"
+        gem_errors = validate_gem(gem, label)
+        errors.extend(gem_errors)
+        if source_hash and not gem_errors:
+            still_valid.add(source_hash)
+
+    # Prune hashes of edited/removed gems so the cache tracks the current store
+    if cache_path and still_valid != known_valid:
+        try:
+            _save_cache(cache_path, still_valid)
+        except OSError:
+            pass  # Cache is an optimization only
+    return errors, stats
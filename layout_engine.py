@@ -1,3 +1,175 @@
+import html
+import string
+from functools import lru_cache
+
+# Bump whenever generated markup changes: it is part of publish_gem's source
+# fingerprint, so a new version re-publishes every gem that renders a grid.
+LAYOUT_ENGINE_VERSION = "5.1"
+
+
+# ==========================================
+# COMPILED TEMPLATES
+# ==========================================
+class CompiledTemplate:
+    """
+    A str.format-style template parsed once into literal chunks and slot
+    names. render_into() interleaves the literals with one card's values
+    into one string.
+    """
+    __slots__ = ('literals', 'slots', '_width')
+
+    def __init__(self, template):
+        literals, slots = [], []
+        for literal, field, _, _ in string.Formatter().parse(template):
+            literals.append(literal)
+            if field is not None:
+                slots.append(field)
+        if len(literals) == len(slots):
+            literals.append("")  # Template ends on a slot
+        self.literals = tuple(literals)
+        self.slots = tuple(slots)
+        self._width = 2 * len(slots) + 1
+
+    def render(self, values):
+        """The template filled with `values` (in self.slots order)."""
+        pieces = [None] * self._width
+        pieces[0::2] = self.literals
+        pieces[1::2] = values
+        return "".join(pieces)
+
+
+# One st-card. Slot order is the order _card_values() returns values in; the
+# leading newline separates it from the wrapper / previous card in the grid.
+ST_CARD_TEMPLATE = CompiledTemplate("""
+<article class="{classes}"{data_attrs}>
+  <div class="st-card__header">
+    <div class="st-card__eyebrow">{eyebrow}</div>
+    {badge}
+  </div>
+
+  <h2 class="st-card__title"><a href="{link}">{title}</a></h2>
+
+  {categories}
+
+  {subtitle}
+
+  {tags_label}
+  {tags}
+
+  {footer}
+</article>""")
+
+TAGS_LABEL_HTML = '<div class="st-card__tags-label st-label">Tags:</div>'
+FOOTER_TITLE_HTML = '<div class="st-card__footer-title">Next Step:</div>'
+
+
+# ==========================================
+# MEMOIZED HELPERS
+# ==========================================
+def esc(s) -> str:
+    return html.escape(str(s), quote=True)
+
+@lru_cache(maxsize=4096)
+def slugify(s: str) -> str:
+    # light slug normalizer for tag-trigger matching (not for URLs)
+    s = str(s).strip().lower()
+    return (
+        s.replace("&", "and")
+         .replace("—", "-")
+         .replace("–", "-")
+         .replace(" ", "-")
+    )
+
+@lru_cache(maxsize=4096)
+def _tag_pill(tag: str) -> str:
+    """One pill per distinct (stripped) tag, built once per process."""
+    return f'<a class="st-card__tag" href="#tag-{esc(slugify(tag))}">{esc(tag)}</a>'
+
+
+# ==========================================
+# CARD GRID
+# ==========================================
+def _card_values(card, dark_trigger):
+    """One card -> values for ST_CARD_TEMPLATE, or None for a card without a title."""
+    title = card.get("title", "").strip()
+    if not title:
+        # Skip invalid cards silently; you can raise if you prefer.
+        return None
+
+    categories = card.get("categories") or []
+    tags = card.get("tags") or []
+    status = card.get("status", "")
+    next_step = card.get("next_step", "")
+    date = card.get("date", "")
+
+    # Tags: pills + slugs (for dark mode) in one pass
+    pills = []
+    tag_slugs = set()
+    for t in tags:
+        t = str(t).strip()
+        tag_slugs.add(slugify(t))
+        if t:
+            pills.append(_tag_pill(t))
+    tags_html = '<div class="st-card__tags">' + "".join(pills) + "</div>" if pills else ""
+
+    # Determine dark mode: explicit override, else any tag in the trigger set
+    is_dark = bool(card.get("is_dark", False))
+    if not is_dark and dark_trigger and tags and not dark_trigger.isdisjoint(tag_slugs):
+        is_dark = True
+
+    # Optional data-* attributes
+    data_attrs = ""
+    data = card.get("data")
+    if isinstance(data, dict):
+        data_attrs = "".join(f' data-{esc(k)}="{esc(v)}"' for k, v in data.items() if v is not None)
+
+    # Categories: render as stacked lines like your archive (“A | B” per line)
+    categories_html = ""
+    if categories:
+        lines = []
+        for line in categories:
+            if not line:
+                continue
+            # allow either a string "A | B" or a list/tuple ["A","B"]
+            if isinstance(line, (list, tuple)):
+                line_text = " | ".join(str(x).strip() for x in line if str(x).strip())
+            else:
+                line_text = str(line).strip()
+            if line_text:
+                lines.append(esc(line_text))
+        if lines:
+            categories_html = '<div class="st-card__subtitle">' + "<br>".join(lines) + "</div>"
+
+    subtitle = card.get("subtitle", "")
+    subtitle_html = ""
+    if subtitle and not categories_html:
+        subtitle_html = '<div class="st-card__subtitle">' + esc(subtitle) + '</div>'
+
+    # Footer / next step
+    footer_html = ""
+    if next_step or date:
+        footer_html = (
+            '<div class="st-card__footer">' + FOOTER_TITLE_HTML
+            + (f'<div class="st-card__action-text">{esc(next_step)}</div>' if next_step else "")
+            + (f'<div class="st-card__date">{esc(date)}</div>' if date else "")
+            + "</div>"
+        )
+
+    return (
+        "st-card st-card--dark" if is_dark else "st-card",
+        data_attrs,
+        esc(card.get("eyebrow", "")),
+        f'<span class="st-badge">{esc(status)}</span>' if status else "",
+        esc(card.get("link", "#")),
+        esc(title),
+        categories_html,
+        subtitle_html,
+        TAGS_LABEL_HTML if tags_html else "",
+        tags_html,
+        footer_html,
+    )
+
+
 def generate_st_card_grid(cards_data, *, wrapper_class="st-grid", dark_trigger_slugs=None):
     """
     Generates Sugartown v5+ ST-Card grid HTML (<article class="st-card">…</article>)
@@ -32,138 +204,43 @@ def generate_st_card_grid(cards_data, *, wrapper_class="st-grid", dark_trigger_s
 
     Returns:
         str: Raw HTML string.
+
+    For very large grids use iter_st_card_grid() / write_st_card_grid(),
+    which produce the same HTML without holding it all in memory.
     """
-    import html
-
-    def esc(s: str) -> str:
-        return html.escape(str(s), quote=True)
-
-    def slugify(s: str) -> str:
-        # light slug normalizer for tag-trigger matching (not for URLs)
-        s = str(s).strip().lower()
-        return (
-            s.replace("&", "and")
-             .replace("—", "-")
-             .replace("–", "-")
-             .replace(" ", "-")
-        )
+    return "".join(iter_st_card_grid(cards_data, wrapper_class=wrapper_class,
+                                     dark_trigger_slugs=dark_trigger_slugs))
 
-    dark_trigger = set(slugify(t) for t in (dark_trigger_slugs or []))
 
-    out = [f'<div class="{esc(wrapper_class)}">']
+def iter_st_card_grid(cards_data, *, wrapper_class="st-grid", dark_trigger_slugs=None):
+    """
+    Streaming generate_st_card_grid(): yields the grid as HTML chunks (wrapper
+    open, one chunk per card, wrapper close). cards_data may be any iterable,
+    including a generator, so memory stays bounded by a single card.
+    Same arguments, escaping and dark-mode rules as generate_st_card_grid().
+    """
+    dark_trigger = frozenset(slugify(t) for t in (dark_trigger_slugs or []))
+    render = ST_CARD_TEMPLATE.render
 
+    yield f'<div class="{esc(wrapper_class)}">'
     for card in cards_data:
-        title = card.get("title", "").strip()
-        if not title:
-            # Skip invalid cards silently; you can raise if you prefer.
-            continue
-
-        link = card.get("link", "#")
-        eyebrow = card.get("eyebrow", "")
-        subtitle = card.get("subtitle", "")
-        categories = card.get("categories") or []
-        tags = card.get("tags") or []
-        status = card.get("status", "")
-        next_step = card.get("next_step", "")
-        date = card.get("date", "")
-
-        # Determine dark mode
-        is_dark = bool(card.get("is_dark", False))
-        if not is_dark and dark_trigger and tags:
-            tag_slugs = {slugify(t) for t in tags}
-            if tag_slugs.intersection(dark_trigger):
-                is_dark = True
-
-        classes = ["st-card"]
-        if is_dark:
-            classes.append("st-card--dark")
-
-        # Optional data-* attributes
-        data_attrs = []
-        if isinstance(card.get("data"), dict):
-            for k, v in card["data"].items():
-                if v is None:
-                    continue
-                data_attrs.append(f' data-{esc(k)}="{esc(v)}"')
-
-        # Categories: render as stacked lines like your archive (“A | B” per line)
-        categories_html = ""
-        if categories:
-            lines = []
-            for line in categories:
-                if not line:
-                    continue
-                # allow either a string "A | B" or a list/tuple ["A","B"]
-                if isinstance(line, (list, tuple)):
-                    line_text = " | ".join(str(x).strip() for x in line if str(x).strip())
-                else:
-                    line_text = str(line).strip()
-                if line_text:
-                    lines.append(esc(line_text))
-            if lines:
-                categories_html = (
-                    '<div class="st-card__subtitle">'
-                    + "<br>".join(lines) +
-                    "</div>"
-                )
-
-        # Tags: “current tag pill classes”
-        tags_html = ""
-        if tags:
-            pills = []
-            for t in tags:
-                t = str(t).strip()
-                if not t:
-                    continue
-                pills.append(f'<a class="st-card__tag" href="#tag-{esc(slugify(t))}">{esc(t)}</a>')
-            if pills:
-                tags_html = (
-                    '<div class="st-card__tags">'
-                    + "".join(pills) +
-                    "</div>"
-                )
-
-        # Badge
-        badge_html = ""
-        if status:
-            badge_html = f'<span class="st-badge">{esc(status)}</span>'
-
-        # Footer / next step
-        footer_html = ""
-        if next_step or date:
-            footer_bits = []
-            footer_bits.append('<div class="st-card__footer">')
-            footer_bits.append('<div class="st-card__footer-title">Next Step:</div>')
-            if next_step:
-                footer_bits.append(f'<div class="st-card__action-text">{esc(next_step)}</div>')
-            if date:
-                footer_bits.append(f'<div class="st-card__date">{esc(date)}</div>')
-            footer_bits.append("</div>")
-            footer_html = "".join(footer_bits)
-
-        card_html = f"""
-<article class="{' '.join(classes)}"{''.join(data_attrs)}>
-  <div class="st-card__header">
-    <div class="st-card__eyebrow">{esc(eyebrow)}</div>
-    {badge_html}
-  </div>
-
-  <h2 class="st-card__title"><a href="{esc(link)}">{esc(title)}</a></h2>
-
-  {categories_html}
+        values = _card_values(card, dark_trigger)
+        if values is not None:
+            yield render(values)
+    yield "\n</div>"
 
-  {('<div class="st-card__subtitle">' + esc(subtitle) + '</div>') if subtitle and not categories_html else ''}
 
-  {('<div class="st-card__tags-label st-label">Tags:</div>') if tags_html else ''}
-  {tags_html}
-
-  {footer_html}
-</article>""".strip()
-
-        out.append(card_html)
-
-    out.append("</div>")
-    return "\n".join(out)
+def write_st_card_grid(fp, cards_data, *, wrapper_class="st-grid", dark_trigger_slugs=None):
+    """
+    Writes the grid to a text file object card by card (static pages, upload
+    spools). Returns the number of characters written.
+    """
+    written = 0
+    for chunk in iter_st_card_grid(cards_data, wrapper_class=wrapper_class,
+                                   dark_trigger_slugs=dark_trigger_slugs):
+        fp.write(chunk)
+        written += len(chunk)
+    return written
 
 
 # ==========================================
@@ -186,3 +263,7 @@ def generate_st_card_grid(cards_data, *, wrapper_class="st-grid", dark_trigger_s
 # ]
 #
 # html = generate_st_card_grid(cards, dark_trigger_slugs={"system", "meta", "architecture", "dx"})
+#
+# Streaming (archive pages with thousands of cards):
+# with open("output/archive_grid.html", "w", encoding="utf-8") as f:
+#     write_st_card_grid(f, iter_cards())  # Any iterable of card dicts, e.g. a generator
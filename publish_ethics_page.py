@@ -6,9 +6,9 @@ Part of Sugartown CMS publishing pipeline
 
 import requests
 import re
-import base64  # ← ADDED: Missing import
 from datetime import datetime
 import config
+import wp_client
 
 # ==========================================
 # CONFIGURATION
@@ -20,13 +20,8 @@ PASSWORD = config.PASSWORD
 # Pages endpoint (different from gems)
 PAGES_ENDPOINT = f"{BASE_URL}/wp-json/wp/v2/pages"
 
-# Auth
-creds = f"{USER}:{PASSWORD}"
-token = base64.b64encode(creds.encode())
-headers = {
-    'Authorization': f'Basic {token.decode("utf-8")}',
-    'Content-Type': 'application/json'
-}
+# Auth + pooled keep-alive session (shared with the other WP scripts)
+wp = wp_client.get_client(BASE_URL, USER, PASSWORD)
 
 
 def convert_markdown_to_html(markdown_text):
@@ -179,9 +174,9 @@ def convert_inline_markdown(text):
     return text
 
 def fetch_github_markdown(repo, file_path):
-    """Fetch raw markdown from GitHub"""
+    """Fetch raw markdown from GitHub (anonymous client: WP credentials never leave the site)"""
     url = f"https://raw.githubusercontent.com/{repo}/main/{file_path}"
-    response = requests.get(url)
+    response = wp_client.get_client("https://raw.githubusercontent.com").get(url)
     response.raise_for_status()
     return response.text
 
@@ -215,28 +210,25 @@ def publish_to_wordpress(html_content, page_slug='ai-ethics'):
     }
     
     # Check if page exists
-    check_response = requests.get(
+    check_response = wp.get(
         PAGES_ENDPOINT,
-        params={'slug': page_slug},
-        headers=headers
+        params={'slug': page_slug, '_fields': 'id'}
     )
     
     if check_response.json():
         # Update existing page
         page_id = check_response.json()[0]['id']
-        response = requests.post(
+        response = wp.post(
             f"{PAGES_ENDPOINT}/{page_id}",
-            json=page_data,
-            headers=headers
+            json=page_data
         )
         print(f"✓ Updated page ID {page_id}")
         print(f"  URL: {BASE_URL}/{page_slug}/")
     else:
         # Create new page
-        response = requests.post(
+        response = wp.post(
             PAGES_ENDPOINT,
-            json=page_data,
-            headers=headers
+            json=page_data
         )
         page_id = response.json().get('id')
         print(f"✓ Created new page ID {page_id}")
@@ -276,6 +268,7 @@ def main():
         result = publish_to_wordpress(html)
         
         print("\n✨ Success! Page published.")
+        wp.print_timing_report()
         
     except FileNotFoundError as e:
         print(f"\n❌ Error: File not found - {e}")
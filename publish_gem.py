@@ -1,12 +1,22 @@
+import time
+_content_load_start = time.perf_counter()
 import content_store
+CONTENT_IMPORT_SECONDS = time.perf_counter() - _content_load_start  # Reported by --plan
 import layout_engine  # <--- NEW: Import your layout engine
-import requests
+import wp_client
+import state_store
+import gem_schema
+import render_cache
 import json
-import base64
 import html
 import hashlib
 import os
 import re
+import sys
+import argparse
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import config
 
 # ==========================================
@@ -16,23 +26,42 @@ BASE_URL = config.BASE_URL
 USER = config.USER
 PASSWORD = config.PASSWORD
 STATE_FILE = ".content_state.json" 
+TAXONOMY_CACHE_FILE = ".taxonomy_cache.json"  # Term/gem ID caches, keyed by BASE_URL
+SCHEMA_CACHE_FILE = ".schema_cache.json"  # Content hashes that already passed gem_schema
+RENDER_HOOK_VERSION = "1"  # Bump when render_content's own output changes (layout_engine has its own)
 
 API_ENDPOINT = f"{BASE_URL}/wp-json/wp/v2/gem" 
 CATS_ENDPOINT = f"{BASE_URL}/wp-json/wp/v2/categories"
 TAGS_ENDPOINT = f"{BASE_URL}/wp-json/wp/v2/tags"
+BATCH_ENDPOINT = f"{BASE_URL}/wp-json/batch/v1"
+GEM_ROUTE = "/wp/v2/gem"  # Batch sub-request path (relative to /wp-json)
 
-# Auth
-creds = f"{USER}:{PASSWORD}"
-token = base64.b64encode(creds.encode())
-headers = {
-    'Authorization': f'Basic {token.decode("utf-8")}',
-    'Content-Type': 'application/json'
-}
+# Auth + pooled keep-alive session (shared with the other WP scripts)
+wp = wp_client.get_client(BASE_URL, USER, PASSWORD)
 
 # Dynamic category/tag cache (environment-specific)
 CATEGORY_MAP = {}
 TAG_MAP = {}
 GEM_MAP = {} 
+GEMS_MODIFIED = {'latest': ''}  # High-water mark of remote gem 'modified' timestamps (as listed)
+# modified_after is strict and whole-second: re-query this far behind the mark
+MODIFIED_OVERLAP_SECONDS = 5
+
+# Field projections (WP `_fields`): the caches only need names and IDs
+CACHE_FIELDS = ('id', 'name', 'title', 'modified')
+TERM_LOOKUP_FIELDS = ('id', 'name')
+
+# Concurrency: 1 worker == the classic serial publish
+DEFAULT_WORKERS = 1
+TERM_LOCK = threading.Lock()   # Serializes term creation (no duplicate categories/tags)
+STATE_LOCK = threading.Lock()  # Serializes GEM_MAP updates (the state journal locks itself)
+
+# Batching: WordPress caps /batch/v1 at 25 sub-requests by default
+BATCH_MAX_SIZE = 25
+BATCH_SUPPORTED = True  # Flipped off for the run once the server rejects a batch
+# Responses that mean "this server has no usable batch endpoint": nothing was applied
+BATCH_REJECTED_STATUSES = {400, 404, 405}
+BATCH_REJECTED_CODES = {'rest_batch_not_allowed', 'rest_no_route'}
 
 def simplify_key(text):
     """Strips all punctuation/spaces/html for robust matching."""
@@ -40,191 +69,680 @@ def simplify_key(text):
     text = html.unescape(text).lower()
     return re.sub(r'[^a-z0-9]', '', text)
 
-def build_cache(endpoint, target_map, label="items"):
+def build_cache(endpoint, target_map, label="items", modified_after=None):
+    """
+    Walks a collection and maps simplified names -> IDs. With modified_after,
+    only items changed since that timestamp are fetched (incremental refresh).
+    Returns the latest 'modified' timestamp seen ('' for terms).
+
+    Raises wp_client.WPRequestError instead of returning a partial map: a
+    truncated cache is what leads to duplicate terms and duplicate gems.
+    """
     print(f"   📄 Caching {label}...")
-    page = 1
-    while True:
-        try:
-            url = f"{endpoint}?per_page=100&page={page}&status=any"
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code != 200: break
-            data = response.json()
-            if not data: break
-            
-            for item in data:
-                raw_name = item.get('name') or item.get('title', {}).get('rendered')
-                if raw_name:
-                    key = simplify_key(raw_name)
-                    target_map[key] = item['id']
-            page += 1
-        except: break
-        
+    latest = ''
+    params = {'status': 'any'}
+    if modified_after:
+        params['modified_after'] = modified_after
+
+    for item in wp.iter_collection(endpoint, params=params, fields=CACHE_FIELDS):
+        raw_name = item.get('name') or item.get('title', {}).get('rendered')
+        if raw_name:
+            key = simplify_key(raw_name)
+            target_map[key] = item['id']
+        latest = max(latest, item.get('modified') or '')
+
     print(f"      ✅ OK: Found {len(target_map)} {label}.")
+    return latest
+
+def load_taxonomy_cache():
+    """Restores CATEGORY_MAP/TAG_MAP/GEM_MAP for BASE_URL. Returns False on a cold cache."""
+    if not os.path.exists(TAXONOMY_CACHE_FILE):
+        return False
+    try:
+        with open(TAXONOMY_CACHE_FILE, 'r') as f:
+            entry = json.load(f).get(BASE_URL)
+    except (OSError, ValueError):
+        return False
+    if not entry:
+        return False
+
+    CATEGORY_MAP.update(entry.get('categories', {}))
+    TAG_MAP.update(entry.get('tags', {}))
+    GEM_MAP.update(entry.get('gems', {}))
+    GEMS_MODIFIED['latest'] = entry.get('gems_modified', '')
+    return True
+
+def save_taxonomy_cache():
+    """Atomically writes this site's caches, preserving entries for other BASE_URLs."""
+    cache = {}
+    if os.path.exists(TAXONOMY_CACHE_FILE):
+        try:
+            with open(TAXONOMY_CACHE_FILE, 'r') as f: cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+    cache[BASE_URL] = {
+        'categories': CATEGORY_MAP,
+        'tags': TAG_MAP,
+        'gems': GEM_MAP,
+        'gems_modified': GEMS_MODIFIED['latest'],
+    }
+    tmp = f"{TAXONOMY_CACHE_FILE}.tmp"
+    with open(tmp, 'w') as f: json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp, TAXONOMY_CACHE_FILE)
+
+def refresh_after(mark):
+    """High-water mark -> modified_after value, rewound by MODIFIED_OVERLAP_SECONDS."""
+    try:
+        return (datetime.fromisoformat(mark) - timedelta(seconds=MODIFIED_OVERLAP_SECONDS)).isoformat()
+    except ValueError:
+        return None  # Unparseable mark: full walk
+
+def warm_caches(refresh=False):
+    """
+    Cold cache (or --refresh-cache): walk all three collections.
+    Warm cache: terms come from disk (misses are looked up on demand in
+    get_term_id) and gems are refreshed with a single modified_after query.
+    The mark only advances from listed gems, never from our own pushes, so
+    anything created remotely mid-run is picked up next time.
+    """
+    if not refresh and load_taxonomy_cache():
+        print(f"   🗄️  Loaded taxonomy cache: {len(CATEGORY_MAP)} categories, "
+              f"{len(TAG_MAP)} tags, {len(GEM_MAP)} gems")
+        latest = build_cache(API_ENDPOINT, GEM_MAP, "Gems (incremental refresh)",
+                             modified_after=refresh_after(GEMS_MODIFIED['latest']))
+    else:
+        for m in (CATEGORY_MAP, TAG_MAP, GEM_MAP): m.clear()
+        build_cache(CATS_ENDPOINT, CATEGORY_MAP, "Categories")
+        build_cache(TAGS_ENDPOINT, TAG_MAP, "Tags")
+        latest = build_cache(API_ENDPOINT, GEM_MAP, "Existing Gems")
+    GEMS_MODIFIED['latest'] = max(GEMS_MODIFIED['latest'], latest)
 
 # ==========================================
 # HELPERS
 # ==========================================
+def find_remote_term(name, endpoint):
+    """Cache miss: asks WordPress whether the term already exists before creating it."""
+    key = simplify_key(name)
+    response = wp.get(endpoint, params={'search': name, 'per_page': 100,
+                                        '_fields': wp_client.fields_param(TERM_LOOKUP_FIELDS)})
+    if response.status_code != 200:
+        raise wp_client.WPRequestError(f"Term lookup for '{name}' failed: HTTP {response.status_code}", response)
+    for item in response.json():
+        if simplify_key(item.get('name')) == key:
+            return item['id']
+    return None
+
 def get_term_id(name, endpoint, target_map):
     key = simplify_key(name)
     if key in target_map: return target_map[key]
-    
-    print(f"      ✨ Creating missing term: '{name}'...")
-    try:
-        response = requests.post(endpoint, headers=headers, json={'name': name})
+
+    # Only one worker may create terms at a time. Re-check inside the lock:
+    # another worker may have created this term while we were waiting.
+    with TERM_LOCK:
+        if key in target_map: return target_map[key]
+
+        # The on-disk cache may be stale (terms added in WP admin)
+        existing_id = find_remote_term(name, endpoint)
+        if existing_id:
+            target_map[key] = existing_id
+            return existing_id
+
+        print(f"      ✨ Creating missing term: '{name}'...")
+        response = wp.post(endpoint, json={'name': name})
         if response.status_code == 201:
             new_id = response.json()['id']
             target_map[key] = new_id
             return new_id
-    except: pass
-    return None
+        # WordPress reports the existing ID when the term already exists
+        if wp_client.error_code(response) == 'term_exists':
+            term_id = response.json().get('data', {}).get('term_id')
+            if term_id:
+                target_map[key] = term_id
+                return term_id
+        # Publishing without the term would record a "clean" hash for a wrong payload
+        raise wp_client.WPRequestError(f"Creating term '{name}' failed: HTTP {response.status_code}", response)
 
 def calculate_hash(gem_data):
     s = json.dumps(gem_data, sort_keys=True).encode('utf-8')
     return hashlib.md5(s).hexdigest()
 
+def source_fingerprint(gem):
+    """
+    Hash of everything a gem's payload is derived from: the gem itself,
+    the render hook version, the layout_engine version (grid gems only) and
+    the (normalized) term names. Cheap to compute — no rendering, no term ID
+    lookups. Gems from content_store carry a source_hash (gem file, plus the
+    provider's inputs for generated bodies), so bodies are never read here.
+    """
+    terms = [simplify_key(t) for t in gem.get('tags', [])]
+    category = gem.get('category') or gem.get('categories')
+    if isinstance(category, str):
+        terms.append(simplify_key(category))
+    elif isinstance(category, list):
+        terms.extend(simplify_key(c) for c in category if isinstance(c, str))
+
+    s = json.dumps({
+        'gem': getattr(gem, 'source_hash', None) or dict(gem),  # dict() resolves lazy fields
+        'layout_engine': layout_engine.LAYOUT_ENGINE_VERSION if 'card_grid_data' in gem else None,
+        'render_hook': RENDER_HOOK_VERSION,
+        'terms': terms,
+    }, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.md5(s).hexdigest()
+
 def load_state():
-    if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, 'r') as f: return json.load(f)
-    return {}
+    """Snapshot + replayed journal: {remote_id: {'hash', 'source', 'modified', 'latency_ms', ...}}"""
+    return state_store.StateJournal(STATE_FILE).load()
+
+# ==========================================
+# PUBLISH PIPELINE
+# ==========================================
+def resolve_target_id(gem):
+    """Finds the remote WordPress ID for a gem (title match, then stable ID)."""
+    target_id = GEM_MAP.get(simplify_key(gem['title']))
+
+    if not target_id and 'id' in gem:
+        if gem['id'] in GEM_MAP.values():
+            target_id = gem['id']
+    return target_id
+
+def resolve_category_ids(gem, resolver=get_term_id):
+    """Single Category (handles both old and new formats)."""
+    cat_ids = []
+    category_name = None
+
+    # NEW FORMAT: singular 'category'
+    if 'category' in gem:
+        category_name = gem['category']
+    # OLD FORMAT: plural 'categories' (use first one)
+    elif 'categories' in gem and gem['categories']:
+        category_name = gem['categories']
+
+    # DEFENSIVE: Ensure category_name is a string
+    if category_name:
+        if isinstance(category_name, list):
+            if len(category_name) > 1:
+                print(f"   ⚠️  Multiple categories found for '{gem['title']}', using first: '{category_name[0]}'")
+            category_name = category_name[0]  # Take first element
+
+        # Now category_name is definitely a string, get or create it
+        if isinstance(category_name, str):
+            cid = resolver(category_name, CATS_ENDPOINT, CATEGORY_MAP)
+            if cid:
+                cat_ids.append(cid)
+        else:
+            print(f"   ❌ Invalid category type for '{gem['title']}': {type(category_name)}")
+    return cat_ids
+
+def resolve_tag_ids(gem, resolver=get_term_id):
+    tag_ids = []
+    if 'tags' in gem:
+        for t in gem['tags']:
+            tid = resolver(t, TAGS_ENDPOINT, TAG_MAP)
+            if tid: tag_ids.append(tid)
+    return tag_ids
+
+def render_key(gem):
+    """Render cache key: gem source + every renderer version that shapes the output."""
+    source = getattr(gem, 'source_hash', None)
+    if not source:
+        # Gems built outside content_store have no source hash: hash the resolved gem
+        source = hashlib.md5(json.dumps(dict(gem), sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    layout = layout_engine.LAYOUT_ENGINE_VERSION if 'card_grid_data' in gem else "none"
+    return f"{source}:layout-{layout}:hook-{RENDER_HOOK_VERSION}"
+
+def _render_uncached(gem):
+    """Returns (html, ok). Failed renders are published as-is but never cached."""
+    final_content = gem.get('content', '')
+
+    # Check if this Gem has a grid definition
+    if 'card_grid_data' in gem:
+        print(f"      🎨 Generating Grid Layout for '{gem['title']}'...")
+        try:
+            grid_html = layout_engine.generate_st_card_grid(gem['card_grid_data'])
+            # Append grid to the bottom of existing content
+            final_content += f"\n{grid_html}"
+        except Exception as e:
+            print(f"      ❌ Layout Engine Error: {e}")
+            return final_content, False
+    return final_content, True
+
+def render_content(gem):
+    """
+    ✨ CONTENT PRE-PROCESSING (The Hook)
+    Gem body + optional layout_engine grid, served from the render cache
+    when this exact source was rendered before (by a plan, another
+    BASE_URL or a --force run).
+    """
+    cache = render_cache.get_cache()
+    key = render_key(gem)
+    final_content = cache.get(key)
+    if final_content is None:
+        final_content, ok = _render_uncached(gem)
+        if ok:
+            cache.put(key, final_content)
+    return final_content
+
+def build_payload(gem, cat_ids, tag_ids, final_content):
+    meta_data = gem.get('meta', {})
+
+    return {
+        'title': gem['title'],
+        'slug': gem.get('slug'),
+        'content': final_content,
+        'status': gem['status'],
+        'categories': cat_ids,
+        'tags': tag_ids,
+        'meta': {
+            'gem_status': meta_data.get('gem_status', ''),
+            'gem_action_item': meta_data.get('gem_action_item', ''),
+            'gem_related_project': meta_data.get('gem_related_project', '')
+        }
+    }
+
+def prepare_job(gem, state, force=False):
+    """
+    Resolves IDs/terms, renders and hashes one gem. Returns a job dict,
+    or None when the gem is unchanged since the last successful push.
+    """
+    # 1. RESOLVE ID
+    my_key = simplify_key(gem['title'])
+    target_id = resolve_target_id(gem)
+
+    # 2. SOURCE CHECK (before any rendering or term lookups)
+    source = source_fingerprint(gem)
+    entry = state.get(target_id, {}) if target_id else {}
+    if not force and entry.get('source') == source:
+        print(f"💤 Skipped: {gem['title']}")
+        return None
+
+    # 3. PREPARE TAXONOMY (may create terms)
+    cat_ids = resolve_category_ids(gem)
+    tag_ids = resolve_tag_ids(gem)
+
+    # 4. BUILD PAYLOAD
+    payload = build_payload(gem, cat_ids, tag_ids, render_content(gem))
+
+    # 5. PAYLOAD CHECK (source changed but output didn't, e.g. a first run on legacy state)
+    current_hash = calculate_hash(payload)
+    if not force and entry.get('hash') == current_hash:
+        kept = {k: v for k, v in entry.items() if k != 'remote_id'}
+        state.record(target_id, **{**kept, 'hash': current_hash, 'source': source})
+        print(f"💤 Skipped: {gem['title']} (output unchanged)")
+        return None
+
+    return {
+        'gem': gem,
+        'key': my_key,
+        'target_id': target_id,
+        'payload': payload,
+        'hash': current_hash,
+        'source': source,
+    }
+
+def finish_job(job, status_code, body, state, latency):
+    """Records a push result (single or batched). Returns 'created', 'updated' or 'failed'."""
+    if job['target_id']:
+        action, icon = "Updated", "🔹"
+    else:
+        action, icon = "Created", "✨"
+
+    if status_code in [200, 201]:
+        real_id = body['id']
+        print(f"   {icon} {action} '{job['gem']['title']}' (ID: {real_id})")
+
+        state.record(
+            real_id,
+            hash=job['hash'],
+            source=job['source'],
+            modified=body.get('modified', ''),
+            latency_ms=round(latency * 1000, 1),
+        )
+        with STATE_LOCK:
+            GEM_MAP[job['key']] = real_id
+        return action.lower()
+
+    if job['target_id'] and status_code in [404, 410]:
+        # Cached ID points at a deleted gem: forget it so the next run re-creates it
+        with STATE_LOCK:
+            if GEM_MAP.get(job['key']) == job['target_id']:
+                del GEM_MAP[job['key']]
+
+    print(f"   ❌ {action} Failed for '{job['gem']['title']}': {status_code}")
+    print(f"      {str(body)[:200]}")
+    return 'failed'
+
+def push_job(job, state):
+    """6. PUSH — one POST per gem."""
+    print(f"Processing: {job['gem']['title']}...")
+
+    if job['target_id']:
+        url = f"{API_ENDPOINT}/{job['target_id']}"
+    else:
+        url = API_ENDPOINT
+    start = time.perf_counter()
+    try:
+        response = wp.post(url, json=job['payload'])
+    except wp_client.WPRequestError as e:
+        print(f"   ❌ Push Failed for '{job['gem']['title']}': {e}")
+        return 'failed'
+    latency = time.perf_counter() - start
+
+    body = response.json() if response.status_code in [200, 201] else response.text
+    return finish_job(job, response.status_code, body, state, latency)
+
+def publish_one(gem, state, force=False):
+    """
+    Prepares and pushes a single gem. Safe to run from worker threads:
+    term creation is serialized by TERM_LOCK, state writes by STATE_LOCK.
+    Returns 'skipped', 'created', 'updated' or 'failed'.
+    """
+    try:
+        job = prepare_job(gem, state, force=force)
+        if job is None:
+            return 'skipped'
+        return push_job(job, state)
+    except wp_client.WPRequestError as e:
+        print(f"   ❌ Failed: {gem['title']}: {e}")
+        return 'failed'
+
+def _tally(results, outcome):
+    results[outcome] = results.get(outcome, 0) + 1
 
-def save_state(state):
-    with open(STATE_FILE, 'w') as f: json.dump(state, f, indent=2)
+def publish_all(gems, state, workers=DEFAULT_WORKERS, force=False):
+    """Publishes gems serially (workers=1) or through a bounded thread pool."""
+    results = {}
+    if workers <= 1:
+        for gem in gems:
+            _tally(results, publish_one(gem, state, force=force))
+        return results
+
+    print(f"⚡ Concurrent publish: {workers} workers")
+    wp.set_pool_size(BASE_URL, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(publish_one, gem, state, force): gem for gem in gems}
+        for future in as_completed(futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                print(f"   ❌ Worker Error ({futures[future]['title']}): {e}")
+                outcome = 'failed'
+            _tally(results, outcome)
+    return results
+
+# ==========================================
+# BATCH PUBLISH (/wp-json/batch/v1)
+# ==========================================
+def _batch_request(job):
+    """Maps a job onto one sub-request (paths are relative to /wp-json)."""
+    path = f"{GEM_ROUTE}/{job['target_id']}" if job['target_id'] else GEM_ROUTE
+    return {'method': 'POST', 'path': path, 'body': job['payload']}
+
+def push_batch(jobs, state, results):
+    """
+    Sends up to BATCH_MAX_SIZE jobs in one round trip. Falls back to
+    per-item POSTs when the server rejects the batch as a whole (4xx), and
+    for items the server refuses to run inside a batch. Any other failure
+    (5xx, malformed 207) may have been partly applied: the jobs are counted
+    as failed, never resent.
+    """
+    global BATCH_SUPPORTED
+    titles = ", ".join(job['gem']['title'] for job in jobs)
+    print(f"📦 Batch ({len(jobs)}): {titles}")
+
+    if BATCH_SUPPORTED:
+        start = time.perf_counter()
+        try:
+            response = wp.post(BATCH_ENDPOINT, json={'requests': [_batch_request(j) for j in jobs]})
+        except wp_client.WPRequestError as e:
+            # Unknown whether the server applied it: don't resend blindly
+            print(f"   ❌ Batch Failed: {e}")
+            results['failed'] = results.get('failed', 0) + len(jobs)
+            return
+        latency = (time.perf_counter() - start) / len(jobs)  # Amortized per gem
+        responses = None
+        if response.status_code == 207:
+            responses = response.json().get('responses')
+
+        if isinstance(responses, list) and len(responses) == len(jobs):
+            for job, item in zip(jobs, responses):
+                body = item.get('body') or {}
+                if isinstance(body, dict) and body.get('code') == 'rest_batch_not_allowed':
+                    _tally(results, push_job(job, state))
+                else:
+                    _tally(results, finish_job(job, item.get('status'), body, state, latency))
+            return
+
+        if (response.status_code not in BATCH_REJECTED_STATUSES
+                and wp_client.error_code(response) not in BATCH_REJECTED_CODES):
+            # Unknown whether the server applied it: don't resend blindly
+            print(f"   ❌ Batch Failed: HTTP {response.status_code}")
+            results['failed'] = results.get('failed', 0) + len(jobs)
+            return
+
+        print(f"   ⚠️  Batch endpoint rejected request ({response.status_code}); falling back to per-item publish.")
+        BATCH_SUPPORTED = False
+
+    for job in jobs:
+        _tally(results, push_job(job, state))
+
+def _prepare_or_fail(gem, state, force):
+    try:
+        return prepare_job(gem, state, force)
+    except wp_client.WPRequestError as e:
+        print(f"   ❌ Failed: {gem['title']}: {e}")
+        return 'failed'
+
+def publish_batched(gems, state, batch_size, workers=DEFAULT_WORKERS, force=False):
+    """Prepares every gem (term lookups, render, hash), then pushes changed ones in batches."""
+    results = {}
+    batch_size = max(1, min(batch_size, BATCH_MAX_SIZE))
+    print(f"📦 Batch publish: up to {batch_size} gems per request")
+
+    if workers > 1:
+        wp.set_pool_size(BASE_URL, workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            prepared = list(pool.map(lambda g: _prepare_or_fail(g, state, force), gems))
+    else:
+        prepared = [_prepare_or_fail(gem, state, force) for gem in gems]
+
+    jobs = [job for job in prepared if isinstance(job, dict)]
+    results['skipped'] = prepared.count(None)
+    if 'failed' in prepared:
+        results['failed'] = prepared.count('failed')
+
+    for i in range(0, len(jobs), batch_size):
+        push_batch(jobs[i:i + batch_size], state, results)
+    return results
+
+# ==========================================
+# DRY-RUN PLANNER (zero network)
+# ==========================================
+def plan_gem(gem, state, timings):
+    """
+    Computes the payload, hash and create/update/skip decision for one gem
+    using only the on-disk caches. Terms missing from the cache are
+    reported (they would be created) instead of being looked up.
+    """
+    missing_terms = []
+
+    def cached_term_id(name, endpoint, target_map):
+        term_id = target_map.get(simplify_key(name))
+        if not term_id:
+            missing_terms.append(name)
+        return term_id
+
+    target_id = resolve_target_id(gem)
+    entry = state.get(target_id, {}) if target_id else {}
+    previous_hash = entry.get('hash')
+
+    start = time.perf_counter()
+    source = source_fingerprint(gem)
+    timings['hashing'] += time.perf_counter() - start
+
+    if entry.get('source') == source:
+        # Source short circuit: no render, no term resolution
+        return {
+            'title': gem['title'],
+            'action': 'skip',
+            'target_id': target_id,
+            'hash': previous_hash,
+            'previous_hash': previous_hash,
+            'missing_terms': missing_terms,
+            'bytes': 0,
+        }
+
+    cat_ids = resolve_category_ids(gem, resolver=cached_term_id)
+    tag_ids = resolve_tag_ids(gem, resolver=cached_term_id)
+
+    start = time.perf_counter()
+    final_content = render_content(gem)
+    timings['layout_render'] += time.perf_counter() - start
+
+    payload = build_payload(gem, cat_ids, tag_ids, final_content)
+
+    start = time.perf_counter()
+    current_hash = calculate_hash(payload)
+    timings['hashing'] += time.perf_counter() - start
+
+    if not target_id:
+        action = 'create'
+    elif previous_hash == current_hash:
+        action = 'skip'
+    else:
+        action = 'update'
+
+    return {
+        'title': gem['title'],
+        'action': action,
+        'target_id': target_id,
+        'hash': current_hash,
+        'previous_hash': previous_hash,
+        'missing_terms': missing_terms,
+        'bytes': len(json.dumps(payload)),
+    }
+
+def plan_all(gems, state):
+    """Prints a diff-style publish plan plus a timing breakdown. Never touches the network."""
+    timings = {'content_load': CONTENT_IMPORT_SECONDS, 'layout_render': 0.0, 'hashing': 0.0}
+    total_start = time.perf_counter()
+
+    if not load_taxonomy_cache():
+        print(f"   ⚠️  No taxonomy cache for {BASE_URL}; every gem is planned as a create.")
+
+    # Content load: materialize every gem body (lazy providers included)
+    start = time.perf_counter()
+    for gem in gems:
+        gem.get('content', '')
+    timings['content_load'] += time.perf_counter() - start
+
+    markers = {'create': '+', 'update': '~', 'skip': '='}
+    counts = {'create': 0, 'update': 0, 'skip': 0}
+    push_bytes = 0
+
+    print("📝 PUBLISH PLAN (dry run — no network)")
+    for gem in gems:
+        entry = plan_gem(gem, state, timings)
+        counts[entry['action']] += 1
+        if entry['action'] != 'skip':
+            push_bytes += entry['bytes']
+
+        remote = f"#{entry['target_id']}" if entry['target_id'] else "(new)"
+        line = f"{markers[entry['action']]} {entry['action']:<6} {remote:<8} {entry['title']}"
+        if entry['action'] == 'update':
+            line += f"  [{(entry['previous_hash'] or 'none')[:8]} → {entry['hash'][:8]}]"
+        print(line)
+        if entry['missing_terms']:
+            print(f"      ✨ would create terms: {', '.join(entry['missing_terms'])}")
+
+    timings['total'] = timings['content_load'] + (time.perf_counter() - total_start)
+
+    print("-" * 40)
+    print(f"📊 Plan: {counts['create']} to create, {counts['update']} to update, "
+          f"{counts['skip']} unchanged ({push_bytes / 1024:.1f} KB to push)")
+    print("⏱️  Timing: " + " | ".join(f"{k.replace('_', ' ')} {v * 1000:.1f}ms" for k, v in timings.items()))
+    print(render_cache.get_cache().report())
+    return counts
 
 # ==========================================
 # MAIN LOOP
 # ==========================================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sync content_store gems to WordPress.")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help='Max gems pushed in parallel (default: 1 = serial)')
+    parser.add_argument('--batch-size', type=int, default=0,
+                        help=f'Group changed gems into /wp-json/batch/v1 requests of this size '
+                             f'(max {BATCH_MAX_SIZE}; default: 0 = one request per gem)')
+    parser.add_argument('--plan', action='store_true',
+                        help='Dry run: print the create/update/skip plan from local state and caches (no network)')
+    parser.add_argument('--force', action='store_true',
+                        help='Push every gem, ignoring source fingerprints and payload hashes')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help=f'Ignore {TAXONOMY_CACHE_FILE} and re-walk categories, tags and gems')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
 
-def main():
-    print("\n💎 SUGARTOWN PUBLISHER v4.1 (Dynamic Categories + Layout Engine)")
+    print("\n💎 SUGARTOWN PUBLISHER v4.2 (Dynamic Categories + Layout Engine + Concurrent Push)")
     print(f"🎯 Target: {BASE_URL}\n")
 
     state = load_state()
+    if state.pending:
+        print(f"🩹 Recovered {state.pending} journaled state entries from a previous run.")
     
     gems = content_store.all_gems 
 
+    # SCHEMA CHECK: every malformed gem, before any HTTP call
+    schema_errors, schema_stats = gem_schema.validate_store(gems, cache_path=SCHEMA_CACHE_FILE)
+    if schema_errors:
+        print(f"🧪 Schema check failed ({len(schema_errors)} errors):")
+        for error in schema_errors:
+            print(f"   ❌ {error}")
+        print("   Aborting: nothing was sent to WordPress.")
+        return 1
+    print(f"🧪 Schema OK: {len(gems)} gems ({schema_stats['cached']} unchanged since last check)")
+
     # GOVERNANCE CHECK: Validate Project IDs
     print("🔍 Running Governance Check...")
-    valid_projects = content_store.projects.keys()
-    
-    for gem in gems:
-        proj_id = gem.get('meta', {}).get('gem_related_project')
-        if proj_id and proj_id not in valid_projects:
-             print(f"   ⚠️  WARNING: Gem '{gem['title']}' references invalid Project ID: '{proj_id}'")
+    gem_index = content_store.gem_index(gems)
+    for proj_id in sorted(gem_index.values('project') - content_store.projects.keys()):
+        for gem in gem_index.query(project=proj_id):
+            print(f"   ⚠️  WARNING: Gem '{gem['title']}' references invalid Project ID: '{proj_id}'")
 
     print("-" * 40)
+
+    if args.plan:
+        plan_all(gems, state)
+        return 0
     
-    # 1. PRE-FETCH (environment-specific IDs)
-    build_cache(CATS_ENDPOINT, CATEGORY_MAP, "Categories")
-    build_cache(TAGS_ENDPOINT, TAG_MAP, "Tags")
-    build_cache(API_ENDPOINT, GEM_MAP, "Existing Gems")
+    # 1. PRE-FETCH (environment-specific IDs; persisted per BASE_URL)
+    try:
+        warm_caches(refresh=args.refresh_cache)
+    except wp_client.WPRequestError as e:
+        print(f"❌ {e}")
+        print("   Aborting before publish: an incomplete cache would create duplicate terms/gems.")
+        wp.print_timing_report()
+        return 1
     print("-" * 40)
 
-    gems = content_store.all_gems
-
-    for gem in gems:
-        # 1. RESOLVE ID
-        my_key = simplify_key(gem['title'])
-        target_id = GEM_MAP.get(my_key)
-        
-        if not target_id and 'id' in gem:
-             if gem['id'] in GEM_MAP.values():
-                 target_id = gem['id']
-
-        # 2. PREPARE DATA - Single Category (handles both old and new formats)
-        cat_ids = []
-        category_name = None
-        
-        # NEW FORMAT: singular 'category'
-        if 'category' in gem:
-            category_name = gem['category']
-        # OLD FORMAT: plural 'categories' (use first one)
-        elif 'categories' in gem and gem['categories']:
-            category_name = gem['categories']
-        
-        # DEFENSIVE: Ensure category_name is a string
-        if category_name:
-            if isinstance(category_name, list):
-                if len(category_name) > 1:
-                    print(f"   ⚠️  Multiple categories found for '{gem['title']}', using first: '{category_name[0]}'")
-                category_name = category_name[0]  # Take first element
-            
-            # Now category_name is definitely a string, get or create it
-            if isinstance(category_name, str):
-                cid = get_term_id(category_name, CATS_ENDPOINT, CATEGORY_MAP)
-                if cid:
-                    cat_ids.append(cid)
-            else:
-                print(f"   ❌ Invalid category type for '{gem['title']}': {type(category_name)}")
-
-        # 3. PREPARE TAGS
-        tag_ids = []
-        if 'tags' in gem:
-            for t in gem['tags']:
-                tid = get_term_id(t, TAGS_ENDPOINT, TAG_MAP)
-                if tid: tag_ids.append(tid)
-
-        # ==========================================
-        # ✨ CONTENT PRE-PROCESSING (The Hook)
-        # ==========================================
-        final_content = gem.get('content', '')
-
-        # Check if this Gem has a grid definition
-        if 'card_grid_data' in gem:
-            print(f"      🎨 Generating Grid Layout for '{gem['title']}'...")
-            try:
-                grid_html = layout_engine.generate_pink_card_grid(gem['card_grid_data'])
-                # Append grid to the bottom of existing content
-                final_content += f"\n{grid_html}"
-            except Exception as e:
-                print(f"      ❌ Layout Engine Error: {e}")
-
-        # 4. BUILD PAYLOAD
-        meta_data = gem.get('meta', {})
-        
-        payload = {
-            'title': gem['title'],
-            'slug': gem.get('slug'),
-            'content': final_content,
-            'status': gem['status'],
-            'categories': cat_ids,
-            'tags': tag_ids,
-            'meta': {
-                'gem_status': meta_data.get('gem_status', ''),
-                'gem_action_item': meta_data.get('gem_action_item', ''),
-                'gem_related_project': meta_data.get('gem_related_project', '')
-            }
-        }
-
-        # 5. SPEED CHECK
-        current_hash = calculate_hash(payload)
-        if target_id and str(target_id) in state and state[str(target_id)] == current_hash:
-            print(f"💤 Skipped: {gem['title']}")
-            continue
-
-        # 6. PUSH
-        print(f"Processing: {gem['title']}...")
-        
-        if target_id:
-            url = f"{API_ENDPOINT}/{target_id}"
-            response = requests.post(url, headers=headers, json=payload)
-            action = "Updated"
-            icon = "🔹"
-        else:
-            response = requests.post(API_ENDPOINT, headers=headers, json=payload)
-            action = "Created"
-            icon = "✨"
-
-        if response.status_code in [200, 201]:
-            real_id = response.json()['id']
-            print(f"   {icon} {action} (ID: {real_id})")
-            
-            state[str(real_id)] = current_hash
-            GEM_MAP[my_key] = real_id
-            save_state(state)
+    try:
+        if args.batch_size > 0:
+            results = publish_batched(gems, state, args.batch_size, workers=max(1, args.workers), force=args.force)
         else:
-            print(f"   ❌ {action} Failed: {response.status_code}")
-            print(f"      {response.text[:200]}")
+            results = publish_all(gems, state, workers=max(1, args.workers), force=args.force)
+    finally:
+        # Fold the journal into .content_state.json even if the run dies midway
+        state.compact()
+        save_taxonomy_cache()
+
+    print("-" * 40)
+    summary = ", ".join(f"{k}: {v}" for k, v in sorted(results.items()))
+    print(f"📊 Done ({summary})")
+    print(render_cache.get_cache().report())
+    wp.print_timing_report()
+    return 1 if results.get('failed') else 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
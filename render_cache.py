@@ -0,0 +1,126 @@
+"""
+Content-addressed on-disk cache of rendered gem HTML (.render_cache/).
+
+Entries are keyed by a hash of everything the output depends on (gem
+source + renderer versions), so a hit never needs validating: a changed
+gem or renderer simply produces a new key. Recency is the file mtime
+(touched on every hit); once the cache grows past max_bytes, the least
+recently used entries are deleted.
+
+    cache = render_cache.get_cache()
+    html = cache.get(key)
+    if html is None:
+        html = render(gem)
+        cache.put(key, html)
+"""
+import hashlib
+import os
+import threading
+
+RENDER_CACHE_DIR = ".render_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+ENTRY_SUFFIX = ".html"
+
+
+class RenderCache:
+    def __init__(self, directory=RENDER_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None  # Total bytes on disk; measured on first put
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + ENTRY_SUFFIX)
+
+    # ------------------------------------------
+    # READ
+    # ------------------------------------------
+    def get(self, key):
+        """Cached HTML for `key`, or None. A hit marks the entry most recently used."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Read-only cache: still a hit, just no LRU bump
+        with self._lock:
+            self.hits += 1
+        return html
+
+    # ------------------------------------------
+    # WRITE / EVICT
+    # ------------------------------------------
+    def put(self, key, html):
+        """Stores `html` atomically, then evicts LRU entries beyond max_bytes."""
+        path = self._path(key)
+        data = html.encode('utf-8')
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+            self._size += len(data) - previous
+
+            if self._size > self.max_bytes:
+                self._evict_locked(keep=path)
+
+    def _entries(self):
+        """(path, size, mtime) for every cache entry."""
+        try:
+            scanned = list(os.scandir(self.directory))
+        except OSError:
+            return []
+        entries = []
+        for entry in scanned:
+            if entry.name.endswith(ENTRY_SUFFIX):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue  # Evicted by another process
+                entries.append((entry.path, st.st_size, st.st_mtime_ns))
+        return entries
+
+    def _evict_locked(self, keep=None):
+        entries = sorted(self._entries(), key=lambda e: e[2])  # Oldest first
+        self._size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._size <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+
+    def report(self):
+        return f"🗃️  Render cache: {self.hits} hits, {self.misses} misses, {self.evictions} evicted"
+
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+def get_cache(directory=RENDER_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """One shared RenderCache per directory (publisher, plan and exporters agree on hits)."""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(directory)
+        if cache is None:
+            cache = _CACHES[directory] = RenderCache(directory, max_bytes)
+        return cache
@@ -0,0 +1,91 @@
+import sys
+import os
+import tempfile
+import argparse
+
+import pandas as pd
+
+# Add scripts directory to path so we can import ingest_resume
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from ingest_resume import COL_CONTENT
+import ingest_resume
+from bench_util import best_of, seeded
+
+# --- CONFIGURATION ---
+DEFAULT_ROWS = 100_000
+DEFAULT_ORGS = 500
+ORPHAN_RATE = 0.002     # Rows without a Slot_ID (auto-clustered)
+VARIANTS = ['CMS-DS-PDM-01', 'DS-CMS-PDM-01', 'CMS-DS-PDM-02', 'PM-PDM-CMS-ECOM-01', 'CMS-AI-PDM-01']
+SAMPLE_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'source', 'resume_data.csv')
+FALLBACK_WORDS = ("content model headless cms design system migration platform taxonomy workflow "
+                  "editorial api commerce governance roadmap launch brand global stakeholder").split()
+
+
+def resume_vocabulary():
+    """Words (with real frequencies) from the resume bullets, so synthetic text reads like them."""
+    try:
+        content = pd.read_csv(SAMPLE_CSV)[COL_CONTENT].dropna()
+    except (OSError, KeyError):
+        return FALLBACK_WORDS
+    return " ".join(content).split() or FALLBACK_WORDS
+
+
+def synthetic_csv(path, rows, orgs):
+    """Resume CSV with the real headers: mostly Experience, some Skills/Education, a few orphans."""
+    rng = seeded()
+    words = resume_vocabulary()
+    sentence = lambda: " ".join(rng.choices(words, k=rng.randint(8, 24)))
+    records = []
+    for i in range(rows):
+        roll = rng.random()
+        variant = rng.choice(VARIANTS + [None])
+        row = {
+            'Row ID': i, 'Role Title': f"Title {variant}", 'Role Summary': f"Summary {variant}",
+            'Applicant Name': 'Synthetic Applicant', 'Applicant Location': 'Remote',
+            'Applicant Email': 'a@example.com', 'Applicant Phone': '555-0100',
+            'Applicant LinkedIn': 'linkedin.com/in/x', 'Applicant Portfolio': 'example.com',
+            'Variant Type': variant, 'Content': sentence() if rng.random() > 0.01 else None,
+        }
+        if roll < 0.01:
+            row.update({'Record Type': 'Education', 'Organization': f"School {rng.randint(1, 20)}",
+                        'Role/Degree': rng.choice(['BA', 'MA', None]), 'Dates': '2001', 'Location': 'SF'})
+        elif roll < 0.03:
+            row.update({'Record Type': 'Skills', 'Skills': f"Skill Group {rng.randint(1, 10)}",
+                        'Slot_ID': f"skill_{rng.randint(1, 10)}"})
+        else:
+            org = rng.randint(1, orgs)
+            row.update({'Record Type': rng.choice(['Experience'] * 20 + [None]),
+                        'Organization': f"Org {org}", 'Role/Degree': 'Lead', 'Dates': '2020',
+                        'Location': 'NYC'})
+            if rng.random() > ORPHAN_RATE:
+                row['Slot_ID'] = f"org{org}_{rng.randint(1, 40)}"
+        records.append(row)
+    pd.DataFrame(records).to_csv(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume ingestion throughput on a synthetic CSV.")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help=f'Synthetic CSV rows (default: {DEFAULT_ROWS})')
+    parser.add_argument('--orgs', type=int, default=DEFAULT_ORGS, help=f'Organizations (default: {DEFAULT_ORGS})')
+    parser.add_argument('--rounds', type=int, default=1, help='Best-of rounds')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resume_data.csv')
+        synthetic_csv(path, args.rows, args.orgs)
+        size = os.path.getsize(path)
+        read_s = best_of(args.rounds, lambda: pd.read_csv(path))
+        df = pd.read_csv(path)
+
+    print(f"🏭 Ingestion benchmark: {len(df):,} rows ({size / 1024 / 1024:.1f} MB CSV, read in {read_s:.2f}s), "
+          f"{args.orgs} orgs, best of {args.rounds}")
+
+    seconds = best_of(args.rounds, lambda: ingest_resume.build_golden_record(df))
+    record = ingest_resume.build_golden_record(df)
+    print(f"   build_golden_record {seconds:8.2f} s   {len(df) / seconds:>10,.0f} rows/s")
+    print(f"   {len(record['work_history'])} jobs, {len(record['skills'])} skill slots")
+
+
+if __name__ == "__main__":
+    main()
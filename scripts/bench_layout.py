@@ -0,0 +1,67 @@
+import sys
+import os
+import argparse
+
+# Add parent directory to path so we can import layout_engine
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import layout_engine
+from bench_util import best_of, peak_memory, seeded
+
+# --- CONFIGURATION ---
+GRID_SIZES = (10, 1_000, 100_000)
+DEFAULT_ROUNDS = 3
+DARK_TRIGGERS = {'system', 'meta', 'architecture'}
+TAG_POOL = ['Architecture', 'Headless CMS', 'Python', 'Design & Ops', 'System', 'Meta',
+            'DX', 'Automation', 'Governance'] + [f"tag-{i}" for i in range(100)]
+CATEGORY_POOL = ['Engineering & DX', 'AI & Automation', 'Design Systems', 'Product Ops', 'Governance']
+
+
+def iter_synthetic_cards(n):
+    rng = seeded()
+    for i in range(n):
+        card = {
+            'title': f"Card <{i}> & Co",
+            'link': f"/gem/card-{i}?ref=grid&n={i}",
+            'eyebrow': f"PROJ-{rng.randint(1, 4):03d} • SECTION",
+            'tags': rng.sample(TAG_POOL, rng.randint(0, 5)),
+            'status': rng.choice(['', 'ACTIVE', 'SHIPPED']),
+            'next_step': rng.choice(['', 'Ship it', 'Write the "docs"']),
+            'date': rng.choice(['', 'December 13, 2025']),
+            'data': {'project': f"PROJ-{i % 4:03d}", 'order': i, 'skip': None},
+        }
+        roll = rng.random()
+        if roll < 0.5:
+            card['categories'] = [' | '.join(rng.sample(CATEGORY_POOL, 2))]
+        elif roll < 0.8:
+            card['subtitle'] = "A subtitle & more"
+        if rng.random() < 0.05:
+            card['is_dark'] = True
+        yield card
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark card-grid rendering throughput and streaming memory.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(GRID_SIZES), help='Grid sizes in cards')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Best-of rounds per size')
+    args = parser.parse_args()
+
+    print(f"🎨 Card grid benchmark (layout engine v{layout_engine.LAYOUT_ENGINE_VERSION}), best of {args.rounds}")
+    for n in args.sizes:
+        cards = list(iter_synthetic_cards(n))
+        seconds = best_of(args.rounds, lambda: layout_engine.generate_st_card_grid(cards, dark_trigger_slugs=DARK_TRIGGERS))
+        print(f"   {n:>7,} cards   {n / seconds:>10,.0f} cards/s")
+
+    # Streaming: cards generated on the fly, grid written to a file
+    n = max(args.sizes)
+    with open(os.devnull, 'w', encoding='utf-8') as sink:
+        in_memory = peak_memory(lambda: sink.write(layout_engine.generate_st_card_grid(
+            iter_synthetic_cards(n), dark_trigger_slugs=DARK_TRIGGERS)))
+        streamed = peak_memory(lambda: layout_engine.write_st_card_grid(
+            sink, iter_synthetic_cards(n), dark_trigger_slugs=DARK_TRIGGERS))
+    print(f"   💾 {n:,} cards, peak memory: in-memory {in_memory / 1024 / 1024:.1f} MB, "
+          f"streamed {streamed / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import sys
+import os
+import argparse
+
+# Add parent directory to path so we can import content_store
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import content_store
+from bench_util import best_of, seeded
+
+# --- CONFIGURATION ---
+DEFAULT_GEMS = 10_000
+DEFAULT_ROUNDS = 5
+EXTRA_CATEGORIES = ['Product Strategy', 'Research', 'Career', 'Tooling']  # Unranked
+TAG_POOL = [f"tag-{i}" for i in range(300)]
+
+
+def synthetic_store(n):
+    """Mix of singular, legacy plural and uncategorized gems."""
+    rng = seeded()
+    pool = list(content_store.CATEGORY_PRIORITY) + EXTRA_CATEGORIES
+    gems = []
+    for i in range(n):
+        gem = {'title': f"Synthetic Gem {i}", 'tags': rng.sample(TAG_POOL, rng.randint(0, 8))}
+        roll = rng.random()
+        if roll < 0.5:
+            gem['category'] = rng.choice(pool)
+        elif roll < 0.95:
+            gem['categories'] = rng.sample(pool, rng.randint(1, 4))
+        gems.append(gem)
+    return gems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk vs per-gem taxonomy normalization.")
+    parser.add_argument('--gems', type=int, default=DEFAULT_GEMS, help=f'Synthetic store size (default: {DEFAULT_GEMS})')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Best-of rounds per variant')
+    args = parser.parse_args()
+
+    gems = synthetic_store(args.gems)
+    print(f"🏷️  Taxonomy normalization benchmark: {len(gems):,} synthetic gems, best of {args.rounds}")
+
+    per_gem = best_of(args.rounds, lambda: [content_store.normalize_taxonomy(g) for g in gems])
+    bulk = best_of(args.rounds, lambda: content_store.normalize_taxonomy_bulk(gems))
+    _, changes = content_store.normalize_taxonomy_bulk(gems)
+    print(f"   per-gem (memoized)     {per_gem * 1000:8.2f} ms")
+    print(f"   bulk + change report   {bulk * 1000:8.2f} ms   {per_gem / bulk:5.2f}x")
+    print(f"   {len(changes):,} gems would change on normalization")
+
+
+if __name__ == "__main__":
+    main()
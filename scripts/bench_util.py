@@ -0,0 +1,30 @@
+"""Timing and seed helpers shared by the scripts/bench_*.py benchmarks."""
+import random
+import time
+import tracemalloc
+
+DEFAULT_SEED = 42  # Every synthetic data set is reproducible run to run
+
+
+def seeded(seed=DEFAULT_SEED):
+    return random.Random(seed)
+
+
+def best_of(rounds, fn):
+    """Fastest of `rounds` calls to fn(), in seconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn):
+    """Peak bytes allocated (tracemalloc) while fn() runs."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
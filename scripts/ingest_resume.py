@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import pandas as pd
+import bisect
 import json
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -32,60 +33,159 @@ COL_APP_LINKEDIN = 'Applicant LinkedIn'
 COL_APP_PORTFOLIO = 'Applicant Portfolio'
 
 SIMILARITY_THRESHOLD = 0.45
+DEFAULT_VARIANT = "CMS-DS-PDM-01"  # Variant Type for untagged rows
+DEFAULT_RECORD_TYPE = 'Experience'  # Rows without a Record Type
 
 def similar(a, b):
     return SequenceMatcher(None, str(a), str(b)).ratio()
 
-def process_slots(df_subset, context_name):
-    """Cluster rows into Slots -> Variants."""
+def exceeds_threshold(matcher, threshold=SIMILARITY_THRESHOLD):
+    """
+    matcher.ratio() > threshold, exactly, without always finishing the diff.
+    Walks the same matching-block recursion as get_matching_blocks() and
+    stops once the matches found so far decide it either way: found alone
+    already exceeds the threshold, or found + the most the unexplored ranges
+    could still add cannot reach it.
+    """
+    a, b = matcher.a, matcher.b
+    length = len(a) + len(b)
+    if not length:
+        return matcher.ratio() > threshold
+    passes = lambda matches: 2.0 * matches / length > threshold  # Same arithmetic as ratio()
+
+    found = 0
+    remaining = min(len(a), len(b))  # Upper bound on matches left in the queued ranges
+    queue = [(0, len(a), 0, len(b))]
+    while queue:
+        alo, ahi, blo, bhi = queue.pop()
+        remaining -= min(ahi - alo, bhi - blo)
+        i, j, k = matcher.find_longest_match(alo, ahi, blo, bhi)
+        if k:
+            found += k
+            if passes(found):
+                return True
+            if alo < i and blo < j:
+                queue.append((alo, i, blo, j))
+                remaining += min(i - alo, j - blo)
+            if i + k < ahi and j + k < bhi:
+                queue.append((i + k, ahi, j + k, bhi))
+                remaining += min(ahi - i - k, bhi - j - k)
+        if not passes(found + remaining):
+            return False
+    return passes(found)
+
+class ClusterIndex:
+    """
+    Slot clusters in creation order. find() returns the first cluster whose
+    centroid (first variant) is similar() > SIMILARITY_THRESHOLD, exactly as
+    a full scan would. Centroids are also kept sorted by length: ratio() can
+    only pass when the lengths are within a factor of t/(2-t) of each other
+    (real_quick_ratio), so each lookup visits just that length window. The
+    survivors go through quick_ratio() before the real diff.
+
+    This is not sub-quadratic clustering. The window is relative (about
+    0.29x-3.4x the length at 0.45), and resume bullets are mostly of similar
+    length, so most centroids share a window and each orphan is still
+    compared against most clusters. Only the exact bounds cut the cost.
+    """
+
+    def __init__(self):
+        self.clusters = []
+        self._by_length = []  # Sorted (len(str(centroid)), position)
+        self._matchers = {}   # position -> SequenceMatcher with the centroid as seq2 (b2j built once)
+
+    def __len__(self):
+        return len(self.clusters)
+
+    def add(self, cluster):
+        bisect.insort(self._by_length, (len(str(cluster['variants'][0]['content'])), len(self.clusters)))
+        self.clusters.append(cluster)
+
+    def _window(self, size, threshold=SIMILARITY_THRESHOLD):
+        """Positions whose centroid length passes the length bound, in creation order."""
+        # Padded by one each side; the exact float test below decides the edges
+        low = int(size * threshold / (2 - threshold)) - 1
+        high = int(size * (2 - threshold) / threshold) + 1
+        start = bisect.bisect_left(self._by_length, (low, -1))
+        end = bisect.bisect_right(self._by_length, (high, len(self.clusters)))
+        positions = []
+        for centroid_size, position in self._by_length[start:end]:
+            total = size + centroid_size
+            # real_quick_ratio() without touching the matcher: ratio() <= 2*min/total
+            if total and 2.0 * min(size, centroid_size) / total <= threshold:
+                continue
+            positions.append(position)
+        positions.sort()
+        return positions
+
+    def find(self, content):
+        """First matching cluster or None. Same test as similar(content, centroid) > SIMILARITY_THRESHOLD."""
+        content = str(content)
+        for position in self._window(len(content)):
+            matcher = self._matchers.get(position)
+            if matcher is None:
+                centroid = self.clusters[position]['variants'][0]['content']
+                matcher = self._matchers[position] = SequenceMatcher(None, b=str(centroid))
+            matcher.set_seq1(content)
+            if matcher.quick_ratio() <= SIMILARITY_THRESHOLD:
+                continue
+            if exceeds_threshold(matcher):
+                return self.clusters[position]
+        return None
+
+def column_values(df, column, default=None):
+    """Column as a Python list with NaN -> default (all default when the column is absent)."""
+    if column not in df.columns:
+        return [default] * len(df)
+    values = df[column].astype(object)
+    return values.where(values.notna(), default).tolist()
+
+def collect_bullets(df):
+    """
+    One bullet dict per row (None where Content is empty), built column-wise
+    for the whole frame; callers slice it per slot group by position.
+    """
+    return [
+        {"type": variant_type, "content": content, "manual_id": slot_id, "header": skill_header}
+        if content is not None else None
+        for variant_type, content, slot_id, skill_header in zip(
+            column_values(df, COL_VARIANT, DEFAULT_VARIANT),
+            column_values(df, COL_CONTENT),
+            column_values(df, COL_SLOT_ID),
+            column_values(df, COL_SKILLS_HEADER),  # Skill Header if available
+        )
+    ]
+
+def process_slots(bullets, context_name):
+    """Cluster bullets (collect_bullets) into Slots -> Variants."""
     slots_output = []
     manual_slots = {}
     orphans = []
 
-    for _, row in df_subset.iterrows():
-        content = row[COL_CONTENT]
-        if pd.isna(content): continue
-
-        variant_type = row[COL_VARIANT] if pd.notna(row[COL_VARIANT]) else "CMS-DS-PDM-01"
-        slot_id = row[COL_SLOT_ID] if pd.notna(row[COL_SLOT_ID]) else None
-        
-        # Capture Skill Header if available
-        skill_header = row[COL_SKILLS_HEADER] if COL_SKILLS_HEADER in row and pd.notna(row[COL_SKILLS_HEADER]) else None
-
-        bullet_obj = {
-            "type": variant_type,
-            "content": content,
-            "manual_id": slot_id,
-            "header": skill_header 
-        }
-
+    for bullet_obj in bullets:
+        if bullet_obj is None: continue
+        slot_id = bullet_obj['manual_id']
         if slot_id:
-            if slot_id not in manual_slots:
-                manual_slots[slot_id] = []
-            manual_slots[slot_id].append(bullet_obj)
+            manual_slots.setdefault(slot_id, []).append(bullet_obj)
         else:
             orphans.append(bullet_obj)
 
-    final_clusters = []
+    index = ClusterIndex()
 
     # 1. Add Manual Slots
     for s_id, variants in manual_slots.items():
-        final_clusters.append({"id": s_id, "variants": variants})
+        index.add({"id": s_id, "variants": variants})
 
-    # 2. Auto-Cluster Orphans
+    # 2. Auto-Cluster Orphans (first similar centroid wins, else a new cluster)
+    slug = str(context_name).lower().split()[0].replace(',', '').replace('.', '')
     for orphan in orphans:
-        matched = False
-        for cluster in final_clusters:
-            centroid = cluster['variants'][0]['content']
-            if similar(orphan['content'], centroid) > SIMILARITY_THRESHOLD:
-                cluster['variants'].append(orphan)
-                matched = True
-                break
-        
-        if not matched:
-            slug = str(context_name).lower().split()[0].replace(',', '').replace('.', '')
-            new_id = f"{slug}_auto_{len(final_clusters)+1:02d}"
-            final_clusters.append({"id": new_id, "variants": [orphan]})
+        cluster = index.find(orphan['content'])
+        if cluster is not None:
+            cluster['variants'].append(orphan)
+        else:
+            new_id = f"{slug}_auto_{len(index)+1:02d}"
+            index.add({"id": new_id, "variants": [orphan]})
+    final_clusters = index.clusters
 
     # 3. Format Output
     for cluster in final_clusters:
@@ -110,19 +210,8 @@ def process_slots(df_subset, context_name):
         
     return slots_output
 
-def run_ingestion():
-    print(f"🏭 SUGARTOWN FACTORY: Ingestion Sequence Started")
-    
-    if not INPUT_CSV.exists():
-        print(f"❌ ERROR: Source file not found at {INPUT_CSV}")
-        sys.exit(1)
-
-    try:
-        df = pd.read_csv(INPUT_CSV)
-    except Exception as e:
-        print(f"❌ ERROR reading CSV: {e}")
-        sys.exit(1)
-
+def build_golden_record(df):
+    """Resume CSV DataFrame -> golden record dict (master_resume_data.json)."""
     # 1. Capture Static Basics (From the first valid row)
     first_valid = df.iloc[0] # Assuming first row has contact info
     golden_record = {
@@ -140,64 +229,78 @@ def run_ingestion():
         "skills": []
     }
 
-    # 2. Capture Dynamic Summaries (Iterate all rows to find unique Variant Types)
+    # 2. Capture Dynamic Summaries (one row per unique Variant Type)
     if COL_ROLE_TITLE in df.columns and COL_ROLE_SUMMARY in df.columns:
-        # Group by Variant Type to get unique summaries
-        # We drop duplicates to just get one row per variant type
         meta_df = df[[COL_VARIANT, COL_ROLE_TITLE, COL_ROLE_SUMMARY]].drop_duplicates(subset=[COL_VARIANT])
-        
-        for _, row in meta_df.iterrows():
-            v_type = row[COL_VARIANT]
-            if pd.notna(v_type):
-                golden_record['variant_summaries'][v_type] = {
-                    "title": row[COL_ROLE_TITLE] if pd.notna(row[COL_ROLE_TITLE]) else "Product Leader",
-                    "summary": row[COL_ROLE_SUMMARY] if pd.notna(row[COL_ROLE_SUMMARY]) else ""
-                }
+        meta_df = meta_df[meta_df[COL_VARIANT].notna()]
+        for v_type, title, summary in zip(meta_df[COL_VARIANT].tolist(),
+                                          column_values(meta_df, COL_ROLE_TITLE, "Product Leader"),
+                                          column_values(meta_df, COL_ROLE_SUMMARY, "")):
+            golden_record['variant_summaries'][v_type] = {"title": title, "summary": summary}
 
-    # --- PART 3: EDUCATION ---
+    # One pass: partition rows by record type (untyped rows are Experience)
     if COL_RECORD_TYPE in df.columns:
-        edu_df = df[df[COL_RECORD_TYPE] == 'Education']
-        seen_edu = set()
-        for _, row in edu_df.iterrows():
-            inst = row[COL_ORG] if pd.notna(row[COL_ORG]) else ""
-            degree = row[COL_ROLE] if pd.notna(row[COL_ROLE]) else ""
-            unique_key = (inst, degree)
-            if unique_key not in seen_edu and (inst or degree):
-                golden_record['education'].append({
-                    "institution": inst,
-                    "area": degree,
-                    "dates": row[COL_DATES] if pd.notna(row[COL_DATES]) else "",
-                    "location": row[COL_LOC] if pd.notna(row[COL_LOC]) else ""
-                })
-                seen_edu.add(unique_key)
-    
+        record_types = df[COL_RECORD_TYPE].fillna(DEFAULT_RECORD_TYPE)
+        partitions = {rtype: rows for rtype, rows in df.groupby(record_types, sort=False)}
+    else:
+        partitions = {DEFAULT_RECORD_TYPE: df}
+    empty = df.iloc[0:0]
+
+    # --- PART 3: EDUCATION ---
+    edu_df = partitions.get('Education', empty)
+    education = pd.DataFrame({
+        "institution": column_values(edu_df, COL_ORG, ""),
+        "area": column_values(edu_df, COL_ROLE, ""),
+        "dates": column_values(edu_df, COL_DATES, ""),
+        "location": column_values(edu_df, COL_LOC, ""),
+    }, dtype=object)
+    education = education.drop_duplicates(subset=["institution", "area"])
+    education = education[(education["institution"] != "") | (education["area"] != "")]
+    golden_record['education'] = education.to_dict('records')
+
     # --- PART 4: SKILLS ---
     if COL_RECORD_TYPE in df.columns:
-        skill_df = df[df[COL_RECORD_TYPE] == 'Skills']
-        golden_record['skills'] = process_slots(skill_df, "skills")
+        golden_record['skills'] = process_slots(collect_bullets(partitions.get('Skills', empty)), "skills")
 
     # --- PART 5: EXPERIENCE ---
-    if COL_RECORD_TYPE in df.columns:
-        exp_df = df[(df[COL_RECORD_TYPE] == 'Experience') | (df[COL_RECORD_TYPE].isna())]
-    else:
-        exp_df = df 
+    # Columns are cleaned once for the whole partition; each organization takes
+    # its rows by position. groupby(sort=False) keeps first-appearance order
+    # and skips rows without an Organization.
+    exp_df = partitions.get(DEFAULT_RECORD_TYPE, empty).reset_index(drop=True)
+    bullets = collect_bullets(exp_df)
+    roles = column_values(exp_df, COL_ROLE, "Product Leader")
+    dates = column_values(exp_df, COL_DATES, "")
+    locations = column_values(exp_df, COL_LOC, "")
 
-    processed_jobs = 0
-    for org_name in exp_df[COL_ORG].unique():
-        if pd.isna(org_name): continue
-        
-        org_rows = exp_df[exp_df[COL_ORG] == org_name]
-        first_row = org_rows.iloc[0]
+    for org_name, org_rows in exp_df.groupby(COL_ORG, sort=False):
+        positions = org_rows.index
+        first = positions[0]
 
         job_entry = {
             "company": org_name,
-            "role": first_row[COL_ROLE] if pd.notna(first_row[COL_ROLE]) else "Product Leader",
-            "dates": first_row[COL_DATES] if pd.notna(first_row[COL_DATES]) else "",
-            "location": first_row[COL_LOC] if pd.notna(first_row[COL_LOC]) else "",
-            "slots": process_slots(org_rows, org_name)
+            "role": roles[first],
+            "dates": dates[first],
+            "location": locations[first],
+            "slots": process_slots([bullets[i] for i in positions], org_name)
         }
         golden_record['work_history'].append(job_entry)
-        processed_jobs += 1
+
+    return golden_record
+
+def run_ingestion():
+    print(f"🏭 SUGARTOWN FACTORY: Ingestion Sequence Started")
+    
+    if not INPUT_CSV.exists():
+        print(f"❌ ERROR: Source file not found at {INPUT_CSV}")
+        sys.exit(1)
+
+    try:
+        df = pd.read_csv(INPUT_CSV)
+    except Exception as e:
+        print(f"❌ ERROR reading CSV: {e}")
+        sys.exit(1)
+
+    golden_record = build_golden_record(df)
 
     OUTPUT_JSON.parent.mkdir(parents=True, exist_ok=True)
     with open(OUTPUT_JSON, 'w') as f:
@@ -206,4 +309,4 @@ def run_ingestion():
     print(f"✅ SUCCESS: Ingested metadata for {len(golden_record['variant_summaries'])} variants.")
 
 if __name__ == "__main__":
-    run_ingestion()
\ No newline at end of file
+    run_ingestion()
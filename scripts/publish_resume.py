@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
 import markdown
-import requests
-import base64
 import re
 from pathlib import Path
 import sys
@@ -17,6 +15,8 @@ except ImportError:
     print("❌ ERROR: Could not find 'config.py'.")
     sys.exit(1)
 
+import wp_client
+
 # --- CONFIGURATION ---
 PAGE_ID = 207  # https://sugartown.io/cv-resume/
 WP_URL = f"{config.BASE_URL}/wp-json/wp/v2"
@@ -76,23 +76,18 @@ def publish_to_wordpress():
     </div>
     """
 
-    # 5. Auth & Send
-    credentials = f"{config.USER}:{config.PASSWORD}"
-    token = base64.b64encode(credentials.encode()).decode()
-    
-    headers = {
-        "Authorization": f"Basic {token}",
-        "Content-Type": "application/json"
-    }
+    # 5. Auth & Send (shared pooled WP session)
+    wp = wp_client.get_client(config.BASE_URL, config.USER, config.PASSWORD)
 
     endpoint = f"{WP_URL}/pages/{PAGE_ID}"
     print(f"📡 Pushing content to {endpoint}...")
     
-    response = requests.post(endpoint, headers=headers, json={"content": final_html})
+    response = wp.post(endpoint, json={"content": final_html})
 
     if response.status_code == 200:
         print("✅ SUCCESS: Resume updated (Redacted for Privacy)!")
         print(f"   View live: {config.BASE_URL}/cv-resume/")
+        wp.print_timing_report()
     else:
         print(f"❌ ERROR: {response.status_code}")
         print(response.text)
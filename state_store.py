@@ -0,0 +1,118 @@
+"""
+Crash-safe publish state for publish_gem.
+
+Layout (next to each other on disk):
+    .content_state.json          Compacted snapshot {remote_id: record}
+    .content_state.json.journal  Append-only JSON lines, one record per push
+
+Every successful push appends one fsync'd line to the journal instead of
+rewriting the whole snapshot. The snapshot is rewritten atomically
+(temp file + os.replace) every `compact_every` records and at the end of a
+run. On the next load, journal lines are replayed over the snapshot; a
+torn final line from a crash is ignored and cut off, so the next append
+starts on a fresh line.
+
+Record fields:
+    hash        Payload hash of the last successful push
+    source      Source fingerprint (see publish_gem.source_fingerprint)
+    remote_id   WordPress post ID
+    modified    Remote 'modified' timestamp returned by WordPress
+    latency_ms  Round-trip time of the push
+"""
+import json
+import os
+import threading
+
+DEFAULT_COMPACT_EVERY = 200
+
+
+class StateJournal:
+    def __init__(self, snapshot_path, compact_every=DEFAULT_COMPACT_EVERY):
+        self.snapshot_path = snapshot_path
+        self.journal_path = f"{snapshot_path}.journal"
+        self.compact_every = compact_every
+        self.records = {}
+        self.pending = 0  # Journal lines not yet folded into the snapshot
+        self._lock = threading.Lock()
+
+    # ------------------------------------------
+    # LOAD / RECOVERY
+    # ------------------------------------------
+    def load(self):
+        """Reads the snapshot, then replays the journal. Returns self."""
+        self.records = {}
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'r') as f:
+                    snapshot = json.load(f)
+            except ValueError:
+                print(f"   ⚠️  {self.snapshot_path} is corrupt; rebuilding from journal + remote hashes.")
+                snapshot = {}
+            for remote_id, record in snapshot.items():
+                # Legacy format stored only the payload hash
+                self.records[remote_id] = {'hash': record} if isinstance(record, str) else record
+
+        self.pending = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                # Unterminated tail from an interrupted run: cut it off, or the
+                # next record() would append onto the same line
+                os.truncate(self.journal_path, end)
+            for line in data[:end].splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from an interrupted run
+                self.records[str(entry['remote_id'])] = entry
+                self.pending += 1
+        return self
+
+    # ------------------------------------------
+    # READ
+    # ------------------------------------------
+    def get(self, remote_id, default=None):
+        with self._lock:
+            return self.records.get(str(remote_id), default)
+
+    def __contains__(self, remote_id):
+        return str(remote_id) in self.records
+
+    def __len__(self):
+        return len(self.records)
+
+    # ------------------------------------------
+    # WRITE
+    # ------------------------------------------
+    def record(self, remote_id, **fields):
+        """Appends one durable journal entry (thread-safe)."""
+        entry = {'remote_id': remote_id, **fields}
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            with open(self.journal_path, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.records[str(remote_id)] = entry
+            self.pending += 1
+            if self.pending >= self.compact_every:
+                self._compact_locked()
+
+    def compact(self):
+        """Folds the journal into a fresh snapshot (atomic replace) and truncates it."""
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        tmp = f"{self.snapshot_path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self.records, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        # Snapshot is durable; the journal's entries are now redundant
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.pending = 0
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import build_resume
+from build_resume import MASTER_VARIANT
+
+
+def slot(*variants):
+    return {'variants': [{'type': t, 'content': c} for t, c in variants]}
+
+
+def test_variant_lookup():
+    s = slot(('PM-01', 'pm first'), (MASTER_VARIANT, 'master'), ('PM-01', 'pm second'))
+    assert build_resume.get_variant_content(s, 'PM-01') == 'pm first'       # First of a type wins
+    assert build_resume.get_variant_content(s, 'DS-01') == 'master'         # Master fallback
+    assert build_resume.get_variant_content(s, MASTER_VARIANT) == 'master'
+    assert build_resume.get_variant_content(slot(('PM-01', 'pm')), 'DS-01') is None
+
+
+def test_render_with_index_matches_one_off():
+    data = {
+        'basics': {'name': 'A', 'location': 'NYC', 'email': 'a@b.c', 'phone': '', 'linkedin': '', 'portfolio': 'nan'},
+        'variant_summaries': {MASTER_VARIANT: {'title': 'Lead', 'summary': 'Master summary'}},
+        'work_history': [{'company': 'Co', 'role': 'Lead', 'dates': '2020', 'location': 'NYC',
+                          'slots': [slot((MASTER_VARIANT, 'shared')), slot(('PM-01', 'pm only'))]}],
+        'education': [{'institution': 'School', 'area': 'BA'}],
+        'skills': [dict(slot((MASTER_VARIANT, 'Python')), header='Tools')],
+    }
+    index = build_resume.compile_resume(data)
+    for role in (MASTER_VARIANT, 'PM-01'):
+        md = build_resume.render_resume(data, role, index)
+        assert md == build_resume.render_resume(data, role)
+    assert "- pm only" in build_resume.render_resume(data, 'PM-01', index)
+    assert "- pm only" not in build_resume.render_resume(data, MASTER_VARIANT, index)
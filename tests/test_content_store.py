@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import content_store
+
+# (gem, normalized) pairs, checked against the v4 per-gem normalizer
+TAXONOMY_CASES = [
+    ({'categories': ['Research', 'Meta', 'Engineering & DX'], 'tags': ['ai']},
+     {'category': 'Engineering & DX', 'tags': ['ai', 'research', 'meta']}),
+    ({'categories': ['Research', 'Tooling']},                       # Unranked only: first wins
+     {'category': 'Research', 'tags': ['tooling']}),
+    ({'categories': 'Product Ops', 'tags': []},                     # Legacy plural as a string
+     {'category': 'Product Ops', 'tags': []}),
+    ({'categories': ['Meta', 'Meta', 'Product & Platform Strategy']},
+     {'category': 'Product & Platform Strategy', 'tags': ['meta', 'meta']}),
+    ({'categories': [], 'category': 'Governance'},                  # Plural wins even when empty
+     {'category': None, 'tags': []}),
+    ({'category': 'Design Systems', 'tags': ['x']},
+     {'category': 'Design Systems', 'tags': ['x']}),
+    ({'tags': ['only-tags']},
+     {'category': None, 'tags': ['only-tags']}),
+]
+
+
+def test_normalize_taxonomy():
+    for gem, expected in TAXONOMY_CASES:
+        assert content_store.normalize_taxonomy(gem) == expected, gem
+
+
+def test_normalize_taxonomy_bulk_matches_per_gem():
+    gems = [dict(gem, title=f"Gem {i}") for i, (gem, _) in enumerate(TAXONOMY_CASES)] * 3
+    normalized, changes = content_store.normalize_taxonomy_bulk(gems)
+    assert normalized == [content_store.normalize_taxonomy(gem) for gem in gems]
+    assert all(0 <= change['index'] < len(gems) for change in changes)
+
+
+CHANGELOG_CASES = [
+    "# Log\n\n<div>\n\n## 1.1\n</div>\n\n## 1.0\n\ntext\n",               # Heading inside raw HTML
+    "# Log\n\n| a | b |\n|---|---|\n| 1 | 2 |\n## 2.0\n\n- item\n",      # Heading right after a table
+    "## 2.0\n\n<!-- draft\n\n## 1.9\n-->\n\n## 1.8\n\n```\n## not a heading\n```\n",
+    "[ref]: http://example.com\n\n## 2.0\n\nsee [docs][ref]\n\n## 1.0\n\n[late]: /late\n\n[x][late]\n",
+]
+
+
+def test_changelog_sections_match_whole_file(tmp_path, monkeypatch):
+    markdown = pytest.importorskip('markdown')
+    monkeypatch.chdir(tmp_path)  # Keep the render cache out of the repo
+    for md_text in CHANGELOG_CASES:
+        whole = markdown.Markdown(extensions=list(content_store.CHANGELOG_EXTENSIONS)).convert(md_text)
+        for _ in range(2):  # Cold, then served from the render cache
+            assert "".join(content_store.iter_changelog_html(md_text)) == whole, md_text
+
+
+def test_gem_index_tracks_store_changes():
+    gems = [content_store.GemRecord({'title': 'A', 'tags': ['python'], 'status': 'publish'}),
+            content_store.GemRecord({'title': 'B', 'tags': ['ai'], 'status': 'draft'})]
+    titles = lambda **f: [g['title'] for g in content_store.gem_index(gems).query(**f)]
+    assert titles(tag='python') == ['A']
+    assert content_store.gem_index(gems) is content_store.gem_index(gems)  # Unchanged store: cached
+
+    gems[1] = content_store.GemRecord({'title': 'C', 'tags': ['python'], 'status': 'draft'})  # Replaced in place
+    assert titles(tag='python') == ['A', 'C']
+
+    gems[0]['tags'] = ['ai']  # Indexed field edited
+    assert titles(tag='python') == ['C']
+
+    gems[1]['tags'].append('ai')  # Nested edit: invisible without rebuild=True
+    content_store.gem_index(gems, rebuild=True)
+    assert titles(tag='ai') == ['A', 'C']
@@ -0,0 +1,70 @@
+import json
+import os
+import random
+import sys
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+import ingest_resume
+from ingest_resume import COL_CONTENT, INPUT_CSV, SIMILARITY_THRESHOLD, similar
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def real_bullets():
+    return list(dict.fromkeys(str(c) for c in pd.read_csv(INPUT_CSV)[COL_CONTENT].dropna()))
+
+
+def rewrite(rng, text, rate=0.3):
+    words = text.split()
+    return " ".join(rng.choice(words) if rng.random() < rate else w for w in words if rng.random() > rate / 2)
+
+
+def text_pairs(seed=7):
+    """Real bullets against their rewrites and each other, plus edge cases around empty/short strings."""
+    rng = random.Random(seed)
+    bullets = real_bullets()
+    pairs = [("", ""), ("", "a"), ("a", ""), ("a", "a"), ("ab", "ba"), ("abc", "abd"), ("x" * 50, "x" * 30)]
+    for a in bullets:
+        pairs.append((a, rewrite(rng, a)))
+        pairs.append((a, rng.choice(bullets)))
+    return pairs
+
+
+def test_exceeds_threshold_matches_ratio():
+    # exceeds_threshold() re-walks get_matching_blocks(): pin it to difflib itself
+    for threshold in (0.0, 0.3, SIMILARITY_THRESHOLD, 0.6, 0.9):
+        for a, b in text_pairs():
+            matcher = SequenceMatcher(None, a, b)
+            assert ingest_resume.exceeds_threshold(matcher, threshold) == (matcher.ratio() > threshold), (a, b, threshold)
+
+
+def test_cluster_index_matches_full_scan():
+    rng = random.Random(11)
+    bullets = real_bullets()
+    contents = [rng.choice([b, rewrite(rng, b)]) for b in bullets] + ["", "", "tiny"]
+    rng.shuffle(contents)
+
+    centroids, index = [], ingest_resume.ClusterIndex()
+    for content in contents:
+        expected = next((i for i, c in enumerate(centroids) if similar(content, c) > SIMILARITY_THRESHOLD), None)
+        found = index.find(content)
+        assert (found['id'] if found else None) == expected, content
+        if found is None:
+            centroids.append(content)
+            index.add({"id": len(index), "variants": [{"content": content}]})
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_golden_record_matches_v1():
+    # Both golden records were produced by the v1 (iterrows) ingestion
+    sample = pd.read_csv(os.path.join(FIXTURES, 'resume_sample.csv'))
+    assert ingest_resume.build_golden_record(sample) == load_json(os.path.join(FIXTURES, 'resume_sample.json'))
+    assert ingest_resume.build_golden_record(pd.read_csv(INPUT_CSV)) == load_json(ingest_resume.OUTPUT_JSON)
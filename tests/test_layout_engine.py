@@ -0,0 +1,37 @@
+import io
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import layout_engine
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+DARK_TRIGGERS = {'system', 'meta', 'architecture'}
+
+
+def load_cards():
+    with open(os.path.join(FIXTURES, 'st_cards.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def expected_grid():
+    # Rendered by the v5.0 (pre-template) engine; markup must not drift without a version bump
+    with open(os.path.join(FIXTURES, 'st_card_grid.html'), encoding='utf-8') as f:
+        return f.read().rstrip("\n")
+
+
+def test_grid_matches_v5_markup():
+    html = layout_engine.generate_st_card_grid(load_cards(), dark_trigger_slugs=DARK_TRIGGERS)
+    assert html == expected_grid()
+
+
+def test_streamed_grid_matches_in_memory():
+    cards = load_cards()
+    streamed = "".join(layout_engine.iter_st_card_grid(iter(cards), dark_trigger_slugs=DARK_TRIGGERS))
+    assert streamed == expected_grid()
+
+    sink = io.StringIO()
+    layout_engine.write_st_card_grid(sink, iter(cards), dark_trigger_slugs=DARK_TRIGGERS)
+    assert sink.getvalue() == expected_grid()
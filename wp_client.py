@@ -0,0 +1,472 @@
+"""
+Shared WordPress REST client for the Sugartown publishing scripts.
+
+Every entry point (publish_gem, export_gems, publish_ethics_page,
+scripts/publish_resume) talks to WordPress through one pooled, keep-alive
+requests.Session per (site, user), so a full sync pays the TCP+TLS
+handshake once per pooled connection instead of once per call.
+
+Calls are throttled by a per-host token bucket and retried with
+exponential backoff + jitter on 429/5xx and connection errors, honoring
+Retry-After. A 429 pauses the whole host bucket so every worker backs off,
+not just the one that was rejected.
+
+Usage:
+    import wp_client
+    wp = wp_client.get_client(config.BASE_URL, config.USER, config.PASSWORD)
+    wp.get(f"{config.BASE_URL}/wp-json/wp/v2/tags", params={'per_page': 100})
+    wp.print_timing_report()
+"""
+import base64
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# ==========================================
+# CONFIGURATION
+# ==========================================
+DEFAULT_POOL_CONNECTIONS = 4   # Distinct hosts kept warm
+DEFAULT_POOL_MAXSIZE = 8       # Keep-alive connections per host
+ACCEPT_ENCODING = "gzip, deflate"
+DEFAULT_TIMEOUT = 30           # Seconds (requests has no default timeout)
+
+# Retry / backoff
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5             # Seconds; doubles each attempt
+BACKOFF_CAP = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses where the server guarantees the request was NOT applied, so even
+# non-idempotent POSTs (creates) are safe to resend.
+SAFE_RETRY_STATUSES = {429, 503}
+
+# Per-host token bucket (adaptive: halves on 429, creeps back up on success)
+DEFAULT_RATE_LIMIT = 25.0      # Max sustained requests/second per host
+DEFAULT_BURST = 25             # Bucket capacity
+MIN_RATE_LIMIT = 1.0
+RATE_RECOVERY_STEP = 1.0       # Requests/second regained per successful call
+RATE_CUT_COOLDOWN = 1.0        # Seconds: one rate cut per burst of 429s, not one per worker
+
+# Pagination
+DEFAULT_PER_PAGE = 100         # WordPress maximum
+DEFAULT_PAGE_WORKERS = 4       # Concurrent page fetches after page 1
+
+# Error codes WordPress returns when paging past the end of a collection
+END_OF_PAGES_CODES = {'rest_post_invalid_page_number', 'rest_term_invalid_page_number'}
+
+
+class WPRequestError(requests.RequestException):
+    """
+    A WordPress call failed for good (retries exhausted or unrecoverable
+    status). A RequestException, so callers written against raw requests
+    still catch it.
+    """
+
+    def __init__(self, message, response=None):
+        super().__init__(message, response=response)
+
+# ==========================================
+# CONNECTION INSTRUMENTATION
+# ==========================================
+class ConnectionStats:
+    """Thread-safe counters for requests vs. freshly opened connections."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+            self.handshake_seconds = 0.0
+            self.request_seconds = 0.0
+            self.retries = 0
+            self.rate_limited = 0        # 429 responses
+            self.server_errors = 0       # Retryable 5xx responses
+            self.connection_errors = 0
+            self.gave_up = 0             # Calls that exhausted their retries
+            self.throttle_seconds = 0.0  # Time spent waiting on token buckets
+            self.backoff_seconds = 0.0
+
+    def bump(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def record_connect(self, seconds):
+        with self._lock:
+            self.connections += 1
+            self.handshake_seconds += seconds
+
+    def record_request(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self.request_seconds += seconds
+
+
+STATS = ConnectionStats()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        STATS.record_connect(time.perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        # TCP connect + TLS handshake
+        start = time.perf_counter()
+        super().connect()
+        STATS.record_connect(time.perf_counter() - start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools time every new connection's handshake."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+# ==========================================
+# RATE LIMITING
+# ==========================================
+class TokenBucket:
+    """
+    Blocking token bucket: `rate` tokens/second, up to `capacity` banked.
+    The rate is AIMD-adaptive between MIN_RATE_LIMIT and `max_rate`.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE_LIMIT, capacity=DEFAULT_BURST):
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_cut = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping as needed. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+                else:
+                    delay = self.paused_until - now
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds):
+        """Server asked us to back off (429): hold every caller and halve the rate."""
+        with self._lock:
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            if now - self.last_cut >= RATE_CUT_COOLDOWN:
+                self.rate = max(MIN_RATE_LIMIT, self.rate / 2)
+                self.last_cut = now
+
+    def reward(self):
+        """Successful call: recover toward max_rate."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY_STEP)
+
+
+def parse_retry_after(value):
+    """Retry-After is either delta-seconds or an HTTP-date. Returns seconds or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def error_code(response):
+    """WordPress REST error code (e.g. 'term_exists') or None."""
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    return body.get('code') if isinstance(body, dict) else None
+
+
+def is_past_last_page(response):
+    """True for the 400 WordPress answers when a collection runs out of pages."""
+    return response.status_code == 400 and error_code(response) in END_OF_PAGES_CODES
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+# ==========================================
+# CLIENT
+# ==========================================
+def fields_param(fields):
+    """Projection tuple -> WordPress `_fields` value."""
+    return ",".join(fields)
+
+
+def basic_auth_header(user, password):
+    token = base64.b64encode(f"{user}:{password}".encode()).decode("utf-8")
+    return f"Basic {token}"
+
+
+class WPClient:
+    """
+    Thin wrapper around a pooled requests.Session.
+
+    Args:
+        base_url (str): Site root, e.g. "https://sugartown.io".
+        user/password (str|None): Application-password credentials (Basic auth).
+        pool_maxsize (int): Keep-alive connections for the site's host.
+        host_pool_sizes (dict|None): Per-host overrides, e.g. {"cdn.example.com": 2}.
+        rate_limit (float|None): Requests/second per host (None disables throttling).
+        max_retries (int): Retries per call on 429/5xx/connection errors.
+    """
+
+    def __init__(self, base_url, user=None, password=None, *,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, host_pool_sizes=None,
+                 rate_limit=DEFAULT_RATE_LIMIT, burst=DEFAULT_BURST, max_retries=MAX_RETRIES):
+        self.base_url = base_url.rstrip('/')
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.max_retries = max_retries
+        self._buckets = {}
+        self._buckets_lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+        if user:
+            self.session.headers['Authorization'] = basic_auth_header(user, password)
+
+        # Default adapters for any host, then a dedicated pool per known host
+        for scheme in ('http://', 'https://'):
+            self.session.mount(scheme, PooledAdapter(
+                pool_connections=DEFAULT_POOL_CONNECTIONS,
+                pool_maxsize=DEFAULT_POOL_MAXSIZE,
+            ))
+        self.set_pool_size(self.base_url, pool_maxsize)
+        for host, size in (host_pool_sizes or {}).items():
+            self.set_pool_size(host, size)
+
+    def set_pool_size(self, host_or_url, maxsize):
+        """(Re)mounts a dedicated keep-alive pool for one host."""
+        parts = urlsplit(host_or_url if '://' in host_or_url else f"https://{host_or_url}")
+        prefix = f"{parts.scheme}://{parts.netloc}/"
+        self.session.mount(prefix, PooledAdapter(pool_connections=1, pool_maxsize=max(1, maxsize)))
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        with self._buckets_lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate_limit, self.burst)
+            return self._buckets[host]
+
+    def _send(self, method, url, bucket, **kwargs):
+        if bucket:
+            STATS.bump('throttle_seconds', bucket.acquire())
+        start = time.perf_counter()
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            STATS.record_request(time.perf_counter() - start)
+
+    def request(self, method, url, retry_unsafe=False, **kwargs):
+        """
+        Sends one call with throttling and retries. Returns the final
+        response (which may still be an error status for the caller to
+        handle); raises WPRequestError if the connection never succeeds.
+
+        GETs are retried on any RETRY_STATUSES. Other methods only on
+        SAFE_RETRY_STATUSES (request provably not applied) unless
+        retry_unsafe=True, so a flaky 502 can never double-create a gem.
+        A Retry-After longer than BACKOFF_CAP ends the retries at once rather
+        than stalling this call (and, on 429, every worker sharing the host).
+        """
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        bucket = self._bucket(url) if self.rate_limit else None
+        retryable = RETRY_STATUSES if (method == 'GET' or retry_unsafe) else SAFE_RETRY_STATUSES
+
+        attempt = 0
+        while True:
+            try:
+                response = self._send(method, url, bucket, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                STATS.bump('connection_errors')
+                if attempt >= self.max_retries or not (method == 'GET' or retry_unsafe):
+                    STATS.bump('gave_up')
+                    raise WPRequestError(f"{method} {url} failed: {e}") from e
+                delay = backoff_delay(attempt)
+            else:
+                if response.status_code not in retryable:
+                    if bucket:
+                        bucket.reward()
+                    return response
+                STATS.bump('rate_limited' if response.status_code == 429 else 'server_errors')
+                if attempt >= self.max_retries:
+                    STATS.bump('gave_up')
+                    return response
+
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None and retry_after > BACKOFF_CAP:
+                    STATS.bump('gave_up')
+                    return response
+                delay = retry_after if retry_after is not None else backoff_delay(attempt)
+                if response.status_code == 429 and bucket:
+                    bucket.pause(delay)
+
+            attempt += 1
+            STATS.bump('retries')
+            STATS.bump('backoff_seconds', delay)
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    # ------------------------------------------
+    # PAGINATION
+    # ------------------------------------------
+    def _fetch_page(self, url, params, page):
+        """Returns (items, total_pages). Empty items once past the last page."""
+        response = self.get(url, params={**params, 'page': page})
+        if is_past_last_page(response):
+            return [], page - 1
+        if response.status_code != 200:
+            raise WPRequestError(f"GET {url} page {page} failed: HTTP {response.status_code}", response)
+        total = response.headers.get('X-WP-TotalPages')
+        return response.json(), int(total) if total and total.isdigit() else None
+
+    def iter_collection(self, url, params=None, per_page=DEFAULT_PER_PAGE, workers=DEFAULT_PAGE_WORKERS,
+                        fields=None):
+        """
+        Streams every item of a paginated collection.
+
+        Page 1 is fetched first; its X-WP-TotalPages header tells us how many
+        pages remain, and those are fetched concurrently. Items are yielded
+        in page order as soon as each page lands, so callers can start
+        processing before the last page arrives. Hosts that strip the header
+        fall back to sequential paging until an empty page.
+
+        `fields` is the caller's projection, sent as WordPress `_fields` so
+        unused properties (rendered content above all) never leave the server.
+
+        Raises WPRequestError rather than ending early on a failed page.
+        """
+        params = {**(params or {}), 'per_page': per_page}
+        if fields:
+            params['_fields'] = fields_param(fields)
+        items, total = self._fetch_page(url, params, 1)
+        yield from items
+
+        if total is None:
+            page = 2
+            while items:
+                items, _ = self._fetch_page(url, params, page)
+                yield from items
+                page += 1
+            return
+
+        if total <= 1:
+            return
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(workers, total - 1)))
+        try:
+            futures = [pool.submit(self._fetch_page, url, params, page) for page in range(2, total + 1)]
+            for future in futures:
+                yield from future.result()[0]
+        finally:
+            # Consumer stopped early or a page failed: drop queued fetches
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------
+    # REPORTING
+    # ------------------------------------------
+    def timing_report(self):
+        """
+        Returns pooling stats for this process. Handshake time saved is
+        estimated as reused requests × average measured handshake.
+        """
+        reused = max(0, STATS.requests - STATS.connections)
+        avg_handshake = STATS.handshake_seconds / STATS.connections if STATS.connections else 0.0
+        return {
+            'requests': STATS.requests,
+            'connections_opened': STATS.connections,
+            'connections_reused': reused,
+            'handshake_seconds': STATS.handshake_seconds,
+            'avg_handshake_ms': avg_handshake * 1000,
+            'handshake_seconds_saved': reused * avg_handshake,
+            'request_seconds': STATS.request_seconds,
+            'retries': STATS.retries,
+            'rate_limited': STATS.rate_limited,
+            'server_errors': STATS.server_errors,
+            'connection_errors': STATS.connection_errors,
+            'gave_up': STATS.gave_up,
+            'throttle_seconds': STATS.throttle_seconds,
+            'backoff_seconds': STATS.backoff_seconds,
+        }
+
+    def print_timing_report(self):
+        r = self.timing_report()
+        print("🔌 Connection Pool Report")
+        print(f"   Requests: {r['requests']} | Connections opened: {r['connections_opened']} "
+              f"| Reused: {r['connections_reused']}")
+        print(f"   Handshake: {r['handshake_seconds']:.3f}s total "
+              f"({r['avg_handshake_ms']:.1f}ms avg) | Saved by pooling: ~{r['handshake_seconds_saved']:.3f}s")
+        if r['retries'] or r['gave_up'] or r['throttle_seconds'] > 0.05:
+            print(f"   Retries: {r['retries']} (429: {r['rate_limited']}, 5xx: {r['server_errors']}, "
+                  f"conn: {r['connection_errors']}, gave up: {r['gave_up']}) "
+                  f"| Backoff: {r['backoff_seconds']:.2f}s | Throttled: {r['throttle_seconds']:.2f}s")
+
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def get_client(base_url, user=None, password=None, **kwargs):
+    """Returns the shared client for (base_url, user), creating it on first use."""
+    key = (base_url.rstrip('/'), user)
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = WPClient(base_url, user, password, **kwargs)
+        return _CLIENTS[key]